@@ -11,14 +11,18 @@ Security hardened:
 
 import logging
 import os
+import threading
 import time
 from dataclasses import dataclass
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Any
 
 import jwt
 import requests
+from requests.adapters import HTTPAdapter
+from cryptography.hazmat.primitives.asymmetric.rsa import RSAPrivateKey
+from cryptography.hazmat.primitives.serialization import load_pem_private_key
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +32,19 @@ GITHUB_API_VERSION = "2022-11-28"
 _RETRYABLE_STATUS_CODES = {429, 500, 502, 503, 504}
 _MAX_RETRY_ATTEMPTS = 3
 
+# Connection pool sizing for the shared api.github.com session
+_POOL_CONNECTIONS = 10
+_POOL_MAXSIZE = 20
+
+# A cached app JWT is reused until it has less than this many seconds left
+_JWT_REFRESH_MARGIN_S = 60
+
+# A cached installation token is reused until it has less than this left
+_TOKEN_REFRESH_MARGIN_S = 300
+
+# Page size for list endpoints (GitHub's maximum)
+_PER_PAGE = 100
+
 
 @dataclass
 class GitHubAppConfig:
@@ -85,21 +102,66 @@ class GitHubAppAuth:
     def __init__(self, config: GitHubAppConfig):
         self.config = config
         self._installation_tokens: dict[str, dict[str, Any]] = {}
+        # One lock per installation so concurrent callers share a single mint
+        self._token_locks: dict[str, threading.Lock] = {}
+        self._private_key: RSAPrivateKey | None = None
+        self._jwt_cache: tuple[str, int] | None = None
+        self._jwt_lock = threading.Lock()
         self.base_url = "https://api.github.com"
 
+        # One pooled session so the TCP+TLS handshake with api.github.com is
+        # paid once rather than per request. Retries stay in
+        # _request_with_retry so backoff behaviour is unchanged.
+        self._session = requests.Session()
+        self._session.mount(
+            "https://",
+            HTTPAdapter(pool_connections=_POOL_CONNECTIONS, pool_maxsize=_POOL_MAXSIZE),
+        )
+
+    @property
+    def session(self) -> requests.Session:
+        """Pooled HTTP session shared by all GitHub API calls"""
+        return self._session
+
+    def _get_private_key(self) -> RSAPrivateKey:
+        """Return the parsed RSA private key, loading the PEM on first use.
+
+        Parsing the PEM (ASN.1 decode plus RSA consistency checks) is far more
+        expensive than the signature itself, so the key object is cached.
+        """
+        if self._private_key is None:
+            self._private_key = load_pem_private_key(
+                self.config.private_key.encode("utf-8"), password=None
+            )
+        return self._private_key
+
     def _generate_jwt(self) -> str:
-        """Generate a JWT token for GitHub App authentication"""
-        # GitHub Apps use RS256 algorithm
-        now = int(time.time())
-
-        payload = {
-            "iat": now
-            - 60,  # Issued at time (60 seconds in the past to allow for clock drift)
-            "exp": now + (10 * 60),  # JWT expiration time (10 minutes from now)
-            "iss": self.config.app_id,  # GitHub App ID
-        }
+        """Generate a JWT token for GitHub App authentication
 
-        return jwt.encode(payload, self.config.private_key, algorithm="RS256")
+        The token is valid for 10 minutes, so the last one minted is reused
+        until it is within _JWT_REFRESH_MARGIN_S of expiry.
+        """
+        with self._jwt_lock:
+            if (
+                self._jwt_cache
+                and self._jwt_cache[1] - time.time() > _JWT_REFRESH_MARGIN_S
+            ):
+                return self._jwt_cache[0]
+
+            # GitHub Apps use RS256 algorithm
+            now = int(time.time())
+            exp = now + (10 * 60)  # JWT expiration time (10 minutes from now)
+
+            payload = {
+                "iat": now
+                - 60,  # Issued at time (60 seconds in the past to allow for clock drift)
+                "exp": exp,
+                "iss": self.config.app_id,  # GitHub App ID
+            }
+
+            token = jwt.encode(payload, self._get_private_key(), algorithm="RS256")
+            self._jwt_cache = (token, exp)
+            return token
 
     def _get_headers(self, use_jwt: bool = True) -> dict[str, str]:
         """Get headers for GitHub API requests"""
@@ -122,7 +184,7 @@ class GitHubAppAuth:
         _RETRYABLE_STATUS_CODES (429, 500, 502, 503, 504).  Network-level
         exceptions are translated into RuntimeError immediately.
         """
-        request_fn = getattr(requests, method)
+        request_fn = getattr(self._session, method)
         last_response: requests.Response | None = None
 
         for attempt in range(_MAX_RETRY_ATTEMPTS):
@@ -161,19 +223,30 @@ class GitHubAppAuth:
         if not install_id:
             raise ValueError("No installation ID provided")
 
-        # Check if we have a cached token that's still valid
-        if install_id in self._installation_tokens:
-            token_data = self._installation_tokens[install_id]
-            expires_at = datetime.fromisoformat(
-                token_data["expires_at"].replace("Z", "+00:00")
-            )
-
-            # If token expires in more than 5 minutes, reuse it
-            if expires_at > datetime.now(expires_at.tzinfo) + timedelta(minutes=5):
-                logger.debug(f"Using cached installation token for {install_id}")
-                return token_data["token"]
-
-        # Generate new installation token
+        token = self._get_cached_token(install_id)
+        if token:
+            return token
+
+        # dict.setdefault is atomic, so every thread gets the same lock
+        with self._token_locks.setdefault(install_id, threading.Lock()):
+            # Another thread may have minted the token while we waited
+            token = self._get_cached_token(install_id)
+            if token:
+                return token
+            return self._mint_installation_token(install_id)
+
+    def _get_cached_token(self, install_id: str) -> str | None:
+        """Return the cached installation token if it is not near expiry"""
+        # Expiry is stored as epoch seconds so the hit path is a single
+        # float comparison.
+        entry = self._installation_tokens.get(install_id)
+        if entry and entry["exp"] - time.time() > _TOKEN_REFRESH_MARGIN_S:
+            logger.debug(f"Using cached installation token for {install_id}")
+            return entry["token"]
+        return None
+
+    def _mint_installation_token(self, install_id: str) -> str:
+        """Request a new installation token from GitHub and cache it"""
         logger.info(f"Generating new installation token for {install_id}")
 
         url = f"{self.base_url}/app/installations/{install_id}/access_tokens"
@@ -191,8 +264,14 @@ class GitHubAppAuth:
 
         token_data = response.json()
 
-        # Cache the token
-        self._installation_tokens[install_id] = token_data
+        # Cache the token with its expiry parsed once
+        expires_at = datetime.fromisoformat(
+            token_data["expires_at"].replace("Z", "+00:00")
+        )
+        self._installation_tokens[install_id] = {
+            "token": token_data["token"],
+            "exp": expires_at.timestamp(),
+        }
 
         return token_data["token"]
 
@@ -232,9 +311,16 @@ class GitHubAppAuth:
 
         url = f"{self.base_url}/installation/repositories"
         all_repos = []
-
-        while url:
-            response = self._request_with_retry("get", url, headers=headers, timeout=30)
+        page = 1
+
+        while True:
+            response = self._request_with_retry(
+                "get",
+                url,
+                headers=headers,
+                params={"per_page": _PER_PAGE, "page": page},
+                timeout=30,
+            )
 
             if response.status_code != 200:
                 logger.error(f"Failed to get installation repos: {response.status_code}")
@@ -243,13 +329,16 @@ class GitHubAppAuth:
                 )
 
             data = response.json()
-            all_repos.extend(data.get("repositories", []))
-
-            # Check for pagination
-            links = response.links
-            url = links.get("next", {}).get("url")
+            repos = data.get("repositories", [])
+            all_repos.extend(repos)
 
-        return all_repos
+            # A short page is the last one; total_count also saves the extra
+            # empty request when the count is an exact multiple of the page size
+            if len(repos) < _PER_PAGE or len(all_repos) >= data.get(
+                "total_count", float("inf")
+            ):
+                return all_repos
+            page += 1
 
     def verify_webhook(self, payload: bytes, signature: str) -> bool:
         """Verify a GitHub webhook signature"""
@@ -257,16 +346,15 @@ class GitHubAppAuth:
             logger.error("No webhook secret configured, rejecting webhook")
             return False
 
-        import hashlib
         import hmac
 
-        expected_signature = (
-            "sha256="
-            + hmac.HMAC(
-                key=self.config.webhook_secret.encode(),
-                msg=payload,
-                digestmod=hashlib.sha256,
-            ).hexdigest()
-        )
+        prefix, sep, hex_digest = signature.partition("=")
+        if prefix != "sha256" or not sep:
+            return False
+        try:
+            received = bytes.fromhex(hex_digest)
+        except ValueError:
+            return False
 
-        return hmac.compare_digest(expected_signature, signature)
+        expected = hmac.digest(self.config.webhook_secret.encode(), payload, "sha256")
+        return hmac.compare_digest(expected, received)
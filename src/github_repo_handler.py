@@ -10,11 +10,15 @@ Security hardened:
 """
 
 import asyncio
+import contextlib
+import fnmatch
 import logging
 import os
 import re
 import shutil
+from collections import deque
 from datetime import datetime, timedelta
+from operator import itemgetter
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +26,82 @@ from github_app_auth import GitHubAppAuth
 
 logger = logging.getLogger(__name__)
 
+# GitHub owner and repository names: ASCII alphanumerics plus separators,
+# with at least one alphanumeric character
+_OWNER_RE = re.compile(r"[_-]*[A-Za-z0-9][A-Za-z0-9_-]*")
+_REPO_RE = re.compile(r"[_.-]*[A-Za-z0-9][A-Za-z0-9_.-]*")
+
+# Branch names and workspace names accepted for checkout / workspace creation
+_BRANCH_RE = re.compile(r"[A-Za-z0-9_./-]+")
+_WORKSPACE_NAME_RE = re.compile(r"[A-Za-z0-9_-]+")
+
+# Runs of characters not allowed in a workspace name (underscores included,
+# so each run collapses to a single "_")
+_WORKSPACE_NAME_UNSAFE_RUN_RE = re.compile(r"[^A-Za-z0-9-]+")
+
+# Credentials embedded in https:// remote URLs
+_URL_CREDENTIALS_RE = re.compile(r"https://[^@]+@")
+
+# Block headers of interest in a .tf file, matched in one pass over raw bytes
+_TF_BLOCK_RE = re.compile(
+    rb'^\s*(backend|variable|output|provider)\s+"([^"]*)"', re.MULTILINE
+)
+
+# Well-known files reported by get_terraform_config as has_<name> flags
+_COMMON_CONFIG_FILES = frozenset({"terraform.tfvars", ".terraform.lock.hcl", "README.md"})
+
+# Files Terraform writes in the working directory; always copied into a
+# workspace so writes never reach the shared repo checkout
+_TERRAFORM_OUTPUT_FILES = frozenset({
+    "tfplan", ".terraform.lock.hcl", "terraform.tfstate", "terraform.tfstate.backup",
+})
+
+
+def _link_or_copy(src: str, dst: str) -> str:
+    """copytree copy_function: hardlink regular config files, copy the rest.
+
+    Symlinks are copied (dereferenced) so no link from the repo stays live in
+    the workspace, and anything Terraform may write gets its own inode.
+    """
+    if (
+        os.path.islink(src)
+        or os.path.basename(src) in _TERRAFORM_OUTPUT_FILES
+        or f"{os.sep}.terraform{os.sep}" in src
+    ):
+        return shutil.copy2(src, dst)
+    os.link(src, dst, follow_symlinks=False)
+    return dst
+
+
+# Lines of git stdout/stderr kept per command; earlier output is discarded
+_GIT_OUTPUT_TAIL_LINES = 2000
+
+# Hard cap on the bytes kept per pipe, whatever the line lengths
+_GIT_OUTPUT_TAIL_BYTES = 1024 * 1024
+
+# Pipe read size; reading in chunks avoids StreamReader's per-line limit
+_GIT_READ_CHUNK = 64 * 1024
+
+
+async def _read_tail(stream: asyncio.StreamReader) -> bytes:
+    """Drain a subprocess pipe, keeping only its last lines"""
+    chunks: deque[bytes] = deque()
+    size = 0
+    while chunk := await stream.read(_GIT_READ_CHUNK):
+        chunks.append(chunk)
+        size += len(chunk)
+        while size - len(chunks[0]) >= _GIT_OUTPUT_TAIL_BYTES:
+            size -= len(chunks.popleft())
+    data = b"".join(chunks)[-_GIT_OUTPUT_TAIL_BYTES:]
+
+    # Cut just after the newline that starts the last N lines
+    cut = len(data) - 1 if data.endswith(b"\n") else len(data)
+    for _ in range(_GIT_OUTPUT_TAIL_LINES):
+        cut = data.rfind(b"\n", 0, cut)
+        if cut < 0:
+            return data
+    return data[cut + 1:]
+
 
 class GitHubRepoHandler:
     """Handles GitHub repository operations for Terraform configurations"""
@@ -31,13 +111,21 @@ class GitHubRepoHandler:
         self.workspace_root = Path(workspace_root)
         self.repos_dir = self.workspace_root / "github-repos"
         self.repos_dir.mkdir(parents=True, exist_ok=True)
+        # Minimal env for git — disable prompts and optional index locks,
+        # and keep the rest of the server environment (credentials) out
+        self._git_env = {
+            "HOME": os.environ.get("HOME", "/tmp"),
+            "PATH": os.environ.get("PATH", "/usr/bin:/bin"),
+            "GIT_TERMINAL_PROMPT": "0",
+            "GIT_OPTIONAL_LOCKS": "0",
+        }
 
     def _get_repo_path(self, owner: str, repo: str) -> Path:
         """Get the local path for a repository"""
         # Security: Validate owner and repo names
-        if not owner.replace("-", "").replace("_", "").isalnum():
+        if not _OWNER_RE.fullmatch(owner):
             raise ValueError(f"Invalid repository owner name: {owner}")
-        if not repo.replace("-", "").replace("_", "").replace(".", "").isalnum():
+        if not _REPO_RE.fullmatch(repo):
             raise ValueError(f"Invalid repository name: {repo}")
 
         return self.repos_dir / f"{owner}_{repo}"
@@ -52,18 +140,19 @@ class GitHubRepoHandler:
         Truncates to 128 chars.
         Falls back to 'workspace' if the result is empty.
         """
-        sanitized = re.sub(r'[^a-zA-Z0-9_\-]', '_', raw)
-        sanitized = re.sub(r'_+', '_', sanitized)
+        sanitized = _WORKSPACE_NAME_UNSAFE_RUN_RE.sub('_', raw)
         sanitized = sanitized.strip('_')
         sanitized = sanitized[:128]
         return sanitized or "workspace"
 
     def _sanitize_output(self, text: str) -> str:
         """Remove tokens and credentials from git command output"""
-        return re.sub(r'https://[^@]+@', 'https://***@', text)
+        return _URL_CREDENTIALS_RE.sub('https://***@', text)
 
     async def _run_git_command(self, cmd: list[str], cwd: Path) -> dict[str, Any]:
         """Run a git command asynchronously with security hardening"""
+        process = None
+        finished = False
         try:
             # Security: Use shell=False and command list
             process = await asyncio.create_subprocess_exec(
@@ -71,20 +160,21 @@ class GitHubRepoHandler:
                 cwd=str(cwd),
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
-                env={
-                    "HOME": os.environ.get("HOME", "/tmp"),
-                    "PATH": os.environ.get("PATH", "/usr/bin:/bin"),
-                    "GIT_TERMINAL_PROMPT": "0",
-                },  # Minimal env — disable git prompts, prevent credential leaks
+                env=self._git_env,
             )
 
             try:
-                stdout, stderr = await asyncio.wait_for(
-                    process.communicate(), timeout=120
+                # Drain both pipes concurrently so neither can fill up and block
+                stdout, stderr, _ = await asyncio.wait_for(
+                    asyncio.gather(
+                        _read_tail(process.stdout),
+                        _read_tail(process.stderr),
+                        process.wait(),
+                    ),
+                    timeout=120,
                 )
+                finished = True
             except asyncio.TimeoutError:
-                process.kill()
-                await process.wait()
                 logger.error("Git command timed out after 120 seconds")
                 return {
                     "success": False,
@@ -105,20 +195,36 @@ class GitHubRepoHandler:
             logger.error(f"Git command failed: {sanitized_error}")
             return {"success": False, "stdout": "", "stderr": sanitized_error, "returncode": -1}
 
+        finally:
+            # Timeout, read error or cancellation: never leave git running
+            if process is not None and not finished:
+                with contextlib.suppress(ProcessLookupError):
+                    process.kill()
+                await process.wait()
+
     def _validate_branch_name(self, branch: str) -> bool:
         """Validate branch name to prevent git flag injection"""
         if branch.startswith("-"):
             return False
-        if not re.match(r'^[a-zA-Z0-9_./-]+$', branch):
+        if not _BRANCH_RE.fullmatch(branch):
             return False
         if ".." in branch:
             return False
         return True
 
     async def clone_or_update_repo(
-        self, owner: str, repo: str, branch: str | None = None, force: bool = False
+        self,
+        owner: str,
+        repo: str,
+        branch: str | None = None,
+        force: bool = False,
+        shallow: bool = True,
     ) -> dict[str, Any]:
-        """Clone a repository or update it if it already exists"""
+        """Clone a repository or update it if it already exists.
+
+        New clones are blobless and single-branch; ``shallow`` additionally
+        limits history to the tip commit.
+        """
         if branch and not self._validate_branch_name(branch):
             return {"error": f"Invalid branch name: {branch}"}
 
@@ -132,10 +238,12 @@ class GitHubRepoHandler:
             # Repository exists, update it
             logger.info(f"Updating existing repository: {owner}/{repo}")
 
-            # Fetch latest changes
-            result = await self._run_git_command(
-                ["git", "fetch", "--all", "--prune"], repo_path
-            )
+            # Fetch latest changes; name the branch's remote-tracking ref
+            # explicitly, since single-branch clones don't track it otherwise
+            fetch_cmd = ["git", "fetch", "--filter=blob:none", "--prune", "origin"]
+            if branch:
+                fetch_cmd.append(f"+refs/heads/{branch}:refs/remotes/origin/{branch}")
+            result = await self._run_git_command(fetch_cmd, repo_path)
 
             if not result["success"]:
                 return {
@@ -156,8 +264,16 @@ class GitHubRepoHandler:
                     )
 
                 if result["success"]:
-                    # Pull latest changes
-                    await self._run_git_command(["git", "pull", "--ff-only"], repo_path)
+                    # Fast-forward to the ref fetched above; a plain pull would
+                    # only fetch the clone's configured (default) branch
+                    result = await self._run_git_command(
+                        ["git", "merge", "--ff-only", f"origin/{branch}"], repo_path
+                    )
+                    if not result["success"]:
+                        return {
+                            "error": f"Failed to update branch {branch}: {result['stderr']}",
+                            "path": str(repo_path),
+                        }
 
             return {
                 "success": True,
@@ -174,7 +290,9 @@ class GitHubRepoHandler:
 
             logger.info(f"Cloning repository: {owner}/{repo}")
 
-            cmd = ["git", "clone"]
+            cmd = ["git", "clone", "--filter=blob:none", "--single-branch"]
+            if shallow:
+                cmd.append("--depth=1")
             if branch:
                 cmd.extend(["-b", branch])
             cmd.extend([clone_url, str(repo_path)])
@@ -224,31 +342,62 @@ class GitHubRepoHandler:
         if not search_path.exists():
             return {"error": f"Path not found in repository: {path}"}
 
-        # Find all matching files
-        tf_files = []
-        for file_path in search_path.rglob(pattern):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(repo_path)
-                tf_files.append(
-                    {
-                        "path": str(relative_path),
-                        "name": file_path.name,
-                        "size": file_path.stat().st_size,
-                        "modified": datetime.fromtimestamp(
-                            file_path.stat().st_mtime
-                        ).isoformat(),
-                    }
-                )
+        # Walk the tree off the event loop
+        tf_files = await asyncio.to_thread(
+            self._find_matching_files, search_path, repo_path, pattern
+        )
 
         return {
             "success": True,
             "repository": f"{owner}/{repo}",
             "search_path": path or "/",
             "pattern": pattern,
-            "files": sorted(tf_files, key=lambda x: x["path"]),
+            "files": sorted(tf_files, key=itemgetter("path")),
             "count": len(tf_files),
         }
 
+    @staticmethod
+    def _find_matching_files(
+        search_path: Path, repo_path: Path, pattern: str
+    ) -> list[dict[str, Any]]:
+        """Recursively collect files under search_path whose name matches pattern.
+
+        Uses an os.scandir stack so each match costs a single stat call.
+        Symlinked directories are not descended into, matching Path.rglob.
+        """
+        matches = []
+        stack = [str(search_path)]
+        while stack:
+            try:
+                with os.scandir(stack.pop()) as it:
+                    for entry in it:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif fnmatch.fnmatchcase(entry.name, pattern) and entry.is_file():
+                            st = entry.stat()
+                            matches.append(
+                                {
+                                    "path": os.path.relpath(entry.path, repo_path),
+                                    "name": entry.name,
+                                    "size": st.st_size,
+                                    "modified": datetime.fromtimestamp(
+                                        st.st_mtime
+                                    ).isoformat(),
+                                }
+                            )
+            except OSError as e:
+                logger.debug(f"Skipping unreadable directory during file scan: {e}")
+        return matches
+
+    @staticmethod
+    def _read_tf_file(tf_file: Path) -> bytes | None:
+        """Read a .tf file's raw bytes, or None if it cannot be read"""
+        try:
+            return tf_file.read_bytes()
+        except OSError as e:
+            logger.warning(f"Cannot read {tf_file}: {e}")
+            return None
+
     async def get_terraform_config(
         self, owner: str, repo: str, config_path: str
     ) -> dict[str, Any]:
@@ -281,40 +430,48 @@ class GitHubRepoHandler:
             "providers": [],
         }
 
-        # List all .tf files
-        for tf_file in config_dir.glob("*.tf"):
-            if tf_file.is_file():
-                info["terraform_files"].append(tf_file.name)
-
-                # Quick content analysis
-                try:
-                    content = tf_file.read_text(encoding="utf-8")
-                except (OSError, UnicodeDecodeError) as e:
-                    logger.warning(f"Cannot read {tf_file}: {e}")
-                    continue
-                if "backend " in content:
+        # One directory pass finds both the .tf files and the common files
+        tf_paths = []
+        present = []
+        if config_dir.is_dir():
+            with os.scandir(config_dir) as it:
+                for entry in it:
+                    if entry.name.endswith(".tf") and entry.is_file():
+                        tf_paths.append(Path(entry.path))
+                    elif entry.name in _COMMON_CONFIG_FILES:
+                        present.append(entry.name)
+        info["terraform_files"] = [p.name for p in tf_paths]
+
+        # Read the .tf files concurrently so cold-cache reads overlap
+        # instead of queueing one after another
+        contents = await asyncio.gather(
+            *(asyncio.to_thread(self._read_tf_file, p) for p in tf_paths)
+        )
+
+        for content in contents:
+            if content is None:
+                continue
+            # Quick content analysis — one regex pass over the raw bytes
+            for match in _TF_BLOCK_RE.finditer(content):
+                kind = match.group(1)
+                if kind == b"backend":
                     info["has_backend"] = True
-                if "variable " in content:
+                elif kind == b"variable":
                     info["has_variables"] = True
-                if "output " in content:
+                elif kind == b"output":
                     info["has_outputs"] = True
-                if "provider " in content and tf_file.name not in info["providers"]:
-                    # Extract provider names (simple regex would be better but keeping it simple)
-                    for line in content.split("\n"):
-                        if 'provider "' in line:
-                            provider = line.split('"')[1]
-                            if provider not in info["providers"]:
-                                info["providers"].append(provider)
+                else:
+                    provider = match.group(2).decode("utf-8", errors="replace")
+                    if provider not in info["providers"]:
+                        info["providers"].append(provider)
 
         # Check for modules
         modules_dir = config_dir / "modules"
         if modules_dir.exists():
             info["modules"] = [d.name for d in modules_dir.iterdir() if d.is_dir()]
 
-        # Check for common files
-        for file_name in ["terraform.tfvars", ".terraform.lock.hcl", "README.md"]:
-            if (config_dir / file_name).exists():
-                info[f'has_{file_name.replace(".", "_")}'] = True
+        for file_name in present:
+            info[f'has_{file_name.replace(".", "_")}'] = True
 
         return {"success": True, **info}
 
@@ -332,7 +489,8 @@ class GitHubRepoHandler:
         if "error" in clone_result:
             return clone_result
 
-        repo_path = self._get_repo_path(owner, repo)
+        # clone_or_update_repo already validated and resolved the checkout path
+        repo_path = Path(clone_result["path"])
         source_path = repo_path / config_path if config_path else repo_path
 
         # Validate path stays within repo directory
@@ -348,7 +506,7 @@ class GitHubRepoHandler:
             workspace_name = self._sanitize_workspace_name(raw_name)
 
         # Security: validate workspace_name format before constructing the path
-        if not re.match(r'^[a-zA-Z0-9_\-]+$', workspace_name):
+        if not _WORKSPACE_NAME_RE.fullmatch(workspace_name):
             return {"error": f"Invalid workspace_name: {workspace_name!r}. "
                              f"Only alphanumeric characters, hyphens, and underscores are allowed."}
 
@@ -364,7 +522,14 @@ class GitHubRepoHandler:
             if workspace_path.exists():
                 shutil.rmtree(workspace_path)
 
-            shutil.copytree(source_path, workspace_path)
+            try:
+                # Hardlink config files instead of copying bytes
+                shutil.copytree(source_path, workspace_path, copy_function=_link_or_copy)
+            except OSError as e:
+                # Cross-device or link-restricted filesystems: plain copy
+                logger.debug(f"Hardlinking into {workspace_path} failed, copying: {e}")
+                shutil.rmtree(workspace_path, ignore_errors=True)
+                shutil.copytree(source_path, workspace_path)
         except OSError as e:
             logger.error(f"Failed to prepare workspace {workspace_path}: {e}")
             return {"error": f"Failed to prepare workspace: {e}"}
@@ -386,11 +551,15 @@ class GitHubRepoHandler:
 
         import requests
 
-        headers = self.auth.get_authenticated_headers()
         url = f"https://api.github.com/repos/{owner}/{repo}"
 
         try:
-            response = requests.get(url, headers=headers, timeout=30)
+            # requests is blocking — run it in a worker thread so the event
+            # loop keeps serving other tools while GitHub responds
+            headers = await asyncio.to_thread(self.auth.get_authenticated_headers)
+            response = await asyncio.to_thread(
+                self.auth.session.get, url, headers=headers, timeout=30
+            )
 
             if response.status_code != 200:
                 logger.error(
@@ -469,19 +638,19 @@ class GitHubRepoHandler:
                 "message": "No repositories directory found",
             }
 
-        cutoff_time = datetime.now() - timedelta(days=days)
+        cutoff_ts = (datetime.now() - timedelta(days=days)).timestamp()
         cleaned = []
 
-        for repo_dir in self.repos_dir.iterdir():
-            if repo_dir.is_dir():
-                # Check last access time
-                stat = repo_dir.stat()
-                last_access = datetime.fromtimestamp(stat.st_atime)
+        with os.scandir(self.repos_dir) as it:
+            for entry in it:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
 
-                if last_access < cutoff_time:
-                    logger.info(f"Removing old repository: {repo_dir.name}")
-                    shutil.rmtree(repo_dir)
-                    cleaned.append(repo_dir.name)
+                # Check last access time
+                if entry.stat(follow_symlinks=False).st_atime < cutoff_ts:
+                    logger.info(f"Removing old repository: {entry.name}")
+                    shutil.rmtree(entry.path)
+                    cleaned.append(entry.name)
 
         return {
             "success": True,
@@ -10,6 +10,7 @@ Security hardened:
 - Action whitelisting
 """
 
+import functools
 import logging
 import os
 import re
@@ -20,35 +21,50 @@ logger = logging.getLogger(__name__)
 
 _WORKSPACE_ROOT: str = os.environ.get("TERRY_WORKSPACE_ROOT", "/mnt/workspace")
 
+# Terraform actions the terry tool may run, and actions rejected outright
+_ALLOWED_TERRAFORM_ACTIONS = frozenset(
+    {"init", "validate", "fmt", "plan", "show", "graph", "providers", "version"}
+)
+_BLOCKED_TERRAFORM_ACTIONS = frozenset(
+    {"apply", "destroy", "import", "taint", "untaint"}
+)
+
+# Validation patterns, compiled once at import
+_VALID_NAME_RE = re.compile(r"^[a-zA-Z0-9_-]+$")
+_REPO_NAME_RE = re.compile(r"^[a-zA-Z0-9_.-]+$")  # repo names may contain dots
+_DANGEROUS_CHARS_RE = re.compile(r'[$`\\"\';|&><(){}]')
+# Terraform variable names: letters/digits plus '_' and '-', at least one
+# letter or digit (same rule str.isalnum applies, Unicode included)
+_VAR_KEY_RE = re.compile(r"[_-]*[^\W_][\w-]*")
+
+# Sub-validator method for each tool-name prefix, checked in order
+_PREFIX_VALIDATORS = (
+    ("github_", "_validate_github_request"),
+    ("tf_cloud_", "_validate_tf_cloud_request"),
+    ("terry_", "_validate_terry_extended_request"),
+)
+# Bound on remembered tool-name routes; names come from untrusted clients
+_MAX_CACHED_ROUTES = 256
+
 
 class MCPRequestValidator:
     """Validates MCP protocol requests for security and compliance"""
 
     def __init__(self, workspace_root: str = _WORKSPACE_ROOT):
         self.workspace_root = Path(workspace_root)
+        # Resolved once; every path check compares against this prefix
+        self._workspace_real = os.path.realpath(workspace_root)
 
-        # Define allowed actions for terry tool
-        self.allowed_terraform_actions = {
-            "init",
-            "validate",
-            "fmt",
-            "plan",
-            "show",
-            "graph",
-            "providers",
-            "version",
-        }
-        self.blocked_terraform_actions = {
-            "apply",
-            "destroy",
-            "import",
-            "taint",
-            "untaint",
-        }
+        # Define allowed actions for terry tool (shared, immutable)
+        self.allowed_terraform_actions = _ALLOWED_TERRAFORM_ACTIONS
+        self.blocked_terraform_actions = _BLOCKED_TERRAFORM_ACTIONS
 
         # Define validation patterns
-        self.valid_name_pattern = re.compile(r"^[a-zA-Z0-9_-]+$")
-        self.dangerous_chars_pattern = re.compile(r'[$`\\"\';|&><(){}]')
+        self.valid_name_pattern = _VALID_NAME_RE
+        self.dangerous_chars_pattern = _DANGEROUS_CHARS_RE
+
+        # Tool name -> sub-validator method name (None: no extra validation)
+        self._routes: dict[str, str | None] = {}
 
     def validate_request(self, request: dict[str, Any]) -> tuple[bool, str]:
         """
@@ -75,22 +91,42 @@ class MCPRequestValidator:
             # Validate based on tool
             if tool_name == "terry":
                 return self._validate_terry_request(arguments)
-            elif tool_name.startswith("github_"):
-                return self._validate_github_request(tool_name, arguments)
-            elif tool_name.startswith("tf_cloud_"):
-                return self._validate_tf_cloud_request(tool_name, arguments)
-            elif tool_name.startswith("terry_"):
-                return self._validate_terry_extended_request(tool_name, arguments)
-            else:
+
+            route = self._route_for(tool_name)
+            if route is None:
                 # Unknown tools are allowed (handled by MCP framework)
                 return True, ""
+            return getattr(self, route)(tool_name, arguments)
 
         except Exception as e:
             logger.error(f"Validation error: {e}")
             return False, f"Validation error: {str(e)}"
 
+    def _route_for(self, tool_name: str) -> str | None:
+        """Resolve the sub-validator for a tool name, remembering the result"""
+        try:
+            return self._routes[tool_name]
+        except KeyError:
+            pass
+
+        route = None
+        for prefix, method_name in _PREFIX_VALIDATORS:
+            if tool_name.startswith(prefix):
+                route = method_name
+                break
+
+        if len(self._routes) < _MAX_CACHED_ROUTES:
+            self._routes[tool_name] = route
+        return route
+
     def _validate_terry_request(self, arguments: dict[str, Any]) -> tuple[bool, str]:
         """Validate terry tool request"""
+        # Check blocked flags first: cheap, and no reason to resolve the path
+        if arguments.get("auto_approve", False):
+            return False, "auto_approve is blocked for security reasons"
+        if arguments.get("destroy", False):
+            return False, "destroy is blocked for security reasons"
+
         # Validate path
         path = arguments.get("path", "")
         if not path:
@@ -121,12 +157,6 @@ class MCPRequestValidator:
             if not is_valid:
                 return False, error
 
-        # Check blocked flags
-        if arguments.get("auto_approve", False):
-            return False, "auto_approve is blocked for security reasons"
-        if arguments.get("destroy", False):
-            return False, "destroy is blocked for security reasons"
-
         return True, ""
 
     def _validate_github_request(
@@ -140,10 +170,8 @@ class MCPRequestValidator:
         if owner and not self.valid_name_pattern.match(owner):
             return False, f"Invalid repository owner name: {owner}"
 
-        if repo:
-            # Allow dots in repo names
-            if not re.match(r"^[a-zA-Z0-9_.-]+$", repo):
-                return False, f"Invalid repository name: {repo}"
+        if repo and not _REPO_NAME_RE.match(repo):
+            return False, f"Invalid repository name: {repo}"
 
         # Validate other parameters based on tool
         return True, ""
@@ -184,12 +212,19 @@ class MCPRequestValidator:
 
     def _validate_terraform_vars(self, tf_vars: dict[str, Any]) -> tuple[bool, str]:
         """Validate Terraform variables for security"""
+        # Fast path: one regex pass over all values (NUL is not a dangerous
+        # character, so joining cannot create or hide a match)
+        keys_ok = all(
+            isinstance(key, str) and _VAR_KEY_RE.fullmatch(key) for key in tf_vars
+        )
+        joined_values = "\0".join(map(str, tf_vars.values()))
+        if keys_ok and not self.dangerous_chars_pattern.search(joined_values):
+            return True, ""
+
+        # Something is wrong: walk the items to report the first offender
         for key, value in tf_vars.items():
             # Validate key format
-            if (
-                not isinstance(key, str)
-                or not key.replace("_", "").replace("-", "").isalnum()
-            ):
+            if not isinstance(key, str) or not _VAR_KEY_RE.fullmatch(key):
                 return False, f"Invalid variable name: {key}"
 
             # Check for dangerous characters in value
@@ -206,21 +241,16 @@ class MCPRequestValidator:
             return True
 
         try:
-            # Convert to Path object
-            if path.startswith("/"):
-                target_path = Path(path)
-            else:
-                target_path = self.workspace_root / path
-
-            # Resolve to real path
-            real_path = target_path.resolve()
-
-            # Ensure path is within workspace
-            real_path.relative_to(self.workspace_root.resolve())
-            return True
-        except ValueError:
+            # Resolve to real path (absolute paths are taken as-is)
+            real_path = os.path.realpath(os.path.join(self._workspace_real, path))
+        except ValueError:  # e.g. embedded null byte
             return False
 
+        # Ensure path is within workspace
+        return real_path == self._workspace_real or real_path.startswith(
+            self._workspace_real.rstrip(os.sep) + os.sep
+        )
+
 
 def validate_mcp_request(
     request: dict[str, Any], workspace_root: str = _WORKSPACE_ROOT
@@ -229,5 +259,10 @@ def validate_mcp_request(
     Convenience function to validate MCP requests.
     Returns (is_valid, error_message)
     """
-    validator = MCPRequestValidator(workspace_root)
-    return validator.validate_request(request)
+    return _get_validator(workspace_root).validate_request(request)
+
+
+@functools.lru_cache(maxsize=8)
+def _get_validator(workspace_root: str) -> MCPRequestValidator:
+    """Return a shared validator for workspace_root (validators are stateless)"""
+    return MCPRequestValidator(workspace_root)
@@ -6,14 +6,20 @@ from _version import __version__
 import asyncio
 import functools
 import importlib
+import inspect
 import ipaddress
 import json
 import logging
 import os
+import platform
 import re
+import shutil
+import socket
+import stat
 import subprocess
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict, defaultdict, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timezone
 from contextlib import asynccontextmanager
 from pathlib import Path
@@ -31,6 +37,20 @@ WORKSPACE_ROOT = os.environ.get("TERRY_WORKSPACE_ROOT", "/mnt/workspace")
 # Configurable terraform-ls binary path — override with TERRY_TERRAFORM_LS_PATH env var
 TERRAFORM_LS_BIN = os.environ.get("TERRY_TERRAFORM_LS_PATH", "terraform-ls")
 
+# Worker threads shared by all sync tool bodies (terraform runs, workspace
+# scans). Bounds concurrent subprocesses and disk walks under burst load;
+# extra calls queue. Override with TERRY_MAX_TOOL_WORKERS env var
+try:
+    _RAW_TOOL_WORKERS = os.environ.get("TERRY_MAX_TOOL_WORKERS", "8")
+    _MAX_TOOL_WORKERS: int = max(1, int(_RAW_TOOL_WORKERS))
+except ValueError:
+    raise RuntimeError(
+        f"Invalid TERRY_MAX_TOOL_WORKERS={_RAW_TOOL_WORKERS!r}: must be a positive integer"
+    )
+_TOOL_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_MAX_TOOL_WORKERS, thread_name_prefix="terry-tool"
+)
+
 # ---------------------------------------------------------------------------
 # IP whitelisting — TERRY_ALLOWED_HOSTS
 # ---------------------------------------------------------------------------
@@ -73,22 +93,147 @@ def _check_allowed_ip(client_ip: str | None) -> tuple[bool, str | None]:
     return False, f"Access denied: {client_ip} not in allowed networks"
 
 
-# Pre-compiled regex patterns for Terraform file analysis
-_RE_PROVIDER = re.compile(r'provider\s+"([^"]+)"')
-_RE_MODULE = re.compile(r'module\s+"[^"]+"')
-_RE_RESOURCE = re.compile(r'resource\s+"[^"]+"\s+"[^"]+"')
-_RE_DATA_SOURCE = re.compile(r'data\s+"[^"]+"\s+"[^"]+"')
-_RE_VARIABLE = re.compile(r'variable\s+"[^"]+"')
-_RE_OUTPUT = re.compile(r'output\s+"[^"]+"')
-_RE_VARIABLE_BLOCK = re.compile(r'variable\s+"([^"]+)"\s*{([^}]+)}', re.DOTALL)
-_RE_HARDCODED_AMI = re.compile(r'ami-[a-f0-9]{8,}')
-_RE_HARDCODED_INSTANCE = re.compile(r'i-[a-f0-9]{8,}')
-_RE_HARDCODED_VPC = re.compile(r'vpc-[a-f0-9]{8,}')
-_RE_HARDCODED_SUBNET = re.compile(r'subnet-[a-f0-9]{8,}')
+# Pre-compiled regex patterns for Terraform file analysis.  These are all
+# bytes patterns: the analysis tools scan raw file bytes without decoding.
+# _RE_ANALYZE finds every counted block header in one pass; the outer group
+# names match the keys of terry_analyze's "statistics" dict.  A variable's
+# body is captured in a lookahead, so the match itself ends at the header
+# and block headers inside or after the body are still counted.
+_RE_ANALYZE = re.compile(
+    rb'(?P<resources>resource\s+"[^"]+"\s+"[^"]+")'
+    rb'|(?P<data_sources>data\s+"[^"]+"\s+"[^"]+")'
+    rb'|(?P<modules>module\s+"[^"]+")'
+    rb'|(?P<providers>provider\s+"(?P<provider_name>[^"]+)")'
+    rb'|(?P<variables>variable\s+"(?P<var_name>[^"]+)"(?:(?=\s*{(?P<var_body>[^}]+)}))?)'
+    rb'|(?P<outputs>output\s+"[^"]+")',
+    re.DOTALL,
+)
+_RE_PROVIDER_B = re.compile(rb'provider\s+"([^"]+)"')
+_RE_MODULE_B = re.compile(rb'module\s+"[^"]+"')
+_RE_HARDCODED_AMI = re.compile(rb'ami-[a-f0-9]{8,}')
+_RE_HARDCODED_INSTANCE = re.compile(rb'i-[a-f0-9]{8,}')
+_RE_HARDCODED_VPC = re.compile(rb'vpc-[a-f0-9]{8,}')
+_RE_HARDCODED_SUBNET = re.compile(rb'subnet-[a-f0-9]{8,}')
+
+# terry_analyze: resource types that should carry tags, with their block patterns
+_TAGGABLE_RESOURCE_PATTERNS = tuple(
+    (
+        resource_type,
+        re.compile(
+            rf'resource\s+"{re.escape(resource_type)}"\s+"[^"]+"\s*{{([^}}]+)}}'.encode(),
+            re.DOTALL,
+        ),
+    )
+    for resource_type in ('aws_instance', 'aws_s3_bucket', 'aws_vpc', 'aws_security_group')
+)
+
+# terry_security_scan / terry_recommendations patterns
+_RE_S3_BUCKET_BLOCK = re.compile(rb'resource\s+"aws_s3_bucket"\s+"([^"]+)"\s*{([^}]+)}', re.DOTALL)
+_RE_PUBLIC_ACL = re.compile(rb'acl\s*=\s*"public')
+_RE_SECURITY_GROUP_BLOCK = re.compile(rb'resource\s+"aws_security_group"\s+"([^"]+)"\s*{([^}]+)}', re.DOTALL)
+_RE_OPEN_CIDR = re.compile(rb'cidr_blocks\s*=\s*\[\s*"0\.0\.0\.0/0"')
+_RE_DB_INSTANCE_BLOCK = re.compile(rb'resource\s+"aws_db_instance"\s+"([^"]+)"\s*{([^}]+)}', re.DOTALL)
+_RE_STORAGE_UNENCRYPTED = re.compile(rb'storage_encrypted\s*=\s*false')
+_RE_IAM_POLICY_DOC_BLOCK = re.compile(rb'data\s+"aws_iam_policy_document"[^{]+{([^}]+)}', re.DOTALL)
+_RE_WILDCARD_ACTIONS = re.compile(rb'actions\s*=\s*\[\s*"\*"')
+_RE_WILDCARD_RESOURCES = re.compile(rb'resources\s*=\s*\[\s*"\*"')
+_RE_INSTANCE_TYPE_VAR = re.compile(rb'instance_type\s*=\s*var')
+
+# terry_security_scan: severity of each rule, so filtered-out rules are never run
+_SECURITY_RULE_SEVERITY = {
+    "CKV_AWS_20": "high",    # S3 bucket with public ACL
+    "CKV_AWS_19": "medium",  # S3 bucket without server-side encryption
+    "CKV_AWS_24": "high",    # security group open to 0.0.0.0/0
+    "CKV_AWS_16": "high",    # unencrypted RDS instance
+    "CKV_AWS_1": "medium",   # IAM policy document with wildcards
+}
+
+# terry_recommendations: sort order for the "impact" field
+_IMPACT_RANK = {"high": 3, "medium": 2, "low": 1}
+
+# terry_workspace_setup: allowed project_name characters (blocks HCL injection)
+_RE_PROJECT_NAME = re.compile(r'^[a-zA-Z0-9_-]+$')
+
+# terry_workspace_setup starter files, filled in with str.format(project_name=...)
+_MAIN_TF_TMPL = """# {project_name} - Main Configuration
+terraform {{
+  required_version = ">= 1.0"
+  required_providers {{
+    # Add your required providers here
+    # Example:
+    # azurerm = {{
+    #   source  = "hashicorp/azurerm"
+    #   version = "~> 3.0"
+    # }}
+  }}
+}}
+
+# Configure providers here
+# provider "azurerm" {{
+#   features {{}}
+# }}
+
+# Add your resources here
+"""
+
+_VARIABLES_TF_TMPL = """# {project_name} - Variable Definitions
+
+variable "environment" {{
+  description = "Environment name"
+  type        = string
+  default     = "dev"
+}}
+
+variable "project_name" {{
+  description = "Name of the project"
+  type        = string
+  default     = "{project_name}"
+}}
+"""
+
+_OUTPUTS_TF_TMPL = """# {project_name} - Output Values
+
+# Example output
+# output "example_output" {{
+#   description = "Example output value"
+#   value       = "example"
+# }}
+"""
 
 # Maximum Terraform file size to process — files larger than this are skipped
 _MAX_TF_FILE_SIZE = 10 * 1024 * 1024  # 10 MB
 
+# Upper bound on threads used to read one directory's .tf files concurrently
+_MAX_TF_READ_WORKERS = 8
+
+# Directories whose .tf contents are kept for reuse by the analysis tools
+_TF_READ_CACHE_SIZE = 8
+
+# Total .tf bytes held by that cache; larger directories are read uncached
+_TF_READ_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# terry_analyze stops scanning further files once this many issues are found
+try:
+    _RAW_MAX_ANALYSIS_ISSUES = os.environ.get("TERRY_MAX_ANALYSIS_ISSUES", "500")
+    _MAX_ANALYSIS_ISSUES = max(1, int(_RAW_MAX_ANALYSIS_ISSUES))
+except ValueError:
+    raise RuntimeError(
+        f"Invalid TERRY_MAX_ANALYSIS_ISSUES={_RAW_MAX_ANALYSIS_ISSUES!r}: must be a positive integer"
+    )
+
+# Directories never descended into when listing workspaces
+_WORKSPACE_SKIP_DIRS = frozenset({"node_modules", "__pycache__"})
+
+# Conventional Terraform file names reported by terry_workspace_info
+_WORKSPACE_COMMON_FILES = (
+    "main.tf",
+    "variables.tf",
+    "outputs.tf",
+    "providers.tf",
+    "terraform.tf",
+    "versions.tf",
+)
+
 # Configure logging with structured JSON output
 class _JsonFormatter(logging.Formatter):
     def format(self, record):
@@ -134,6 +279,9 @@ async def app_lifespan(server: FastMCP):
             logger.info("LSP client shut down successfully")
     except Exception as e:
         logger.warning(f"LSP client shutdown error (non-fatal): {e}")
+    # Drop queued tool work (e.g. terraform runs) so it cannot block exit
+    for pool in (_TOOL_EXECUTOR, _TF_READ_EXECUTOR, _PROBE_EXECUTOR):
+        pool.shutdown(wait=False, cancel_futures=True)
 
 
 # Initialize the MCP server
@@ -314,10 +462,18 @@ class AuthManager:
 auth_manager = AuthManager()
 logger.info("Authentication manager initialized")
 
+# Tool arguments that name filesystem locations and must stay in the workspace
+_PATH_KWARGS = ("path", "file_path", "workspace_path", "config_path")
+
+
 # Security validation decorator
-def _pre_validate(tool_name: str, kwargs: dict) -> tuple[bool, dict]:
+def _pre_validate(
+    tool_name: str, kwargs: dict, path_keys: tuple[str, ...] = _PATH_KWARGS
+) -> tuple[bool, dict]:
     """Shared pre-execution validation: auth, rate limiting, request validation, path checks.
 
+    ``path_keys`` limits the path checks to the arguments a tool can take.
+
     Returns (ok, info) where info contains either error details or
     validated context (user_id, role, rate_info).
     """
@@ -347,7 +503,7 @@ def _pre_validate(tool_name: str, kwargs: dict) -> tuple[bool, dict]:
             logger.warning(f"Request validation failed for {tool_name}: {error_msg}")
             return False, {"error": f"Validation failed: {error_msg}"}
 
-    for path_key in ("path", "file_path", "workspace_path", "config_path"):
+    for path_key in path_keys:
         if path_key in kwargs and not validate_safe_path(str(kwargs[path_key])):
             logger.warning(f"Path traversal attempt blocked: tool={tool_name}, key={path_key}")
             return False, {"error": f"Invalid {path_key}: Access outside workspace is not allowed"}
@@ -366,30 +522,30 @@ def _post_process(result: Any, info: dict) -> Any:
 def validate_request(tool_name: str):
     """Decorator to validate MCP requests before tool execution"""
     def decorator(func):
-        if asyncio.iscoroutinefunction(func):
-            @functools.wraps(func)
-            async def async_wrapper(**kwargs):
-                ok, info = _pre_validate(tool_name, kwargs)
-                if not ok:
-                    return info
-                tool_kwargs = {k: v for k, v in kwargs.items() if k != "api_key"}
-                try:
-                    result = await func(**tool_kwargs)
-                    logger.info(f"Tool {tool_name} completed successfully for user {info['user_id']}")
-                    return _post_process(result, info)
-                except Exception as e:
-                    logger.error(f"Tool {tool_name} execution failed: {e}", exc_info=True)
-                    return {"error": f"Tool '{tool_name}' execution failed. Check server logs for details."}
-            return async_wrapper
+        is_coroutine = asyncio.iscoroutinefunction(func)
+        # Resolved once per tool: only the path arguments it accepts are checked
+        params = inspect.signature(func).parameters
+        if any(p.kind is inspect.Parameter.VAR_KEYWORD for p in params.values()):
+            path_keys = _PATH_KWARGS
+        else:
+            path_keys = tuple(key for key in _PATH_KWARGS if key in params)
 
         @functools.wraps(func)
-        def wrapper(**kwargs):
-            ok, info = _pre_validate(tool_name, kwargs)
+        async def wrapper(**kwargs):
+            ok, info = _pre_validate(tool_name, kwargs, path_keys)
             if not ok:
                 return info
             tool_kwargs = {k: v for k, v in kwargs.items() if k != "api_key"}
             try:
-                result = func(**tool_kwargs)
+                if is_coroutine:
+                    result = await func(**tool_kwargs)
+                else:
+                    # Sync tool bodies shell out to terraform and walk the
+                    # workspace; run them on the bounded tool pool so they
+                    # don't stall the event loop
+                    result = await asyncio.get_running_loop().run_in_executor(
+                        _TOOL_EXECUTOR, functools.partial(func, **tool_kwargs)
+                    )
                 logger.info(f"Tool {tool_name} completed successfully for user {info['user_id']}")
                 return _post_process(result, info)
             except Exception as e:
@@ -399,6 +555,12 @@ def validate_request(tool_name: str):
     return decorator
 
 
+@functools.lru_cache(maxsize=8)
+def _resolved_workspace_root(workspace_root: str) -> Path:
+    """Resolve a workspace root once; roots come from config, not clients."""
+    return Path(workspace_root).resolve()
+
+
 def validate_safe_path(path: str, workspace_root: str = WORKSPACE_ROOT) -> bool:
     """Validate that a path is safe and within workspace bounds"""
     try:
@@ -414,11 +576,12 @@ def validate_safe_path(path: str, workspace_root: str = WORKSPACE_ROOT) -> bool:
         else:
             target_path = workspace_base / path
         
-        # Resolve to real path
+        # Resolve to real path. Deliberately not cached per path: symlinks
+        # under the workspace (e.g. from a cloned repo) can change at any time.
         real_path = target_path.resolve()
         
         # Ensure path is within workspace
-        real_path.relative_to(workspace_base.resolve())
+        real_path.relative_to(_resolved_workspace_root(workspace_root))
         return True
     except ValueError:
         return False
@@ -436,15 +599,132 @@ def _resolve_lsp_paths(
     Returns:
         Tuple of (full_file_path, full_workspace_path) as absolute strings.
     """
+    return _join_lsp_paths(WORKSPACE_ROOT, file_path, workspace_path)
+
+
+@functools.lru_cache(maxsize=256)
+def _join_lsp_paths(
+    workspace_root: str, file_path: str, workspace_path: str | None
+) -> tuple[str, str]:
+    """Lexical path joins behind _resolve_lsp_paths, memoized because editors
+    repeat the same file; no filesystem access, so entries never go stale."""
     if workspace_path:
-        full_workspace_path = str(Path(WORKSPACE_ROOT) / workspace_path)
+        full_workspace_path = str(Path(workspace_root) / workspace_path)
         full_file_path = str(Path(full_workspace_path) / file_path)
     else:
-        full_file_path = str(Path(WORKSPACE_ROOT) / file_path)
+        full_file_path = str(Path(workspace_root) / file_path)
         full_workspace_path = str(Path(full_file_path).parent)
     return full_file_path, full_workspace_path
 
 
+def _resolved_file_uri(full_file_path: str) -> str | None:
+    """``file://`` URI of the file's real path, or None if it does not exist."""
+    try:
+        return Path(full_file_path).resolve(strict=True).as_uri()
+    except OSError:
+        return None
+
+
+async def _lsp_client_for_file(
+    full_file_path: str, full_workspace_path: str
+) -> "tuple[terraform_lsp_client.TerraformLSPClient, str] | None":
+    """Get the LSP client and resolved file URI for a tool's paths.
+
+    Returns None when the file does not exist, so the caller can report
+    that in its own response shape.  Client start-up failures propagate.
+    """
+    file_uri = await asyncio.to_thread(_resolved_file_uri, full_file_path)
+    if file_uri is None:
+        return None
+    client = await terraform_lsp_client.get_lsp_client(full_workspace_path)
+    return client, file_uri
+
+
+# In-flight LSP requests, keyed by (operation, resolved file URI[, position])
+_LSP_INFLIGHT: dict[tuple, asyncio.Future] = {}
+
+# Optional settle delay before a coalesced LSP request is sent, so calls
+# arriving within the window join it.  Off by default: it adds a fixed wait
+# to every isolated call; set TERRY_LSP_DEBOUNCE_MS for keystroke-driven
+# clients
+try:
+    _RAW_LSP_DEBOUNCE_MS = os.environ.get("TERRY_LSP_DEBOUNCE_MS", "0")
+    _LSP_DEBOUNCE_SECONDS = max(0, int(_RAW_LSP_DEBOUNCE_MS)) / 1000
+except ValueError:
+    raise RuntimeError(
+        f"Invalid TERRY_LSP_DEBOUNCE_MS={_RAW_LSP_DEBOUNCE_MS!r}: must be a non-negative integer"
+    )
+
+
+async def _coalesce_lsp(key: tuple, factory):
+    """Await ``factory()``, sharing one in-flight call among concurrent callers.
+
+    ``key`` should name the operation and the resolved file URI (plus the
+    position for hover/complete), so different spellings of one path share
+    a call.  A burst of identical LSP requests (e.g. validate fired per
+    keystroke) results in a single terraform-ls round trip; every caller
+    receives the same result.  With TERRY_LSP_DEBOUNCE_MS set, the call waits
+    that long first and callers arriving meanwhile join it.  The shared call
+    is shielded so that one caller being cancelled does not cancel it for
+    the others.
+    """
+    task = _LSP_INFLIGHT.get(key)
+    if task is None:
+        async def debounced():
+            if _LSP_DEBOUNCE_SECONDS:
+                await asyncio.sleep(_LSP_DEBOUNCE_SECONDS)
+            return await factory()
+
+        task = asyncio.ensure_future(debounced())
+        _LSP_INFLIGHT[key] = task
+        task.add_done_callback(lambda _: _LSP_INFLIGHT.pop(key, None))
+    return await asyncio.shield(task)
+
+
+# Seconds to reuse binary probe results (terraform/terraform-ls versions etc.)
+_PROBE_CACHE_TTL = 60
+
+# Shared pool for the diagnostic tools' overlapped probes, so concurrent
+# calls queue here instead of each starting its own threads
+_PROBE_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="terry-probe")
+
+
+def _ttl_cache(seconds: float):
+    """Memoize a function's non-None results for ``seconds``.
+
+    Returning None (or raising) leaves nothing cached, so failed probes are
+    retried on the next call. ``cache_clear()`` drops all entries.
+    """
+    def decorator(func):
+        cache: dict[tuple, tuple[float, Any]] = {}
+        lock = Lock()
+
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            with lock:
+                hit = cache.get(args)
+            if hit is not None and now - hit[0] < seconds:
+                return hit[1]
+            value = func(*args)
+            if value is not None:
+                with lock:
+                    cache[args] = (now, value)
+            return value
+
+        def cache_clear():
+            with lock:
+                cache.clear()
+
+        wrapper.cache_clear = cache_clear
+        return wrapper
+    return decorator
+
+
+# terry actions that modify the working directory and must not overlap others
+_TERRY_WRITE_ACTIONS = frozenset({"init", "plan"})
+
+
 # Load the existing Terraform tool logic (kebab-case filename requires importlib)
 terry_form = importlib.import_module("terry-form-mcp")
 
@@ -458,7 +738,7 @@ import terraform_lsp_client  # noqa: E402
 
 @mcp.tool()
 @validate_request("terry")
-def terry(
+async def terry(
     path: str, actions: list[str] = None, tf_vars: dict[str, Any] = None
 ) -> dict[str, object]:
     """
@@ -473,19 +753,42 @@ def terry(
         Execution results with detailed output matching API specification
 
     Supported actions: init, validate, fmt, plan, show, graph, providers, version
+
+    Actions run in the order given, except that a run of consecutive
+    read-only actions (validate, fmt, show, ...) is dispatched concurrently.
+    init and plan run alone, after everything before them has finished.
     """
     if actions is None:
         actions = ["plan"]
     if tf_vars is None:
         tf_vars = {}
     full_path = str(Path(WORKSPACE_ROOT) / path)
-    results = []
-    for action in actions:
-        results.append(
-            terry_form.run_terraform(
-                full_path, action, tf_vars if action == "plan" else None
-            )
+    loop = asyncio.get_running_loop()
+
+    def run(action: str):
+        # Shared tool pool: concurrent terraform subprocesses stay bounded
+        # by TERRY_MAX_TOOL_WORKERS across all in-flight calls
+        return loop.run_in_executor(
+            _TOOL_EXECUTOR,
+            terry_form.run_terraform,
+            full_path,
+            action,
+            tf_vars if action == "plan" else None,
         )
+
+    # init and plan write into the working directory (.terraform, the
+    # lock file, tfplan, the state lock), so each acts as a barrier
+    results = []
+    group: list[str] = []
+    for action in [*actions, None]:
+        if action is not None and action not in _TERRY_WRITE_ACTIONS:
+            group.append(action)
+            continue
+        if group:
+            results.extend(await asyncio.gather(*map(run, group)))
+        group = []
+        if action is not None:
+            results.append(await run(action))
     return {"terry-results": results}
 
 
@@ -505,19 +808,42 @@ def terry_workspace_list() -> dict[str, object]:
     workspaces = []
     
     try:
-        # Scan workspace directory for Terraform projects
-        for root, dirs, files in os.walk(workspace_root):
-            # Skip hidden directories and common non-terraform directories
-            dirs[:] = [d for d in dirs if not d.startswith('.') and d not in ['node_modules', '__pycache__']]
-            
+        # Scan workspace directory for Terraform projects. DirEntry caches the
+        # type (and stat) from readdir, so each entry is looked at only once.
+        stack = [str(workspace_root)]
+        while stack:
+            root = stack.pop()
+            subdirs = []
+            tf_entries = []
+            names = set()
+            try:
+                with os.scandir(root) as it:
+                    for entry in it:
+                        names.add(entry.name)
+                        if entry.is_dir():
+                            # Skip hidden directories, common non-terraform
+                            # directories and directory symlinks
+                            if (
+                                not entry.name.startswith('.')
+                                and entry.name not in _WORKSPACE_SKIP_DIRS
+                                and not entry.is_symlink()
+                            ):
+                                subdirs.append(entry.path)
+                        elif entry.name.endswith('.tf'):
+                            tf_entries.append(entry)
+            except OSError as e:
+                logger.debug(f"Failed to scan directory {root}: {e}")
+                continue
+            # Reversed so directories are visited in scandir order, top-down
+            stack.extend(reversed(subdirs))
+
             # Check if this directory contains Terraform files
-            tf_files = [f for f in files if f.endswith('.tf')]
-            if tf_files:
+            if tf_entries:
                 rel_path = os.path.relpath(root, workspace_root)
                 workspace_info = {
                     "path": rel_path,
-                    "initialized": os.path.exists(os.path.join(root, ".terraform")),
-                    "has_state": os.path.exists(os.path.join(root, "terraform.tfstate")),
+                    "initialized": ".terraform" in names,
+                    "has_state": "terraform.tfstate" in names,
                     "providers": [],
                     "modules": 0,
                     "last_modified": None
@@ -525,7 +851,7 @@ def terry_workspace_list() -> dict[str, object]:
                 
                 # Get last modified time
                 try:
-                    mtime = max(os.path.getmtime(os.path.join(root, f)) for f in tf_files)
+                    mtime = max(entry.stat().st_mtime for entry in tf_entries)
                     workspace_info["last_modified"] = datetime.fromtimestamp(
                         mtime, tz=timezone.utc
                     ).strftime("%Y-%m-%dT%H:%M:%SZ")
@@ -533,25 +859,29 @@ def terry_workspace_list() -> dict[str, object]:
                     logger.debug(f"Failed to get last modified time for workspace: {e}")
 
                 # Extract provider information
-                for tf_file in tf_files:
+                for entry in tf_entries:
                     try:
-                        tf_file_path = Path(os.path.join(root, tf_file))
-                        if tf_file_path.stat().st_size > _MAX_TF_FILE_SIZE:
+                        size = entry.stat().st_size
+                        if size > _MAX_TF_FILE_SIZE:
                             logger.warning(
-                                f"Skipping oversized file {tf_file_path} "
-                                f"({tf_file_path.stat().st_size} bytes)"
+                                f"Skipping oversized file {entry.path} "
+                                f"({size} bytes)"
                             )
                             continue
-                        with open(tf_file_path, 'r') as f:
+                        # Match on raw bytes; only provider names get decoded
+                        with open(entry.path, 'rb') as f:
                             content = f.read()
-                            # Simple provider extraction
-                            providers = _RE_PROVIDER.findall(content)
-                            workspace_info["providers"].extend(providers)
-                            # Count module calls
-                            modules = _RE_MODULE.findall(content)
-                            workspace_info["modules"] += len(modules)
+                        # Simple provider extraction
+                        workspace_info["providers"].extend(
+                            p.decode(errors="replace")
+                            for p in _RE_PROVIDER_B.findall(content)
+                        )
+                        # Count module calls
+                        workspace_info["modules"] += sum(
+                            1 for _ in _RE_MODULE_B.finditer(content)
+                        )
                     except Exception as e:
-                        logger.debug(f"Failed to read Terraform file {tf_file}: {e}")
+                        logger.debug(f"Failed to read Terraform file {entry.name}: {e}")
                 
                 workspace_info["providers"] = list(set(workspace_info["providers"]))
                 workspaces.append(workspace_info)
@@ -562,6 +892,56 @@ def terry_workspace_list() -> dict[str, object]:
         return {"error": f"Failed to list workspaces: {str(e)}"}
 
 
+@_ttl_cache(_PROBE_CACHE_TTL)
+def _terraform_version_info() -> dict[str, object] | None:
+    """Probe the Terraform version and platform; None when terraform fails."""
+    # Get Terraform version; json.loads takes the raw bytes, so skip decoding
+    version_result = subprocess.run(
+        ["terraform", "version", "-json"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        timeout=30
+    )
+    
+    if version_result.returncode == 0:
+        try:
+            version_data = json.loads(version_result.stdout)
+            result = {
+                "terraform_version": version_data.get("terraform_version", "unknown"),
+                "platform": version_data.get("platform", "unknown"),
+                "provider_selections": {}
+            }
+            
+            # Extract provider versions if available
+            if "provider_selections" in version_data:
+                result["provider_selections"] = version_data["provider_selections"]
+            
+            return result
+            
+        except json.JSONDecodeError:
+            # Fallback to non-JSON version
+            version_result = subprocess.run(
+                ["terraform", "version"],
+                capture_output=True,
+                text=True,
+                timeout=30
+            )
+            if version_result.returncode == 0:
+                lines = version_result.stdout.strip().split('\n')
+                terraform_version = lines[0].replace("Terraform v", "") if lines else "unknown"
+                
+                # Get platform info
+                machine = platform.machine()
+                
+                return {
+                    "terraform_version": terraform_version,
+                    "platform": f"linux_{machine}" if machine else "unknown",
+                    "provider_selections": {}
+                }
+    
+    return None
+
+
 @mcp.tool()
 @validate_request("terry_version")
 def terry_version() -> dict[str, object]:
@@ -570,57 +950,11 @@ def terry_version() -> dict[str, object]:
     Returns version details and available provider information.
     """
     try:
-        # Get Terraform version
-        version_result = subprocess.run(
-            ["terraform", "version", "-json"],
-            capture_output=True,
-            text=True,
-            timeout=30
-        )
-        
-        if version_result.returncode == 0:
-            try:
-                version_data = json.loads(version_result.stdout)
-                result = {
-                    "terraform_version": version_data.get("terraform_version", "unknown"),
-                    "platform": version_data.get("platform", "unknown"),
-                    "provider_selections": {}
-                }
-                
-                # Extract provider versions if available
-                if "provider_selections" in version_data:
-                    result["provider_selections"] = version_data["provider_selections"]
-                
-                return result
-                
-            except json.JSONDecodeError:
-                # Fallback to non-JSON version
-                version_result = subprocess.run(
-                    ["terraform", "version"],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                if version_result.returncode == 0:
-                    lines = version_result.stdout.strip().split('\n')
-                    terraform_version = lines[0].replace("Terraform v", "") if lines else "unknown"
-                    
-                    # Get platform info
-                    platform_result = subprocess.run(
-                        ["uname", "-m"],
-                        capture_output=True,
-                        text=True,
-                        timeout=10
-                    )
-                    platform = f"linux_{platform_result.stdout.strip()}" if platform_result.returncode == 0 else "unknown"
-                    
-                    return {
-                        "terraform_version": terraform_version,
-                        "platform": platform,
-                        "provider_selections": {}
-                    }
-        
-        return {"error": "Failed to get Terraform version"}
+        version_info = _terraform_version_info()
+        if version_info is None:
+            return {"error": "Failed to get Terraform version"}
+        # Copy: the cached dict must not pick up per-call result metadata
+        return dict(version_info)
         
     except FileNotFoundError:
         return {"error": "Terraform not found in PATH"}
@@ -628,14 +962,57 @@ def terry_version() -> dict[str, object]:
         return {"error": f"Failed to get version: {str(e)}"}
 
 
+def _probe_binary(binary: str, version_timeout: int) -> dict[str, Any]:
+    """Locate ``binary`` on PATH and report its ``version`` output."""
+    # shutil.which does the PATH lookup in-process, without forking `which`
+    binary_path = shutil.which(binary)
+    if binary_path is None:
+        return {"available": False, "error": f"{binary} not found"}
+    version_check = subprocess.run(
+        [binary, "version"],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+        timeout=version_timeout,
+    )
+    return {
+        "available": True,
+        "path": binary_path,
+        "version": (
+            version_check.stdout.strip()
+            if version_check.returncode == 0
+            else "version check failed"
+        ),
+    }
+
+
+@_ttl_cache(_PROBE_CACHE_TTL)
+def _environment_tool_probes() -> dict[str, Any]:
+    """Run the binary and hostname probes behind terry_environment_check."""
+    # The terraform and terraform-ls probes are independent; overlap them
+    terraform = _PROBE_EXECUTOR.submit(_probe_binary, "terraform", 30)
+    terraform_ls = _PROBE_EXECUTOR.submit(_probe_binary, "terraform-ls", 10)
+    return {
+        "terraform": terraform.result(),
+        "terraform_ls": terraform_ls.result(),
+        "hostname": socket.gethostname(),
+    }
+
+
 @mcp.tool()
 @validate_request("terry_environment_check")
-def terry_environment_check() -> dict[str, object]:
+def terry_environment_check(refresh: bool = False) -> dict[str, object]:
     """
     Comprehensive environment check for Terraform and LSP integration.
     Checks container environment, available tools, and configuration.
+
+    Args:
+        refresh: Re-run the binary probes instead of reusing results from
+            the last minute
     """
     results = {}
+    if refresh:
+        _environment_tool_probes.cache_clear()
 
     try:
         # Basic environment info
@@ -646,48 +1023,10 @@ def terry_environment_check() -> dict[str, object]:
             "workspace_mount": os.path.exists(WORKSPACE_ROOT),
         }
 
-        # Check Terraform
-        terraform_check = subprocess.run(
-            ["which", "terraform"], capture_output=True, text=True, timeout=10
-        )
-        if terraform_check.returncode == 0:
-            version_check = subprocess.run(
-                ["terraform", "version"], capture_output=True, text=True, timeout=30
-            )
-            results["terraform"] = {
-                "available": True,
-                "path": terraform_check.stdout.strip(),
-                "version": (
-                    version_check.stdout.strip()
-                    if version_check.returncode == 0
-                    else "version check failed"
-                ),
-            }
-        else:
-            results["terraform"] = {"available": False, "error": "terraform not found"}
-
-        # Check terraform-ls
-        terraformls_check = subprocess.run(
-            ["which", "terraform-ls"], capture_output=True, text=True, timeout=10
-        )
-        if terraformls_check.returncode == 0:
-            version_check = subprocess.run(
-                ["terraform-ls", "version"], capture_output=True, text=True, timeout=10
-            )
-            results["terraform_ls"] = {
-                "available": True,
-                "path": terraformls_check.stdout.strip(),
-                "version": (
-                    version_check.stdout.strip()
-                    if version_check.returncode == 0
-                    else "version check failed"
-                ),
-            }
-        else:
-            results["terraform_ls"] = {
-                "available": False,
-                "error": "terraform-ls not found",
-            }
+        # Binary probes are cached; copy so the cached dicts stay untouched
+        probes = _environment_tool_probes()
+        results["terraform"] = dict(probes["terraform"])
+        results["terraform_ls"] = dict(probes["terraform_ls"])
 
         # Check common paths
         common_paths = ["/usr/local/bin/terraform-ls", "/usr/bin/terraform-ls"]
@@ -698,9 +1037,7 @@ def terry_environment_check() -> dict[str, object]:
         # Container detection
         results["container"] = {
             "is_docker": os.path.exists("/.dockerenv"),
-            "hostname": subprocess.run(
-                ["hostname"], capture_output=True, text=True, timeout=10
-            ).stdout.strip(),
+            "hostname": probes["hostname"],
         }
 
         return {"terry-environment": results}
@@ -709,43 +1046,81 @@ def terry_environment_check() -> dict[str, object]:
         return {"terry-environment": {"error": str(e)}}
 
 
+@_ttl_cache(_PROBE_CACHE_TTL)
+def _lsp_binary_probe() -> dict[str, Any]:
+    """Run ``terraform-ls version`` for terry_lsp_debug."""
+    try:
+        version_result = subprocess.run(
+            ["terraform-ls", "version"], capture_output=True, text=True, timeout=10
+        )
+        return {
+            "available": version_result.returncode == 0,
+            "version": (
+                version_result.stdout.strip()
+                if version_result.returncode == 0
+                else None
+            ),
+            "error": (
+                version_result.stderr.strip()
+                if version_result.returncode != 0
+                else None
+            ),
+        }
+    except subprocess.TimeoutExpired:
+        return {"available": False, "error": "timeout"}
+    except FileNotFoundError:
+        return {"available": False, "error": "binary not found"}
+    except Exception as e:
+        return {"available": False, "error": str(e)}
+
+
+@_ttl_cache(_PROBE_CACHE_TTL)
+def _lsp_help_probe() -> dict[str, Any]:
+    """Run ``terraform-ls serve --help`` for terry_lsp_debug."""
+    try:
+        help_result = subprocess.run(
+            ["terraform-ls", "serve", "--help"],
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+        return {
+            "available": help_result.returncode == 0,
+            "output": (
+                help_result.stdout[:200] + "..."
+                if len(help_result.stdout) > 200
+                else help_result.stdout
+            ),
+        }
+    except Exception as e:
+        return {"error": str(e)}
+
+
 @mcp.tool()
 @validate_request("terry_lsp_debug")
-def terry_lsp_debug() -> dict[str, object]:
+def terry_lsp_debug(include_help: bool = False, refresh: bool = False) -> dict[str, object]:
     """
     Debug terraform-ls functionality and LSP client state.
     Tests terraform-ls availability and basic functionality.
+
+    Args:
+        include_help: Also run ``terraform-ls serve --help`` (an extra
+            subprocess); skipped by default
+        refresh: Re-run the terraform-ls probes instead of reusing results
+            from the last minute
     """
     results = {}
+    if refresh:
+        _lsp_binary_probe.cache_clear()
+        _lsp_help_probe.cache_clear()
 
     try:
-        # Test terraform-ls binary
-        try:
-            version_result = subprocess.run(
-                ["terraform-ls", "version"], capture_output=True, text=True, timeout=10
-            )
-            results["terraform_ls_binary"] = {
-                "available": version_result.returncode == 0,
-                "version": (
-                    version_result.stdout.strip()
-                    if version_result.returncode == 0
-                    else None
-                ),
-                "error": (
-                    version_result.stderr.strip()
-                    if version_result.returncode != 0
-                    else None
-                ),
-            }
-        except subprocess.TimeoutExpired:
-            results["terraform_ls_binary"] = {"available": False, "error": "timeout"}
-        except FileNotFoundError:
-            results["terraform_ls_binary"] = {
-                "available": False,
-                "error": "binary not found",
-            }
-        except Exception as e:
-            results["terraform_ls_binary"] = {"available": False, "error": str(e)}
+        # The binary and help probes are independent; overlap them
+        binary_probe = _PROBE_EXECUTOR.submit(_lsp_binary_probe)
+        help_probe = _PROBE_EXECUTOR.submit(_lsp_help_probe) if include_help else None
+
+        # Probe results are cached; copy so the cached dicts stay untouched
+        results["terraform_ls_binary"] = dict(binary_probe.result())
 
         # Test LSP client state
         if terraform_lsp_client._lsp_client:
@@ -760,23 +1135,10 @@ def terry_lsp_debug() -> dict[str, object]:
             results["lsp_client"] = {"exists": False}
 
         # Test LSP help command
-        try:
-            help_result = subprocess.run(
-                ["terraform-ls", "serve", "--help"],
-                capture_output=True,
-                text=True,
-                timeout=5,
-            )
-            results["terraform_ls_help"] = {
-                "available": help_result.returncode == 0,
-                "output": (
-                    help_result.stdout[:200] + "..."
-                    if len(help_result.stdout) > 200
-                    else help_result.stdout
-                ),
-            }
-        except Exception as e:
-            results["terraform_ls_help"] = {"error": str(e)}
+        if help_probe is not None:
+            results["terraform_ls_help"] = dict(help_probe.result())
+        else:
+            results["terraform_ls_help"] = {"skipped": True}
 
         return {"terry-lsp-debug": results}
 
@@ -799,51 +1161,45 @@ def terry_workspace_info(path: str = ".") -> dict[str, object]:
         if not os.path.exists(full_path):
             return {"terry-workspace": {"error": f"Path {full_path} does not exist"}}
 
+        is_directory = os.path.isdir(full_path)
+
         # Basic path info
         results["path_info"] = {
             "full_path": full_path,
             "relative_path": path,
             "exists": True,
-            "is_directory": os.path.isdir(full_path),
+            "is_directory": is_directory,
         }
 
+        # One directory read answers every file-presence check below
+        names = []
+        if is_directory:
+            with os.scandir(full_path) as it:
+                names = [entry.name for entry in it]
+        present = set(names)
+
         # Find Terraform files
-        tf_files = []
-        if os.path.isdir(full_path):
-            for item in os.listdir(full_path):
-                if item.endswith(".tf") or item.endswith(".tfvars"):
-                    tf_files.append(item)
+        tf_files = [item for item in names if item.endswith((".tf", ".tfvars"))]
 
         results["terraform_files"] = tf_files
 
         # Check for terraform initialization
-        terraform_dir = os.path.join(full_path, ".terraform")
+        initialized = ".terraform" in present
         results["terraform_state"] = {
-            "initialized": os.path.exists(terraform_dir),
-            "state_file_exists": os.path.exists(
-                os.path.join(full_path, "terraform.tfstate")
-            ),
+            "initialized": initialized,
+            "state_file_exists": "terraform.tfstate" in present,
         }
 
         # Check for common Terraform files
-        common_files = [
-            "main.tf",
-            "variables.tf",
-            "outputs.tf",
-            "providers.tf",
-            "terraform.tf",
-            "versions.tf",
-        ]
-        results["common_files"] = {}
-        for file in common_files:
-            file_path = os.path.join(full_path, file)
-            results["common_files"][file] = os.path.exists(file_path)
+        results["common_files"] = {
+            file: file in present for file in _WORKSPACE_COMMON_FILES
+        }
 
         # LSP readiness assessment
         results["lsp_readiness"] = {
             "has_terraform_files": len(tf_files) > 0,
-            "has_main_tf": "main.tf" in tf_files,
-            "is_initialized": os.path.exists(terraform_dir),
+            "has_main_tf": "main.tf" in present,
+            "is_initialized": initialized,
             "recommended_actions": [],
         }
 
@@ -851,7 +1207,7 @@ def terry_workspace_info(path: str = ".") -> dict[str, object]:
             results["lsp_readiness"]["recommended_actions"].append(
                 "Create Terraform files (.tf)"
             )
-        if not os.path.exists(terraform_dir):
+        if not initialized:
             results["lsp_readiness"]["recommended_actions"].append("Run terraform init")
 
         return {"terry-workspace": results}
@@ -920,33 +1276,46 @@ def terry_file_check(file_path: str) -> dict[str, object]:
     try:
         full_path = str(Path(WORKSPACE_ROOT) / file_path)
 
+        # One stat answers exists, is_file and size
+        try:
+            st = os.stat(full_path)
+        except OSError:
+            st = None
+        is_file = st is not None and stat.S_ISREG(st.st_mode)
+
         results = {
             "file_path": file_path,
             "full_path": full_path,
-            "exists": os.path.exists(full_path),
-            "is_file": (
-                os.path.isfile(full_path) if os.path.exists(full_path) else False
-            ),
+            "exists": st is not None,
+            "is_file": is_file,
             "readable": False,
-            "size": 0,
+            "size": st.st_size if is_file else 0,
             "syntax_check": {},
         }
 
-        if results["exists"] and results["is_file"]:
+        if is_file and st.st_size > _MAX_TF_FILE_SIZE:
+            logger.warning(f"Skipping oversized file {full_path} ({st.st_size} bytes)")
+            results["syntax_check"]["error"] = (
+                f"File exceeds {_MAX_TF_FILE_SIZE} byte limit"
+            )
+        elif is_file:
             try:
-                with open(full_path, "r") as f:
-                    content = f.read()
-                    results["readable"] = True
-                    results["size"] = len(content)
-
-                    # Basic syntax checks
-                    results["syntax_check"] = {
-                        "has_content": len(content.strip()) > 0,
-                        "has_terraform_block": "terraform {" in content,
-                        "has_resource_block": 'resource "' in content,
-                        "has_data_block": 'data "' in content,
-                        "line_count": len(content.split("\n")),
-                    }
+                # Raw bytes: the checks below are plain substring and newline
+                # counts, so there is no need to decode or split into lines.
+                # Bounded read in case the file grew since the stat
+                with open(full_path, "rb") as f:
+                    content = f.read(_MAX_TF_FILE_SIZE)
+                results["readable"] = True
+                results["size"] = len(content)
+
+                # Basic syntax checks
+                results["syntax_check"] = {
+                    "has_content": bool(content) and not content.isspace(),
+                    "has_terraform_block": b"terraform {" in content,
+                    "has_resource_block": b'resource "' in content,
+                    "has_data_block": b'data "' in content,
+                    "line_count": content.count(b"\n") + 1,
+                }
 
             except Exception as e:
                 results["syntax_check"]["error"] = str(e)
@@ -968,7 +1337,7 @@ def terry_workspace_setup(
     """
     try:
         # Sanitize project_name to prevent HCL injection
-        if not re.match(r'^[a-zA-Z0-9_-]+$', project_name):
+        if not _RE_PROJECT_NAME.match(project_name):
             return {"terry-workspace-setup": {"error": "Invalid project_name: only alphanumeric, hyphens, and underscores allowed"}}
 
         full_path = str(Path(WORKSPACE_ROOT) / path)
@@ -978,68 +1347,20 @@ def terry_workspace_setup(
 
         created_files = []
 
-        # Create main.tf if it doesn't exist
-        main_tf_path = os.path.join(full_path, "main.tf")
-        if not os.path.exists(main_tf_path):
-            main_tf_content = f"""# {project_name} - Main Configuration
-terraform {{
-  required_version = ">= 1.0"
-  required_providers {{
-    # Add your required providers here
-    # Example:
-    # azurerm = {{
-    #   source  = "hashicorp/azurerm"
-    #   version = "~> 3.0"
-    # }}
-  }}
-}}
-
-# Configure providers here
-# provider "azurerm" {{
-#   features {{}}
-# }}
-
-# Add your resources here
-"""
-            with open(main_tf_path, "w") as f:
-                f.write(main_tf_content)
-            created_files.append("main.tf")
-
-        # Create variables.tf if it doesn't exist
-        variables_tf_path = os.path.join(full_path, "variables.tf")
-        if not os.path.exists(variables_tf_path):
-            variables_tf_content = f"""# {project_name} - Variable Definitions
-
-variable "environment" {{
-  description = "Environment name"
-  type        = string
-  default     = "dev"
-}}
-
-variable "project_name" {{
-  description = "Name of the project"
-  type        = string
-  default     = "{project_name}"
-}}
-"""
-            with open(variables_tf_path, "w") as f:
-                f.write(variables_tf_content)
-            created_files.append("variables.tf")
-
-        # Create outputs.tf if it doesn't exist
-        outputs_tf_path = os.path.join(full_path, "outputs.tf")
-        if not os.path.exists(outputs_tf_path):
-            outputs_tf_content = f"""# {project_name} - Output Values
-
-# Example output
-# output "example_output" {{
-#   description = "Example output value"
-#   value       = "example"
-# }}
-"""
-            with open(outputs_tf_path, "w") as f:
-                f.write(outputs_tf_content)
-            created_files.append("outputs.tf")
+        # Starter files; existing files (or symlinks) are never overwritten.
+        # Exclusive create: the kernel does the existence check atomically,
+        # instead of a separate exists() probe before each write
+        for file_name, template in (
+            ("main.tf", _MAIN_TF_TMPL),
+            ("variables.tf", _VARIABLES_TF_TMPL),
+            ("outputs.tf", _OUTPUTS_TF_TMPL),
+        ):
+            try:
+                with open(os.path.join(full_path, file_name), "x") as f:
+                    f.write(template.format(project_name=project_name))
+            except FileExistsError:
+                continue
+            created_files.append(file_name)
 
         return {
             "terry-workspace-setup": {
@@ -1075,11 +1396,9 @@ async def terraform_validate_lsp(
         workspace_path: Optional workspace directory (defaults to parent directory of file)
     """
     try:
-        # Resolve full paths
         full_file_path, full_workspace_path = _resolve_lsp_paths(file_path, workspace_path)
-
-        # Check if file exists
-        if not os.path.exists(full_file_path):
+        resolved = await _lsp_client_for_file(full_file_path, full_workspace_path)
+        if resolved is None:
             return {
                 "terraform-ls-validation": {
                     "file_path": file_path,
@@ -1088,11 +1407,13 @@ async def terraform_validate_lsp(
                 }
             }
 
-        # Get LSP client
-        lsp_client = await terraform_lsp_client.get_lsp_client(full_workspace_path)
+        lsp_client, file_uri = resolved
 
         # Validate document
-        result = await lsp_client.validate_document(full_file_path)
+        result = await _coalesce_lsp(
+            ("validate", file_uri),
+            lambda: lsp_client.validate_document(full_file_path),
+        )
 
         return {
             "terraform-ls-validation": {
@@ -1122,11 +1443,9 @@ async def terraform_hover(
         workspace_path: Optional workspace directory
     """
     try:
-        # Resolve full paths
         full_file_path, full_workspace_path = _resolve_lsp_paths(file_path, workspace_path)
-
-        # Check if file exists
-        if not os.path.exists(full_file_path):
+        resolved = await _lsp_client_for_file(full_file_path, full_workspace_path)
+        if resolved is None:
             return {
                 "terraform-hover": {
                     "file_path": file_path,
@@ -1135,11 +1454,13 @@ async def terraform_hover(
                 }
             }
 
-        # Get LSP client
-        lsp_client = await terraform_lsp_client.get_lsp_client(full_workspace_path)
+        lsp_client, file_uri = resolved
 
         # Get hover info
-        result = await lsp_client.get_hover_info(full_file_path, line, character)
+        result = await _coalesce_lsp(
+            ("hover", file_uri, line, character),
+            lambda: lsp_client.get_hover_info(full_file_path, line, character),
+        )
 
         return {
             "terraform-hover": {
@@ -1175,11 +1496,9 @@ async def terraform_complete(
         workspace_path: Optional workspace directory
     """
     try:
-        # Resolve full paths
         full_file_path, full_workspace_path = _resolve_lsp_paths(file_path, workspace_path)
-
-        # Check if file exists
-        if not os.path.exists(full_file_path):
+        resolved = await _lsp_client_for_file(full_file_path, full_workspace_path)
+        if resolved is None:
             return {
                 "terraform-completions": {
                     "file_path": file_path,
@@ -1188,11 +1507,13 @@ async def terraform_complete(
                 }
             }
 
-        # Get LSP client
-        lsp_client = await terraform_lsp_client.get_lsp_client(full_workspace_path)
+        lsp_client, file_uri = resolved
 
         # Get completions
-        result = await lsp_client.get_completions(full_file_path, line, character)
+        result = await _coalesce_lsp(
+            ("complete", file_uri, line, character),
+            lambda: lsp_client.get_completions(full_file_path, line, character),
+        )
 
         return {
             "terraform-completions": {
@@ -1226,11 +1547,9 @@ async def terraform_format_lsp(
         workspace_path: Optional workspace directory
     """
     try:
-        # Resolve full paths
         full_file_path, full_workspace_path = _resolve_lsp_paths(file_path, workspace_path)
-
-        # Check if file exists
-        if not os.path.exists(full_file_path):
+        resolved = await _lsp_client_for_file(full_file_path, full_workspace_path)
+        if resolved is None:
             return {
                 "terraform-format": {
                     "file_path": file_path,
@@ -1238,11 +1557,13 @@ async def terraform_format_lsp(
                 }
             }
 
-        # Get LSP client
-        lsp_client = await terraform_lsp_client.get_lsp_client(full_workspace_path)
+        lsp_client, file_uri = resolved
 
         # Format document
-        result = await lsp_client.format_document(full_file_path)
+        result = await _coalesce_lsp(
+            ("format", file_uri),
+            lambda: lsp_client.format_document(full_file_path),
+        )
 
         return {"terraform-format": {"file_path": file_path, **result}}
 
@@ -1283,6 +1604,74 @@ def terraform_lsp_status() -> dict[str, object]:
 # INTELLIGENCE TOOLS
 # ============================================================================
 
+_tf_read_cache: OrderedDict[str, tuple[tuple, tuple, int]] = OrderedDict()
+_tf_read_cache_bytes = 0
+_tf_read_cache_lock = Lock()
+
+# One reader pool for all callers, rather than a pool per directory read
+_TF_READ_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_MAX_TF_READ_WORKERS, thread_name_prefix="terry-tf-read"
+)
+
+
+def _read_tf_files(directory: str) -> tuple[tuple[Path, bytes], ...]:
+    """Read the top-level .tf files in ``directory`` as (path, bytes) pairs.
+
+    Directories named ``*.tf`` are ignored and oversized files are skipped
+    with a warning.  The reads are overlapped on a shared thread pool (file
+    reads release the GIL); results keep the directory listing order.  The
+    last few directories' results are reused while every file's name, size
+    and mtime are unchanged, so running terry_analyze, terry_security_scan
+    and terry_recommendations back to back reads the files once.  The cache
+    holds at most _TF_READ_CACHE_MAX_BYTES of file contents.
+    """
+    global _tf_read_cache_bytes
+    tf_files = []
+    signature = []
+    try:
+        it = os.scandir(directory)
+    except (FileNotFoundError, NotADirectoryError):
+        return ()
+    with it:
+        for entry in it:
+            if not entry.name.endswith(".tf") or not entry.is_file():
+                continue
+            st = entry.stat()
+            if st.st_size > _MAX_TF_FILE_SIZE:
+                logger.warning(f"Skipping oversized file {entry.path} ({st.st_size} bytes)")
+                continue
+            tf_files.append(Path(entry.path))
+            signature.append((entry.name, st.st_size, st.st_mtime_ns))
+    signature = tuple(signature)
+
+    with _tf_read_cache_lock:
+        hit = _tf_read_cache.get(directory)
+        if hit is not None and hit[0] == signature:
+            _tf_read_cache.move_to_end(directory)
+            return hit[1]
+
+    if len(tf_files) <= 1:
+        contents = tuple((tf_file, tf_file.read_bytes()) for tf_file in tf_files)
+    else:
+        contents = tuple(zip(tf_files, _TF_READ_EXECUTOR.map(Path.read_bytes, tf_files)))
+
+    size = sum(len(data) for _, data in contents)
+    with _tf_read_cache_lock:
+        stale = _tf_read_cache.pop(directory, None)
+        if stale is not None:
+            _tf_read_cache_bytes -= stale[2]
+        if size <= _TF_READ_CACHE_MAX_BYTES:
+            _tf_read_cache[directory] = (signature, contents, size)
+            _tf_read_cache_bytes += size
+        while _tf_read_cache and (
+            len(_tf_read_cache) > _TF_READ_CACHE_SIZE
+            or _tf_read_cache_bytes > _TF_READ_CACHE_MAX_BYTES
+        ):
+            _, _, evicted = _tf_read_cache.popitem(last=False)[1]
+            _tf_read_cache_bytes -= evicted
+    return contents
+
+
 @mcp.tool()
 @validate_request("terry_analyze")
 def terry_analyze(path: str) -> dict[str, object]:
@@ -1315,91 +1704,74 @@ def terry_analyze(path: str) -> dict[str, object]:
     
     try:
         # Analyze all .tf files in the directory
-        for tf_file in Path(full_path).glob("*.tf"):
-            if tf_file.stat().st_size > _MAX_TF_FILE_SIZE:
-                logger.warning(
-                    f"Skipping oversized file {tf_file} ({tf_file.stat().st_size} bytes)"
-                )
-                continue
-            with open(tf_file, 'r') as f:
-                content = f.read()
-
-                # Count resources
-                resources = _RE_RESOURCE.findall(content)
-                analysis["statistics"]["resources"] += len(resources)
-
-                # Count data sources
-                data_sources = _RE_DATA_SOURCE.findall(content)
-                analysis["statistics"]["data_sources"] += len(data_sources)
-
-                # Count modules
-                modules = _RE_MODULE.findall(content)
-                analysis["statistics"]["modules"] += len(modules)
-
-                # Count providers
-                providers = _RE_PROVIDER.findall(content)
-                analysis["statistics"]["providers"] += len(set(providers))
-
-                # Count variables
-                variables = _RE_VARIABLE.findall(content)
-                analysis["statistics"]["variables"] += len(variables)
-
-                # Count outputs
-                outputs = _RE_OUTPUT.findall(content)
-                analysis["statistics"]["outputs"] += len(outputs)
-
-                # Check for common issues
-
-                # Missing descriptions on variables
-                var_blocks = _RE_VARIABLE_BLOCK.findall(content)
-                for var_name, var_body in var_blocks:
-                    if 'description' not in var_body:
-                        analysis["issues"].append({
-                            "severity": "warning",
-                            "type": "documentation",
-                            "message": f"Variable '{var_name}' lacks description",
-                            "file": tf_file.name,
-                            "recommendation": "Add description field to variable block"
-                        })
-                        analysis["score"] -= 2
-
-                # Check for hardcoded values
-                hardcoded_patterns = [
-                    (_RE_HARDCODED_AMI, "Hardcoded AMI ID detected"),
-                    (_RE_HARDCODED_INSTANCE, "Hardcoded instance ID detected"),
-                    (_RE_HARDCODED_VPC, "Hardcoded VPC ID detected"),
-                    (_RE_HARDCODED_SUBNET, "Hardcoded subnet ID detected"),
-                ]
-
-                for pattern, message in hardcoded_patterns:
-                    if pattern.search(content):
+        for tf_file, content in _read_tf_files(full_path):
+            # Count blocks and collect variable bodies in a single pass
+            stats = analysis["statistics"]
+            providers = set()
+            var_body_end = 0
+            for match in _RE_ANALYZE.finditer(content):
+                kind = match.lastgroup
+                if kind == "providers":
+                    providers.add(match.group("provider_name"))
+                    continue
+                stats[kind] += 1
+
+                # Missing descriptions on variables.  A variable header inside
+                # the previous variable's body (an unclosed block) is not
+                # checked on its own, as with a non-overlapping block scan
+                var_body = match.group("var_body")
+                if var_body is None or match.start() < var_body_end:
+                    continue
+                var_body_end = match.end("var_body") + 1
+                if b'description' not in var_body:
+                    analysis["issues"].append({
+                        "severity": "warning",
+                        "type": "documentation",
+                        "message": f"Variable '{match.group('var_name').decode(errors='replace')}' lacks description",
+                        "file": tf_file.name,
+                        "recommendation": "Add description field to variable block"
+                    })
+                    analysis["score"] -= 2
+            stats["providers"] += len(providers)
+
+            # Check for hardcoded values
+            hardcoded_patterns = [
+                (_RE_HARDCODED_AMI, "Hardcoded AMI ID detected"),
+                (_RE_HARDCODED_INSTANCE, "Hardcoded instance ID detected"),
+                (_RE_HARDCODED_VPC, "Hardcoded VPC ID detected"),
+                (_RE_HARDCODED_SUBNET, "Hardcoded subnet ID detected"),
+            ]
+
+            for pattern, message in hardcoded_patterns:
+                if pattern.search(content):
+                    analysis["issues"].append({
+                        "severity": "warning",
+                        "type": "hardcoding",
+                        "message": message,
+                        "file": tf_file.name,
+                        "recommendation": "Use variables or data sources instead of hardcoded IDs"
+                    })
+                    analysis["score"] -= 5
+            
+            # Check for missing tags on taggable resources
+            for resource_type, block_pattern in _TAGGABLE_RESOURCE_PATTERNS:
+                for resource_body in block_pattern.findall(content):
+                    if b'tags' not in resource_body:
                         analysis["issues"].append({
-                            "severity": "warning",
-                            "type": "hardcoding",
-                            "message": message,
+                            "severity": "info",
+                            "type": "best_practice",
+                            "message": f"Resource type '{resource_type}' lacks tags",
                             "file": tf_file.name,
-                            "recommendation": "Use variables or data sources instead of hardcoded IDs"
+                            "recommendation": "Add tags for better resource management"
                         })
-                        analysis["score"] -= 5
-                
-                # Check for missing tags on taggable resources
-                taggable_resources = ['aws_instance', 'aws_s3_bucket', 'aws_vpc', 'aws_security_group']
-                for resource_type in taggable_resources:
-                    resource_blocks = re.findall(
-                        rf'resource\s+"{re.escape(resource_type)}"\s+"[^"]+"\s*{{([^}}]+)}}',
-                        content, re.DOTALL,
-                    )
-                    for resource_body in resource_blocks:
-                        if 'tags' not in resource_body:
-                            analysis["issues"].append({
-                                "severity": "info",
-                                "type": "best_practice",
-                                "message": f"Resource type '{resource_type}' lacks tags",
-                                "file": tf_file.name,
-                                "recommendation": "Add tags for better resource management"
-                            })
-                            analysis["score"] -= 1
-        
+                        analysis["score"] -= 1
+
+            # Cap the issue list only; every file is still counted in
+            # statistics and still scored, so totals stay complete
+            if len(analysis["issues"]) > _MAX_ANALYSIS_ISSUES:
+                del analysis["issues"][_MAX_ANALYSIS_ISSUES:]
+                analysis["truncated"] = True
+    
         # Ensure score doesn't go below 0
         analysis["score"] = max(0, analysis["score"])
         
@@ -1410,6 +1782,17 @@ def terry_analyze(path: str) -> dict[str, object]:
         return {"error": f"Analysis failed: {str(e)}"}
 
 
+def _scan_blocks(pattern: re.Pattern, marker: bytes, content: bytes):
+    """finditer ``pattern`` over content, skipped when ``marker`` is absent.
+
+    ``marker`` is a literal every match must contain; the C-level substring
+    search rules out most files far faster than the regex can.
+    """
+    if marker not in content:
+        return ()
+    return pattern.finditer(content)
+
+
 @mcp.tool()
 @validate_request("terry_security_scan")
 def terry_security_scan(path: str, severity: str = "medium") -> dict[str, object]:
@@ -1434,6 +1817,10 @@ def terry_security_scan(path: str, severity: str = "medium") -> dict[str, object
 
     severity_levels = {"low": 1, "medium": 2, "high": 3, "critical": 4}
     min_severity = severity_levels.get(severity.lower(), 2)
+    active = {
+        rule_id for rule_id, rule_severity in _SECURITY_RULE_SEVERITY.items()
+        if severity_levels[rule_severity] >= min_severity
+    }
     
     security_scan = {
         "vulnerabilities": [],
@@ -1447,105 +1834,107 @@ def terry_security_scan(path: str, severity: str = "medium") -> dict[str, object
     
     try:
         # Security checks for all .tf files
-        for tf_file in Path(full_path).glob("*.tf"):
-            if tf_file.stat().st_size > _MAX_TF_FILE_SIZE:
-                logger.warning(
-                    f"Skipping oversized file {tf_file} ({tf_file.stat().st_size} bytes)"
-                )
-                continue
-            with open(tf_file, 'r') as f:
-                content = f.read()
-
-                # Check for public S3 buckets
-                s3_blocks = re.finditer(r'resource\s+"aws_s3_bucket"\s+"([^"]+)"\s*{([^}]+)}', content, re.DOTALL)
-                for match in s3_blocks:
-                    resource_name = match.group(1)
-                    resource_body = match.group(2)
-                    
-                    # Check for public ACL
-                    if re.search(r'acl\s*=\s*"public', resource_body):
-                        vuln = {
-                            "id": "CKV_AWS_20",
-                            "severity": "high",
-                            "resource": f"aws_s3_bucket.{resource_name}",
-                            "message": "S3 Bucket has an ACL defined which allows public access",
-                            "remediation": "Set bucket ACL to 'private'",
-                            "file": tf_file.name
-                        }
-                        if severity_levels[vuln["severity"]] >= min_severity:
-                            security_scan["vulnerabilities"].append(vuln)
-                            security_scan["summary"][vuln["severity"]] += 1
-                    
-                    # Check for missing encryption
-                    if 'server_side_encryption_configuration' not in resource_body:
-                        vuln = {
-                            "id": "CKV_AWS_19",
-                            "severity": "medium",
-                            "resource": f"aws_s3_bucket.{resource_name}",
-                            "message": "S3 bucket lacks server-side encryption",
-                            "remediation": "Add server_side_encryption_configuration block",
-                            "file": tf_file.name
-                        }
-                        if severity_levels[vuln["severity"]] >= min_severity:
-                            security_scan["vulnerabilities"].append(vuln)
-                            security_scan["summary"][vuln["severity"]] += 1
+        # Only rules at or above the requested severity are evaluated; each
+        # block regex only runs when a plain substring search finds its
+        # resource type in the file at all
+        for tf_file, content in _read_tf_files(full_path) if active else ():
+            # Check for public S3 buckets
+            s3_blocks = (
+                _scan_blocks(_RE_S3_BUCKET_BLOCK, b'"aws_s3_bucket"', content)
+                if {"CKV_AWS_20", "CKV_AWS_19"} & active else ()
+            )
+            for match in s3_blocks:
+                resource_name = match.group(1).decode(errors="replace")
+                resource_body = match.group(2)
                 
-                # Check for open security groups
-                sg_blocks = re.finditer(r'resource\s+"aws_security_group"\s+"([^"]+)"\s*{([^}]+)}', content, re.DOTALL)
-                for match in sg_blocks:
-                    resource_name = match.group(1)
-                    resource_body = match.group(2)
-                    
-                    # Check for 0.0.0.0/0 in ingress
-                    if re.search(r'cidr_blocks\s*=\s*\[\s*"0\.0\.0\.0/0"', resource_body):
-                        vuln = {
-                            "id": "CKV_AWS_24",
-                            "severity": "high",
-                            "resource": f"aws_security_group.{resource_name}",
-                            "message": "Security group allows ingress from 0.0.0.0/0",
-                            "remediation": "Restrict ingress to specific IP ranges",
-                            "file": tf_file.name
-                        }
-                        if severity_levels[vuln["severity"]] >= min_severity:
-                            security_scan["vulnerabilities"].append(vuln)
-                            security_scan["summary"][vuln["severity"]] += 1
+                # Check for public ACL
+                if "CKV_AWS_20" in active and _RE_PUBLIC_ACL.search(resource_body):
+                    vuln = {
+                        "id": "CKV_AWS_20",
+                        "severity": "high",
+                        "resource": f"aws_s3_bucket.{resource_name}",
+                        "message": "S3 Bucket has an ACL defined which allows public access",
+                        "remediation": "Set bucket ACL to 'private'",
+                        "file": tf_file.name
+                    }
+                    security_scan["vulnerabilities"].append(vuln)
+                    security_scan["summary"][vuln["severity"]] += 1
                 
-                # Check for unencrypted RDS instances
-                rds_blocks = re.finditer(r'resource\s+"aws_db_instance"\s+"([^"]+)"\s*{([^}]+)}', content, re.DOTALL)
-                for match in rds_blocks:
-                    resource_name = match.group(1)
-                    resource_body = match.group(2)
-                    
-                    if 'storage_encrypted' not in resource_body or re.search(r'storage_encrypted\s*=\s*false', resource_body):
-                        vuln = {
-                            "id": "CKV_AWS_16",
-                            "severity": "high",
-                            "resource": f"aws_db_instance.{resource_name}",
-                            "message": "RDS instance is not encrypted",
-                            "remediation": "Set storage_encrypted = true",
-                            "file": tf_file.name
-                        }
-                        if severity_levels[vuln["severity"]] >= min_severity:
-                            security_scan["vulnerabilities"].append(vuln)
-                            security_scan["summary"][vuln["severity"]] += 1
+                # Check for missing encryption
+                if "CKV_AWS_19" in active and b'server_side_encryption_configuration' not in resource_body:
+                    vuln = {
+                        "id": "CKV_AWS_19",
+                        "severity": "medium",
+                        "resource": f"aws_s3_bucket.{resource_name}",
+                        "message": "S3 bucket lacks server-side encryption",
+                        "remediation": "Add server_side_encryption_configuration block",
+                        "file": tf_file.name
+                    }
+                    security_scan["vulnerabilities"].append(vuln)
+                    security_scan["summary"][vuln["severity"]] += 1
+            
+            # Check for open security groups
+            sg_blocks = (
+                _scan_blocks(_RE_SECURITY_GROUP_BLOCK, b'"aws_security_group"', content)
+                if "CKV_AWS_24" in active else ()
+            )
+            for match in sg_blocks:
+                resource_name = match.group(1).decode(errors="replace")
+                resource_body = match.group(2)
                 
-                # Check for IAM policies with wildcards
-                iam_policy_blocks = re.finditer(r'data\s+"aws_iam_policy_document"[^{]+{([^}]+)}', content, re.DOTALL)
-                for match in iam_policy_blocks:
-                    policy_body = match.group(1)
-                    if re.search(r'actions\s*=\s*\[\s*"\*"', policy_body) or re.search(r'resources\s*=\s*\[\s*"\*"', policy_body):
-                        vuln = {
-                            "id": "CKV_AWS_1",
-                            "severity": "medium",
-                            "resource": "IAM Policy Document",
-                            "message": "IAM policy uses wildcards (*) in actions or resources",
-                            "remediation": "Use specific actions and resources instead of wildcards",
-                            "file": tf_file.name
-                        }
-                        if severity_levels[vuln["severity"]] >= min_severity:
-                            security_scan["vulnerabilities"].append(vuln)
-                            security_scan["summary"][vuln["severity"]] += 1
-        
+                # Check for 0.0.0.0/0 in ingress
+                if _RE_OPEN_CIDR.search(resource_body):
+                    vuln = {
+                        "id": "CKV_AWS_24",
+                        "severity": "high",
+                        "resource": f"aws_security_group.{resource_name}",
+                        "message": "Security group allows ingress from 0.0.0.0/0",
+                        "remediation": "Restrict ingress to specific IP ranges",
+                        "file": tf_file.name
+                    }
+                    security_scan["vulnerabilities"].append(vuln)
+                    security_scan["summary"][vuln["severity"]] += 1
+            
+            # Check for unencrypted RDS instances
+            rds_blocks = (
+                _scan_blocks(_RE_DB_INSTANCE_BLOCK, b'"aws_db_instance"', content)
+                if "CKV_AWS_16" in active else ()
+            )
+            for match in rds_blocks:
+                resource_name = match.group(1).decode(errors="replace")
+                resource_body = match.group(2)
+                
+                if b'storage_encrypted' not in resource_body or _RE_STORAGE_UNENCRYPTED.search(resource_body):
+                    vuln = {
+                        "id": "CKV_AWS_16",
+                        "severity": "high",
+                        "resource": f"aws_db_instance.{resource_name}",
+                        "message": "RDS instance is not encrypted",
+                        "remediation": "Set storage_encrypted = true",
+                        "file": tf_file.name
+                    }
+                    security_scan["vulnerabilities"].append(vuln)
+                    security_scan["summary"][vuln["severity"]] += 1
+            
+            # Check for IAM policies with wildcards
+            iam_policy_blocks = (
+                _scan_blocks(_RE_IAM_POLICY_DOC_BLOCK, b'"aws_iam_policy_document"', content)
+                if "CKV_AWS_1" in active else ()
+            )
+            for match in iam_policy_blocks:
+                policy_body = match.group(1)
+                if _RE_WILDCARD_ACTIONS.search(policy_body) or _RE_WILDCARD_RESOURCES.search(policy_body):
+                    vuln = {
+                        "id": "CKV_AWS_1",
+                        "severity": "medium",
+                        "resource": "IAM Policy Document",
+                        "message": "IAM policy uses wildcards (*) in actions or resources",
+                        "remediation": "Use specific actions and resources instead of wildcards",
+                        "file": tf_file.name
+                    }
+                    security_scan["vulnerabilities"].append(vuln)
+                    security_scan["summary"][vuln["severity"]] += 1
+    
         return {"security_scan": security_scan}
         
     except Exception as e:
@@ -1583,98 +1972,91 @@ def terry_recommendations(path: str, focus: str = "security") -> dict[str, objec
     
     try:
         # Analyze configuration based on focus area
-        for tf_file in Path(full_path).glob("*.tf"):
-            if tf_file.stat().st_size > _MAX_TF_FILE_SIZE:
-                logger.warning(
-                    f"Skipping oversized file {tf_file} ({tf_file.stat().st_size} bytes)"
-                )
-                continue
-            with open(tf_file, 'r') as f:
-                content = f.read()
-
-                if focus == "security":
-                    # Security recommendations
-                    if 'aws_instance' in content and 'key_name' in content:
-                        recommendations["recommendations"].append({
-                            "category": "security",
-                            "title": "Use Systems Manager Session Manager",
-                            "description": "Replace SSH key access with AWS Systems Manager Session Manager for better security",
-                            "impact": "high",
-                            "effort": "medium"
-                        })
-                    
-                    if not re.search(r'aws_kms_key', content) and ('aws_s3_bucket' in content or 'aws_db_instance' in content):
-                        recommendations["recommendations"].append({
-                            "category": "security",
-                            "title": "Implement KMS encryption",
-                            "description": "Use AWS KMS for encryption key management",
-                            "impact": "high",
-                            "effort": "low"
-                        })
-                    
-                elif focus == "cost":
-                    # Cost optimization recommendations
-                    if 'aws_instance' in content and not re.search(r'instance_type\s*=\s*var', content):
-                        recommendations["recommendations"].append({
-                            "category": "cost",
-                            "title": "Parameterize instance types",
-                            "description": "Use variables for instance types to easily switch between environments",
-                            "impact": "medium",
-                            "effort": "low"
-                        })
-                    
-                    if 'aws_instance' in content and 'spot_' not in content:
-                        recommendations["recommendations"].append({
-                            "category": "cost",
-                            "title": "Consider Spot Instances",
-                            "description": "Use Spot Instances for non-critical workloads to save up to 90%",
-                            "impact": "high",
-                            "effort": "medium"
-                        })
-                    
-                elif focus == "performance":
-                    # Performance recommendations
-                    if 'aws_instance' in content and 'monitoring' not in content:
+        for tf_file, content in _read_tf_files(full_path):
+            has_instance = b'aws_instance' in content
+            if focus == "security":
+                # Security recommendations
+                if has_instance and b'key_name' in content:
+                    recommendations["recommendations"].append({
+                        "category": "security",
+                        "title": "Use Systems Manager Session Manager",
+                        "description": "Replace SSH key access with AWS Systems Manager Session Manager for better security",
+                        "impact": "high",
+                        "effort": "medium"
+                    })
+                
+                if b'aws_kms_key' not in content and (b'aws_s3_bucket' in content or b'aws_db_instance' in content):
+                    recommendations["recommendations"].append({
+                        "category": "security",
+                        "title": "Implement KMS encryption",
+                        "description": "Use AWS KMS for encryption key management",
+                        "impact": "high",
+                        "effort": "low"
+                    })
+                
+            elif focus == "cost":
+                # Cost optimization recommendations
+                if has_instance and not _RE_INSTANCE_TYPE_VAR.search(content):
+                    recommendations["recommendations"].append({
+                        "category": "cost",
+                        "title": "Parameterize instance types",
+                        "description": "Use variables for instance types to easily switch between environments",
+                        "impact": "medium",
+                        "effort": "low"
+                    })
+                
+                if has_instance and b'spot_' not in content:
+                    recommendations["recommendations"].append({
+                        "category": "cost",
+                        "title": "Consider Spot Instances",
+                        "description": "Use Spot Instances for non-critical workloads to save up to 90%",
+                        "impact": "high",
+                        "effort": "medium"
+                    })
+                
+            elif focus == "performance":
+                # Performance recommendations
+                if has_instance and b'monitoring' not in content:
+                    recommendations["recommendations"].append({
+                        "category": "performance",
+                        "title": "Enable detailed monitoring",
+                        "description": "Enable CloudWatch detailed monitoring for better visibility",
+                        "impact": "medium",
+                        "effort": "low"
+                    })
+                
+                if b'aws_alb' in content or b'aws_lb' in content:
+                    if b'enable_http2' not in content:
                         recommendations["recommendations"].append({
                             "category": "performance",
-                            "title": "Enable detailed monitoring",
-                            "description": "Enable CloudWatch detailed monitoring for better visibility",
+                            "title": "Enable HTTP/2",
+                            "description": "Enable HTTP/2 on load balancers for better performance",
                             "impact": "medium",
                             "effort": "low"
                         })
-                    
-                    if 'aws_alb' in content or 'aws_lb' in content:
-                        if 'enable_http2' not in content:
-                            recommendations["recommendations"].append({
-                                "category": "performance",
-                                "title": "Enable HTTP/2",
-                                "description": "Enable HTTP/2 on load balancers for better performance",
-                                "impact": "medium",
-                                "effort": "low"
-                            })
+            
+            elif focus == "reliability":
+                # Reliability recommendations
+                if has_instance and b'availability_zone' in content and b'count' not in content:
+                    recommendations["recommendations"].append({
+                        "category": "reliability",
+                        "title": "Implement multi-AZ deployment",
+                        "description": "Deploy instances across multiple availability zones",
+                        "impact": "high",
+                        "effort": "medium"
+                    })
                 
-                elif focus == "reliability":
-                    # Reliability recommendations
-                    if 'aws_instance' in content and 'availability_zone' in content and 'count' not in content:
-                        recommendations["recommendations"].append({
-                            "category": "reliability",
-                            "title": "Implement multi-AZ deployment",
-                            "description": "Deploy instances across multiple availability zones",
-                            "impact": "high",
-                            "effort": "medium"
-                        })
-                    
-                    if 'aws_db_instance' in content and 'backup_retention_period' not in content:
-                        recommendations["recommendations"].append({
-                            "category": "reliability",
-                            "title": "Configure automated backups",
-                            "description": "Set backup retention period for RDS instances",
-                            "impact": "high",
-                            "effort": "low"
-                        })
-        
+                if b'aws_db_instance' in content and b'backup_retention_period' not in content:
+                    recommendations["recommendations"].append({
+                        "category": "reliability",
+                        "title": "Configure automated backups",
+                        "description": "Set backup retention period for RDS instances",
+                        "impact": "high",
+                        "effort": "low"
+                    })
+    
         # Sort recommendations by impact
-        recommendations["recommendations"].sort(key=lambda x: {"high": 3, "medium": 2, "low": 1}.get(x["impact"], 0), reverse=True)
+        recommendations["recommendations"].sort(key=lambda x: _IMPACT_RANK.get(x["impact"], 0), reverse=True)
         
         # Extract top 3 priority actions
         recommendations["priority_actions"] = [
@@ -1857,24 +2239,28 @@ def terry_recommendations(path: str, focus: str = "security") -> dict[str, objec
 # GITHUB INTEGRATION TOOLS
 # ============================================================================
 
-# Import GitHub integration modules
-try:
-    from github_app_auth import GitHubAppConfig, GitHubAppAuth
-    from github_repo_handler import GitHubRepoHandler
-
-    github_auth = None
-    github_handler = None
+# Import GitHub integration modules only when the app is configured; they
+# pull in PyJWT and cryptography, which are otherwise dead weight at startup
+github_auth = None
+github_handler = None
 
+if not os.environ.get("GITHUB_APP_ID"):
+    logger.info("GitHub integration disabled (GITHUB_APP_ID not set). GitHub tools will be unavailable.")
+else:
     try:
-        github_config = GitHubAppConfig.from_env()
-        github_auth = GitHubAppAuth(github_config)
-        github_handler = GitHubRepoHandler(github_auth)
-    except Exception:
-        logger.info("GitHub integration disabled (GITHUB_APP_ID not set). GitHub tools will be unavailable.")
+        from github_app_auth import GitHubAppConfig, GitHubAppAuth
+        from github_repo_handler import GitHubRepoHandler
 
-except Exception as e:
-    logger.error(f"Failed to load GitHub integration: {e}")
-    github_handler = None
+        try:
+            github_config = GitHubAppConfig.from_env()
+            github_auth = GitHubAppAuth(github_config)
+            github_handler = GitHubRepoHandler(github_auth)
+        except Exception as e:
+            logger.warning(f"GitHub integration disabled: {e}. GitHub tools will be unavailable.")
+
+    except Exception as e:
+        logger.error(f"Failed to load GitHub integration: {e}")
+        github_handler = None
 
 
 @mcp.tool()
@@ -2007,10 +2393,11 @@ def health_ready() -> dict[str, object]:
     server is ready to accept requests. Returns not_ready otherwise.
     """
     try:
+        # Only the exit code matters here; discard the output
         result = subprocess.run(
             ["terraform", "version"],
-            capture_output=True,
-            text=True,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
             timeout=10,
         )
         if result.returncode == 0:
@@ -7,9 +7,11 @@ and expose language server capabilities through MCP tools.
 """
 
 import asyncio
+import hashlib
 import json
 import logging
 import os
+import shutil
 import subprocess
 from pathlib import Path
 
@@ -26,6 +28,7 @@ _LSP_SHUTDOWN_TIMEOUT_S: float = 5.0
 _LSP_MAX_ITERATIONS: int = 50
 _LSP_DOCUMENT_SETTLE_S: float = 0.1
 _LSP_DIAGNOSTIC_WAIT_S: float = 1.0
+_LSP_FORMAT_CACHE_SIZE: int = 64
 _WORKSPACE_ROOT: str = os.environ.get("TERRY_WORKSPACE_ROOT", "/mnt/workspace")
 
 
@@ -40,6 +43,8 @@ class TerraformLSPClient:
         self.capabilities = {}
         self.initialization_error = None
         self.logger = logging.getLogger(__name__)
+        # file path -> (content digest, format_document result)
+        self._format_cache: dict[str, tuple[bytes, dict]] = {}
 
     def _validate_file_path(self, file_path: str) -> None:
         """Ensure file_path is within the workspace root to prevent arbitrary file reads"""
@@ -68,15 +73,13 @@ class TerraformLSPClient:
                 return False
 
             # Ensure terraform-ls binary exists
-            result = subprocess.run(
-                ["which", "terraform-ls"], capture_output=True, text=True, timeout=10
-            )
-            if result.returncode != 0:
+            terraform_ls_path = shutil.which("terraform-ls")
+            if terraform_ls_path is None:
                 self.logger.error("terraform-ls binary not found")
                 self.initialization_error = "terraform-ls binary not found"
                 return False
 
-            self.logger.info(f"terraform-ls found at: {result.stdout.strip()}")
+            self.logger.info(f"terraform-ls found at: {terraform_ls_path}")
 
             # Test terraform-ls version
             version_result = subprocess.run(
@@ -283,8 +286,13 @@ class TerraformLSPClient:
             "textDocument/didClose", {"textDocument": {"uri": file_uri}}
         )
 
-    async def _send_notification(self, method: str, params: dict = None):
-        """Send JSON-RPC notification to terraform-ls"""
+    async def _send_notification(self, method: str, params: dict = None, drain: bool = True):
+        """Send JSON-RPC notification to terraform-ls
+
+        With drain=False the frame is only buffered; the next request's
+        drain flushes it, so the two go out back to back without waiting
+        on the pipe in between.
+        """
         notification = {"jsonrpc": "2.0", "method": method}
 
         if params:
@@ -299,7 +307,8 @@ class TerraformLSPClient:
 
         try:
             self.terraform_ls_process.stdin.write(message.encode("utf-8"))
-            await self.terraform_ls_process.stdin.drain()
+            if drain:
+                await self.terraform_ls_process.stdin.drain()
         except (BrokenPipeError, ConnectionResetError, OSError) as e:
             self.logger.error(
                 f"LSP process pipe broken during notification {method}: {e}"
@@ -518,6 +527,7 @@ class TerraformLSPClient:
                 }
 
             file_uri = f"file://{file_path}"
+            digest = None
 
             # First open the document
             if os.path.exists(file_path):
@@ -531,6 +541,16 @@ class TerraformLSPClient:
                     )
                     return {"error": _LSP_OP_FAILED}
 
+                # Formatting depends only on the text, so an unchanged file
+                # reuses the previous edits without a round trip
+                digest = hashlib.blake2b(content.encode("utf-8"), digest_size=16).digest()
+                cached = self._format_cache.get(file_path)
+                if cached is not None and cached[0] == digest:
+                    return dict(cached[1])
+
+                # Pipelined with the formatting request below: the server
+                # handles messages in order, and formatting only needs the
+                # document text, so no settle delay is required
                 await self._send_notification(
                     "textDocument/didOpen",
                     {
@@ -541,11 +561,9 @@ class TerraformLSPClient:
                             "text": content,
                         }
                     },
+                    drain=False,
                 )
 
-                # Small delay to let LSP process the document
-                await asyncio.sleep(_LSP_DOCUMENT_SETTLE_S)
-
             try:
                 response = await self._send_request(
                     "textDocument/formatting",
@@ -557,7 +575,13 @@ class TerraformLSPClient:
 
                 if "result" in response:
                     edits = response["result"]
-                    return {"success": True, "edits": edits}
+                    result = {"success": True, "edits": edits}
+                    if digest is not None:
+                        self._format_cache.pop(file_path, None)
+                        self._format_cache[file_path] = (digest, result)
+                        if len(self._format_cache) > _LSP_FORMAT_CACHE_SIZE:
+                            del self._format_cache[next(iter(self._format_cache))]
+                    return dict(result)
 
                 return {"success": True, "edits": []}
             finally:
@@ -602,6 +626,13 @@ async def get_lsp_client(workspace_path: str = None) -> TerraformLSPClient:
     """Get or create LSP client instance (async-safe singleton)"""
     global _lsp_client
 
+    # Fast path: a warm, initialized client is handed out without taking
+    # the lock.  A client that is still starting up has initialized=False,
+    # so callers racing its startup fall through and wait on the lock.
+    client = _lsp_client
+    if client is not None and client.initialized:
+        return client
+
     async with _lsp_client_lock:
         if _lsp_client is None:
             _lsp_client = TerraformLSPClient()
@@ -86,43 +86,33 @@ def get_controlled_env() -> dict[str, str]:
     return env
 
 
+# Base CLI arguments for each supported action, built once at import
+_TERRAFORM_COMMANDS: dict[str, tuple[str, ...]] = {
+    "init": ("terraform", "init", "-input=false", "-no-color"),
+    "validate": ("terraform", "validate", "-no-color"),
+    "fmt": ("terraform", "fmt", "-check", "-diff", "-no-color"),
+    "plan": ("terraform", "plan", "-input=false", "-no-color", "-out=tfplan"),
+    "show": ("terraform", "show", "-json", "-no-color"),
+    "graph": ("terraform", "graph"),
+    "providers": ("terraform", "providers"),
+    "version": ("terraform", "version", "-json"),
+}
+
+
 def build_terraform_command(
     action: str, vars: dict[str, Any] | None = None, var_file: str | None = None
 ) -> list:
     """Build Terraform command with appropriate flags for each action."""
-    base_cmd = ["terraform"]
-
-    if action == "init":
-        return base_cmd + ["init", "-input=false", "-no-color"]
-
-    elif action == "validate":
-        return base_cmd + ["validate", "-no-color"]
-
-    elif action == "fmt":
-        return base_cmd + ["fmt", "-check", "-diff", "-no-color"]
-
-    elif action == "plan":
-        cmd = base_cmd + ["plan", "-input=false", "-no-color", "-out=tfplan"]
-        if var_file:
-            cmd.extend(["-var-file", var_file])
-        return cmd
-
-    elif action == "show":
-        return base_cmd + ["show", "-json", "-no-color"]
-
-    elif action == "graph":
-        return base_cmd + ["graph"]
-
-    elif action == "providers":
-        return base_cmd + ["providers"]
-
-    elif action == "version":
-        return base_cmd + ["version", "-json"]
-
-    else:
+    base_cmd = _TERRAFORM_COMMANDS.get(action)
+    if base_cmd is None:
         # Reject unknown actions — never allow arbitrary Terraform subcommands
         raise ValueError(f"Unsupported Terraform action: {action}")
 
+    cmd = list(base_cmd)
+    if action == "plan" and var_file:
+        cmd.extend(["-var-file", var_file])
+    return cmd
+
 
 def parse_plan_output(path: str) -> dict[str, Any] | None:
     """Parse Terraform plan output to extract summary."""
@@ -193,18 +183,20 @@ def parse_plan_output(path: str) -> dict[str, Any] | None:
         return None
 
 
+# Counts in terraform's text plan summary line ("Plan: 1 to add, ...")
+_PLAN_SUMMARY_PATTERNS = {
+    "add": re.compile(r"(\d+) to add"),
+    "change": re.compile(r"(\d+) to change"),
+    "destroy": re.compile(r"(\d+) to destroy"),
+}
+
+
 def parse_text_plan_summary(stdout: str) -> dict[str, int]:
     """Fallback: Parse plan summary from text output."""
     summary = {"add": 0, "change": 0, "destroy": 0}
 
-    patterns = {
-        "add": r"(\d+) to add",
-        "change": r"(\d+) to change",
-        "destroy": r"(\d+) to destroy",
-    }
-
-    for key, pattern in patterns.items():
-        match = re.search(pattern, stdout)
+    for key, pattern in _PLAN_SUMMARY_PATTERNS.items():
+        match = pattern.search(stdout)
         if match:
             summary[key] = int(match.group(1))
 
@@ -271,6 +263,11 @@ def run_terraform(
             temp_var_file.close()
             var_file_path = temp_var_file.name
 
+        if action == "plan":
+            # -out truncates and writes in place; drop any existing entry first
+            # so a stale symlink or hardlinked copy is never written through
+            (workspace_path / "tfplan").unlink(missing_ok=True)
+
         # Build command
         cmd = build_terraform_command(action, vars, var_file_path)
 
@@ -284,20 +281,23 @@ def run_terraform(
             cmd,
             cwd=path,
             capture_output=True,
-            text=True,
             timeout=timeout,
             env=get_controlled_env(),
         )
 
         duration = time.time() - start_time
 
+        # Decode once from the raw pipes (plan output can be large)
+        stdout = result.stdout.decode("utf-8", errors="replace")
+        stderr = result.stderr.decode("utf-8", errors="replace")
+
         # Build response
         response = {
             "action": action,
             "success": result.returncode == 0,
             "exit_code": result.returncode,
-            "stdout": result.stdout,
-            "stderr": result.stderr,
+            "stdout": stdout,
+            "stderr": stderr,
             "duration": round(duration, 2),
         }
 
@@ -312,12 +312,12 @@ def run_terraform(
                 response["resources"] = plan_data["resources"]
             else:
                 # Fallback to text parsing
-                response["plan_summary"] = parse_text_plan_summary(result.stdout)
+                response["plan_summary"] = parse_text_plan_summary(stdout)
 
         # For version action, parse JSON output
         if action == "version" and result.returncode == 0:
             try:
-                version_data = json.loads(result.stdout)
+                version_data = json.loads(stdout)
                 response["terraform_version"] = version_data.get("terraform_version")
                 response["platform"] = version_data.get("platform")
                 response["provider_selections"] = version_data.get(
@@ -329,7 +329,7 @@ def run_terraform(
         # For show action, include parsed state
         if action == "show" and result.returncode == 0:
             try:
-                response["state"] = json.loads(result.stdout)
+                response["state"] = json.loads(stdout)
             except json.JSONDecodeError as e:
                 logger.debug(f"Failed to parse show JSON output: {e}")
 
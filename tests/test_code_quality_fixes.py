@@ -89,7 +89,7 @@ class TestTerryParameterRename:
         # Find the terry function definition
         tree = _server_ast()
         for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "terry":
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "terry":
                 param_names = [a.arg for a in node.args.args]
                 assert "vars" not in param_names, (
                     "terry() still uses 'vars' as a parameter name, which shadows the built-in. "
@@ -102,7 +102,7 @@ class TestTerryParameterRename:
         """terry() function must have 'tf_vars' as a parameter name."""
         tree = _server_ast()
         for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "terry":
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "terry":
                 param_names = [a.arg for a in node.args.args]
                 assert "tf_vars" in param_names, (
                     "terry() must have 'tf_vars' as a parameter (rename from 'vars')."
@@ -114,7 +114,7 @@ class TestTerryParameterRename:
         """terry() docstring must reference tf_vars, not bare vars."""
         tree = _server_ast()
         for node in ast.walk(tree):
-            if isinstance(node, ast.FunctionDef) and node.name == "terry":
+            if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) and node.name == "terry":
                 docstring = ast.get_docstring(node) or ""
                 # The old docstring had '    vars: Terraform variables'
                 # (bare 'vars:' preceded only by whitespace, not by 'tf_').
@@ -333,6 +333,101 @@ class TestDefaultTimeoutValidation:
             assert mod.DEFAULT_TIMEOUT == 45
 
 
+class TestToolWorkerPool:
+    """TERRY_MAX_TOOL_WORKERS is validated at import; the pool stops on shutdown."""
+
+    def test_invalid_worker_count_raises_runtime_error(self):
+        saved = _install_server_stubs()
+        sys.modules.pop("server_enhanced_with_lsp", None)
+        try:
+            with patch.dict(os.environ, {"TERRY_MAX_TOOL_WORKERS": "many"}, clear=False):
+                with pytest.raises(RuntimeError, match="TERRY_MAX_TOOL_WORKERS"):
+                    importlib.import_module("server_enhanced_with_lsp")
+        finally:
+            _restore_server_stubs(saved)
+
+    def test_worker_count_clamped_to_one(self):
+        srv, saved = _import_server({"TERRY_MAX_TOOL_WORKERS": "0"})
+        try:
+            assert srv._MAX_TOOL_WORKERS == 1
+        finally:
+            _restore_server_stubs(saved)
+
+    def test_lifespan_teardown_shuts_down_tool_pool(self):
+        import asyncio
+
+        srv, saved = _import_server()
+        try:
+            async def run_lifespan():
+                async with srv.app_lifespan(None):
+                    pass
+
+            with patch.object(srv._TOOL_EXECUTOR, "shutdown") as shutdown:
+                asyncio.run(run_lifespan())
+            shutdown.assert_called_once_with(wait=False, cancel_futures=True)
+        finally:
+            _restore_server_stubs(saved)
+
+
+class TestMaxAnalysisIssues:
+    """TERRY_MAX_ANALYSIS_ISSUES is validated at import and clamped to >= 1."""
+
+    def test_default_is_500(self, monkeypatch):
+        monkeypatch.delenv("TERRY_MAX_ANALYSIS_ISSUES", raising=False)
+        srv, saved = _import_server()
+        try:
+            assert srv._MAX_ANALYSIS_ISSUES == 500
+        finally:
+            _restore_server_stubs(saved)
+
+    def test_invalid_value_raises_runtime_error(self):
+        saved = _install_server_stubs()
+        sys.modules.pop("server_enhanced_with_lsp", None)
+        try:
+            with patch.dict(os.environ, {"TERRY_MAX_ANALYSIS_ISSUES": "lots"}, clear=False):
+                with pytest.raises(RuntimeError, match="TERRY_MAX_ANALYSIS_ISSUES"):
+                    importlib.import_module("server_enhanced_with_lsp")
+        finally:
+            _restore_server_stubs(saved)
+
+    @pytest.mark.parametrize("raw", ["0", "-5"])
+    def test_non_positive_clamped_to_one(self, raw):
+        srv, saved = _import_server({"TERRY_MAX_ANALYSIS_ISSUES": raw})
+        try:
+            assert srv._MAX_ANALYSIS_ISSUES == 1
+        finally:
+            _restore_server_stubs(saved)
+
+
+class TestLspDebounce:
+    """TERRY_LSP_DEBOUNCE_MS is validated at import and off by default."""
+
+    def test_default_is_disabled(self, monkeypatch):
+        monkeypatch.delenv("TERRY_LSP_DEBOUNCE_MS", raising=False)
+        srv, saved = _import_server()
+        try:
+            assert srv._LSP_DEBOUNCE_SECONDS == 0
+        finally:
+            _restore_server_stubs(saved)
+
+    def test_milliseconds_converted_to_seconds(self):
+        srv, saved = _import_server({"TERRY_LSP_DEBOUNCE_MS": "150"})
+        try:
+            assert srv._LSP_DEBOUNCE_SECONDS == 0.15
+        finally:
+            _restore_server_stubs(saved)
+
+    def test_invalid_value_raises_runtime_error(self):
+        saved = _install_server_stubs()
+        sys.modules.pop("server_enhanced_with_lsp", None)
+        try:
+            with patch.dict(os.environ, {"TERRY_LSP_DEBOUNCE_MS": "fast"}, clear=False):
+                with pytest.raises(RuntimeError, match="TERRY_LSP_DEBOUNCE_MS"):
+                    importlib.import_module("server_enhanced_with_lsp")
+        finally:
+            _restore_server_stubs(saved)
+
+
 # ============================================================================
 # Fix 5: TERRY_HOST/TERRY_PORT with backward compatibility
 # ============================================================================
@@ -14,6 +14,7 @@ Covers:
 
 import hashlib
 import hmac
+import threading
 import time
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
@@ -238,6 +239,36 @@ class TestGenerateJWT:
 
         assert header["alg"] == "RS256"
 
+    def test_private_key_parsed_once(self, auth):
+        """The PEM is parsed on first use and the key object reused afterwards."""
+        with patch(
+            "github_app_auth.load_pem_private_key",
+            wraps=serialization.load_pem_private_key,
+        ) as mock_load:
+            first = auth._get_private_key()
+            second = auth._get_private_key()
+
+        assert first is second
+        assert mock_load.call_count == 1
+
+    def test_jwt_reused_within_validity_window(self, auth):
+        """A second call returns the cached JWT instead of re-signing."""
+        with patch("github_app_auth.jwt.encode", wraps=jwt.encode) as mock_encode:
+            token1 = auth._generate_jwt()
+            token2 = auth._generate_jwt()
+
+        assert token1 == token2
+        assert mock_encode.call_count == 1
+
+    def test_jwt_reminted_near_expiry(self, auth):
+        """A cached JWT with less than a minute left is replaced."""
+        auth._jwt_cache = ("stale-jwt", int(time.time()) + 30)
+
+        token = auth._generate_jwt()
+
+        assert token != "stale-jwt"
+        assert auth._jwt_cache[0] == token
+
 
 # ---------------------------------------------------------------------------
 # 3. get_installation_token()
@@ -256,7 +287,7 @@ class TestGetInstallationToken:
             "expires_at": "2099-01-01T00:00:00Z",
         }
 
-        with patch("github_app_auth.requests.post", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response):
             token = auth.get_installation_token("78901234")
 
         assert token == "ghs_test_installation_token"
@@ -274,7 +305,7 @@ class TestGetInstallationToken:
             "expires_at": future_expiry,
         }
 
-        with patch("github_app_auth.requests.post", return_value=mock_response) as mock_post:
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response) as mock_post:
             token1 = auth.get_installation_token("78901234")
             token2 = auth.get_installation_token("78901234")
 
@@ -288,9 +319,7 @@ class TestGetInstallationToken:
         # Pre-populate cache with a token that expires very soon
         auth._installation_tokens["78901234"] = {
             "token": "ghs_old_token",
-            "expires_at": (
-                datetime.now(timezone.utc) + timedelta(minutes=2)
-            ).isoformat(),
+            "exp": time.time() + 120,
         }
 
         mock_response = MagicMock()
@@ -302,18 +331,34 @@ class TestGetInstallationToken:
             ).isoformat(),
         }
 
-        with patch("github_app_auth.requests.post", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response):
             token = auth.get_installation_token("78901234")
 
         assert token == "ghs_fresh_token"
 
+    def test_cached_expiry_stored_as_epoch_seconds(self, auth):
+        """The cache stores the parsed expiry instead of the ISO string."""
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_response.json.return_value = {
+            "token": "ghs_epoch_token",
+            "expires_at": "2099-01-01T00:00:00Z",
+        }
+
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response):
+            auth.get_installation_token("78901234")
+
+        entry = auth._installation_tokens["78901234"]
+        assert entry["token"] == "ghs_epoch_token"
+        assert entry["exp"] == datetime(2099, 1, 1, tzinfo=timezone.utc).timestamp()
+
     def test_http_error_raises_runtime_error(self, auth):
         """RuntimeError is raised on non-201 API responses."""
         mock_response = MagicMock()
         mock_response.status_code = 401
         mock_response.text = "Bad credentials"
 
-        with patch("github_app_auth.requests.post", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response):
             with pytest.raises(RuntimeError, match="HTTP 401"):
                 auth.get_installation_token("78901234")
 
@@ -338,7 +383,7 @@ class TestGetInstallationToken:
             "expires_at": "2099-01-01T00:00:00Z",
         }
 
-        with patch("github_app_auth.requests.post", return_value=mock_response) as mock_post:
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response) as mock_post:
             token = auth.get_installation_token()
 
         assert token == "ghs_default_id_token"
@@ -346,6 +391,35 @@ class TestGetInstallationToken:
         call_url = mock_post.call_args[0][0]
         assert "78901234" in call_url
 
+    def test_concurrent_callers_share_one_mint(self, auth):
+        """Threads racing on a cold cache trigger only one token request."""
+        mock_response = MagicMock()
+        mock_response.status_code = 201
+        mock_response.json.return_value = {
+            "token": "ghs_shared_token",
+            "expires_at": "2099-01-01T00:00:00Z",
+        }
+
+        def slow_post(*args, **kwargs):
+            time.sleep(0.05)
+            return mock_response
+
+        tokens = []
+        with patch("github_app_auth.requests.Session.post", side_effect=slow_post) as mock_post:
+            threads = [
+                threading.Thread(
+                    target=lambda: tokens.append(auth.get_installation_token("78901234"))
+                )
+                for _ in range(8)
+            ]
+            for t in threads:
+                t.start()
+            for t in threads:
+                t.join()
+
+        assert tokens == ["ghs_shared_token"] * 8
+        assert mock_post.call_count == 1
+
 
 # ---------------------------------------------------------------------------
 # 4. get_authenticated_headers()
@@ -364,7 +438,7 @@ class TestGetAuthenticatedHeaders:
             "expires_at": "2099-01-01T00:00:00Z",
         }
 
-        with patch("github_app_auth.requests.post", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response):
             headers = auth.get_authenticated_headers("78901234")
 
         assert headers["Authorization"] == "Bearer ghs_header_token"
@@ -378,7 +452,7 @@ class TestGetAuthenticatedHeaders:
             "expires_at": "2099-01-01T00:00:00Z",
         }
 
-        with patch("github_app_auth.requests.post", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response):
             headers = auth.get_authenticated_headers("78901234")
 
         assert headers["Accept"] == "application/vnd.github+json"
@@ -392,7 +466,7 @@ class TestGetAuthenticatedHeaders:
             "expires_at": "2099-01-01T00:00:00Z",
         }
 
-        with patch("github_app_auth.requests.post", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.post", return_value=mock_response):
             headers = auth.get_authenticated_headers("78901234")
 
         assert headers["X-GitHub-Api-Version"] == "2022-11-28"
@@ -416,7 +490,7 @@ class TestListInstallations:
         mock_response.status_code = 200
         mock_response.json.return_value = mock_installations
 
-        with patch("github_app_auth.requests.get", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.get", return_value=mock_response):
             result = auth.list_installations()
 
         assert result == mock_installations
@@ -427,7 +501,7 @@ class TestListInstallations:
         mock_response = MagicMock()
         mock_response.status_code = 403
 
-        with patch("github_app_auth.requests.get", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.get", return_value=mock_response):
             with pytest.raises(RuntimeError, match="HTTP 403"):
                 auth.list_installations()
 
@@ -437,7 +511,7 @@ class TestListInstallations:
         mock_response.status_code = 200
         mock_response.json.return_value = []
 
-        with patch("github_app_auth.requests.get", return_value=mock_response):
+        with patch("github_app_auth.requests.Session.get", return_value=mock_response):
             result = auth.list_installations()
 
         assert result == []
@@ -472,9 +546,9 @@ class TestGetInstallationRepos:
 
         token_response = self._mock_token_response()
 
-        with patch("github_app_auth.requests.post", return_value=token_response):
+        with patch("github_app_auth.requests.Session.post", return_value=token_response):
             with patch(
-                "github_app_auth.requests.get", return_value=mock_repos_response
+                "github_app_auth.requests.Session.get", return_value=mock_repos_response
             ):
                 result = auth.get_installation_repos("78901234")
 
@@ -482,34 +556,52 @@ class TestGetInstallationRepos:
         assert len(result) == 2
 
     def test_multi_page_pagination(self, auth):
-        """Follows pagination links to collect repos from multiple pages."""
-        page1_repos = [{"name": "repo1"}]
-        page2_repos = [{"name": "repo2"}]
+        """Requests numbered pages until a short page is returned."""
+        page1_repos = [{"name": f"repo{i}"} for i in range(100)]
+        page2_repos = [{"name": "repo100"}]
 
         page1_response = MagicMock()
         page1_response.status_code = 200
         page1_response.json.return_value = {"repositories": page1_repos}
-        page1_response.links = {
-            "next": {"url": "https://api.github.com/installation/repositories?page=2"}
-        }
 
         page2_response = MagicMock()
         page2_response.status_code = 200
         page2_response.json.return_value = {"repositories": page2_repos}
-        page2_response.links = {}
 
         token_response = self._mock_token_response()
 
-        with patch("github_app_auth.requests.post", return_value=token_response):
+        with patch("github_app_auth.requests.Session.post", return_value=token_response):
             with patch(
-                "github_app_auth.requests.get",
+                "github_app_auth.requests.Session.get",
                 side_effect=[page1_response, page2_response],
-            ):
+            ) as mock_get:
                 result = auth.get_installation_repos("78901234")
 
-        assert len(result) == 2
-        assert result[0]["name"] == "repo1"
-        assert result[1]["name"] == "repo2"
+        assert len(result) == 101
+        assert result[0]["name"] == "repo0"
+        assert result[100]["name"] == "repo100"
+        pages = [c.kwargs["params"] for c in mock_get.call_args_list]
+        assert pages == [{"per_page": 100, "page": 1}, {"per_page": 100, "page": 2}]
+
+    def test_stops_at_total_count_on_full_last_page(self, auth):
+        """No extra request is made once total_count repos have been collected."""
+        full_page = MagicMock()
+        full_page.status_code = 200
+        full_page.json.return_value = {
+            "total_count": 100,
+            "repositories": [{"name": f"repo{i}"} for i in range(100)],
+        }
+
+        token_response = self._mock_token_response()
+
+        with patch("github_app_auth.requests.Session.post", return_value=token_response):
+            with patch(
+                "github_app_auth.requests.Session.get", return_value=full_page
+            ) as mock_get:
+                result = auth.get_installation_repos("78901234")
+
+        assert len(result) == 100
+        assert mock_get.call_count == 1
 
     def test_http_error_raises_runtime_error(self, auth):
         """RuntimeError is raised when the repos API returns an error."""
@@ -518,9 +610,9 @@ class TestGetInstallationRepos:
 
         token_response = self._mock_token_response()
 
-        with patch("github_app_auth.requests.post", return_value=token_response):
+        with patch("github_app_auth.requests.Session.post", return_value=token_response):
             with patch(
-                "github_app_auth.requests.get", return_value=mock_repos_response
+                "github_app_auth.requests.Session.get", return_value=mock_repos_response
             ):
                 with pytest.raises(RuntimeError, match="HTTP 500"):
                     auth.get_installation_repos("78901234")
@@ -534,9 +626,9 @@ class TestGetInstallationRepos:
 
         token_response = self._mock_token_response()
 
-        with patch("github_app_auth.requests.post", return_value=token_response):
+        with patch("github_app_auth.requests.Session.post", return_value=token_response):
             with patch(
-                "github_app_auth.requests.get", return_value=mock_repos_response
+                "github_app_auth.requests.Session.get", return_value=mock_repos_response
             ):
                 result = auth.get_installation_repos("78901234")
 
@@ -629,6 +721,14 @@ class TestVerifyWebhook:
 
         assert result is True
 
+    def test_non_hex_signature_returns_false(self, auth):
+        """A sha256= signature that is not valid hex is rejected, not raised."""
+        payload = b'{"action": "opened"}'
+
+        result = auth.verify_webhook(payload, "sha256=not-hex-at-all")
+
+        assert result is False
+
 
 # ---------------------------------------------------------------------------
 # 8. _get_headers() (internal helper)
@@ -656,6 +756,28 @@ class TestGetHeaders:
         assert headers["X-GitHub-Api-Version"] == "2022-11-28"
 
 
+class TestSessionPooling:
+    """Tests for the shared requests.Session used for GitHub API calls."""
+
+    def test_session_has_pooled_https_adapter(self, auth):
+        """An HTTPAdapter with a sized connection pool is mounted for https."""
+        adapter = auth.session.get_adapter("https://api.github.com")
+
+        assert adapter._pool_maxsize == 20
+
+    def test_requests_reuse_single_session(self, auth):
+        """Successive API calls go through the same session object."""
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = []
+
+        with patch.object(auth.session, "get", return_value=response) as mock_get:
+            auth.list_installations()
+            auth.list_installations()
+
+        assert mock_get.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Fix 1 & 2: Network error handling and retry logic
 # ---------------------------------------------------------------------------
@@ -671,7 +793,7 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.post",
+            "github_app_auth.requests.Session.post",
             side_effect=req.exceptions.ConnectionError("refused"),
         ):
             with pytest.raises(RuntimeError, match="Cannot reach GitHub API"):
@@ -682,7 +804,7 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.post",
+            "github_app_auth.requests.Session.post",
             side_effect=req.exceptions.Timeout(),
         ):
             with pytest.raises(RuntimeError, match="timed out"):
@@ -693,7 +815,7 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.post",
+            "github_app_auth.requests.Session.post",
             side_effect=req.exceptions.RequestException("bad"),
         ):
             with pytest.raises(RuntimeError, match="GitHub API request failed"):
@@ -706,7 +828,7 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.get",
+            "github_app_auth.requests.Session.get",
             side_effect=req.exceptions.ConnectionError("refused"),
         ):
             with pytest.raises(RuntimeError, match="Cannot reach GitHub API"):
@@ -717,7 +839,7 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.get",
+            "github_app_auth.requests.Session.get",
             side_effect=req.exceptions.Timeout(),
         ):
             with pytest.raises(RuntimeError, match="timed out"):
@@ -728,7 +850,7 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.get",
+            "github_app_auth.requests.Session.get",
             side_effect=req.exceptions.RequestException("err"),
         ):
             with pytest.raises(RuntimeError, match="GitHub API request failed"):
@@ -750,10 +872,10 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.post", return_value=self._mock_token_response()
+            "github_app_auth.requests.Session.post", return_value=self._mock_token_response()
         ):
             with patch(
-                "github_app_auth.requests.get",
+                "github_app_auth.requests.Session.get",
                 side_effect=req.exceptions.ConnectionError("refused"),
             ):
                 with pytest.raises(RuntimeError, match="Cannot reach GitHub API"):
@@ -764,10 +886,10 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.post", return_value=self._mock_token_response()
+            "github_app_auth.requests.Session.post", return_value=self._mock_token_response()
         ):
             with patch(
-                "github_app_auth.requests.get",
+                "github_app_auth.requests.Session.get",
                 side_effect=req.exceptions.Timeout(),
             ):
                 with pytest.raises(RuntimeError, match="timed out"):
@@ -778,10 +900,10 @@ class TestNetworkErrorHandling:
         import requests as req
 
         with patch(
-            "github_app_auth.requests.post", return_value=self._mock_token_response()
+            "github_app_auth.requests.Session.post", return_value=self._mock_token_response()
         ):
             with patch(
-                "github_app_auth.requests.get",
+                "github_app_auth.requests.Session.get",
                 side_effect=req.exceptions.RequestException("err"),
             ):
                 with pytest.raises(RuntimeError, match="GitHub API request failed"):
@@ -812,7 +934,7 @@ class TestRetryLogic:
             "expires_at": "2099-01-01T00:00:00Z",
         }
 
-        with patch("github_app_auth.requests.post", side_effect=[rate_limited, rate_limited, success]):
+        with patch("github_app_auth.requests.Session.post", side_effect=[rate_limited, rate_limited, success]):
             with patch("time.sleep"):  # Suppress actual sleep in tests
                 token = auth.get_installation_token("78901234")
 
@@ -830,7 +952,7 @@ class TestRetryLogic:
             "expires_at": "2099-01-01T00:00:00Z",
         }
 
-        with patch("github_app_auth.requests.post", side_effect=[unavailable, success]):
+        with patch("github_app_auth.requests.Session.post", side_effect=[unavailable, success]):
             with patch("time.sleep"):
                 token = auth.get_installation_token("78901234")
 
@@ -841,7 +963,7 @@ class TestRetryLogic:
         rate_limited = MagicMock()
         rate_limited.status_code = 429
 
-        with patch("github_app_auth.requests.post", return_value=rate_limited):
+        with patch("github_app_auth.requests.Session.post", return_value=rate_limited):
             with patch("time.sleep"):
                 with pytest.raises(RuntimeError):
                     auth.get_installation_token("78901234")
@@ -855,7 +977,7 @@ class TestRetryLogic:
         success.status_code = 200
         success.json.return_value = [{"id": 1}]
 
-        with patch("github_app_auth.requests.get", side_effect=[server_error, success]):
+        with patch("github_app_auth.requests.Session.get", side_effect=[server_error, success]):
             with patch("time.sleep"):
                 result = auth.list_installations()
 
@@ -872,10 +994,10 @@ class TestRetryLogic:
         success_repos.links = {}
 
         with patch(
-            "github_app_auth.requests.post", return_value=self._mock_token_response()
+            "github_app_auth.requests.Session.post", return_value=self._mock_token_response()
         ):
             with patch(
-                "github_app_auth.requests.get",
+                "github_app_auth.requests.Session.get",
                 side_effect=[bad_gateway, success_repos],
             ):
                 with patch("time.sleep"):
@@ -15,6 +15,7 @@ import pytest
 from pathlib import Path
 from unittest.mock import patch
 
+import mcp_request_validator
 from mcp_request_validator import MCPRequestValidator, validate_mcp_request
 
 
@@ -103,6 +104,20 @@ class TestPathSafety:
         long_path = str(tmp_path / long_component / "main.tf")
         assert validator_tmp._is_safe_path(long_path) is True
 
+    def test_sibling_dir_sharing_prefix_blocked(self, tmp_path):
+        """A sibling whose name starts with the workspace name is outside it."""
+        workspace = tmp_path / "ws"
+        workspace.mkdir()
+        validator = MCPRequestValidator(workspace_root=str(workspace))
+        assert validator._is_safe_path(str(tmp_path / "ws-evil" / "main.tf")) is False
+
+    def test_symlink_escaping_workspace_blocked(self, validator_tmp, tmp_path_factory):
+        """A symlink inside the workspace pointing outside must be blocked."""
+        outside = tmp_path_factory.mktemp("outside")
+        link = validator_tmp.workspace_root / "escape"
+        link.symlink_to(outside)
+        assert validator_tmp._is_safe_path("escape/main.tf") is False
+
     def test_very_long_traversal_path(self, validator):
         """A very long traversal path should be blocked."""
         traversal = "../" * 100 + "etc/passwd"
@@ -138,6 +153,21 @@ class TestInputSanitization:
         assert valid is False
         assert "Invalid variable name" in msg
 
+    @pytest.mark.parametrize("key", ["_", "-", "__", "_-_", ""])
+    def test_variable_name_of_only_separators_rejected(self, validator, key):
+        """A name needs at least one letter or digit besides '_' and '-'."""
+        valid, msg = validator._validate_terraform_vars({key: "value"})
+        assert valid is False
+        assert "Invalid variable name" in msg
+
+    def test_dangerous_value_among_many_names_its_key(self, validator):
+        """With many clean vars, the one dangerous value is still reported by key."""
+        tf_vars = {f"var_{i}": f"value-{i}" for i in range(50)}
+        tf_vars["var_37"] = "x; rm -rf /"
+        valid, msg = validator._validate_terraform_vars(tf_vars)
+        assert valid is False
+        assert msg == "Variable value contains dangerous characters: var_37"
+
     def test_variable_value_with_shell_metachar_dollar(self, validator):
         """Dollar signs in values should be flagged as dangerous."""
         valid, msg = validator._validate_terraform_vars({"key": "$(rm -rf /)"})
@@ -291,6 +321,13 @@ class TestTerryToolValidation:
             "params": {"name": "terry", "arguments": arguments},
         }
 
+    def test_action_sets_are_shared_frozensets(self, validator, validator_tmp):
+        """Action allow/block lists are immutable and shared by all instances."""
+        assert isinstance(validator.allowed_terraform_actions, frozenset)
+        assert isinstance(validator.blocked_terraform_actions, frozenset)
+        assert validator.allowed_terraform_actions is validator_tmp.allowed_terraform_actions
+        assert not (validator.allowed_terraform_actions & validator.blocked_terraform_actions)
+
     def test_valid_init_request(self, validator_tmp, tmp_path):
         """A well-formed init request should pass."""
         valid, msg = validator_tmp.validate_request(
@@ -463,6 +500,18 @@ class TestTerryToolValidation:
         assert valid is False
         assert "destroy is blocked" in msg
 
+    def test_blocked_flags_rejected_before_path_resolution(self, validator_tmp):
+        """Blocked flags should short-circuit without touching the filesystem."""
+        with patch("mcp_request_validator.os.path.realpath") as mock_realpath:
+            valid, msg = validator_tmp.validate_request(
+                self._make_request(
+                    {"path": "/etc", "actions": ["apply"], "destroy": True}
+                )
+            )
+        assert valid is False
+        assert "destroy is blocked" in msg
+        mock_realpath.assert_not_called()
+
     def test_auto_approve_false_allowed(self, validator_tmp, tmp_path):
         """auto_approve=False should not trigger the block."""
         valid, msg = validator_tmp.validate_request(
@@ -875,6 +924,17 @@ class TestConvenienceFunction:
         assert valid is False
 
 
+    def test_validator_reused_per_workspace_root(self, tmp_path):
+        """Repeated calls should reuse one validator per workspace root."""
+        first = mcp_request_validator._get_validator(str(tmp_path))
+        again = mcp_request_validator._get_validator(str(tmp_path))
+        other = mcp_request_validator._get_validator(str(tmp_path / "other"))
+
+        assert first is again
+        assert other is not first
+        assert other.workspace_root == tmp_path / "other"
+
+
 # ---------------------------------------------------------------------------
 # 9. Dangerous Characters Pattern Coverage
 # ---------------------------------------------------------------------------
@@ -1027,3 +1087,22 @@ class TestToolRouting:
                 "terry_file_read",
                 {"file_path": "/mnt/workspace/main.tf"},
             )
+
+    def test_route_resolved_once_per_tool_name(self, validator):
+        """Prefix resolution should be remembered for repeated tool names."""
+        request = {
+            "method": "tools/call",
+            "params": {"name": "github_list_repos", "arguments": {"owner": "x"}},
+        }
+        validator.validate_request(request)
+        validator.validate_request(request)
+
+        assert validator._routes == {"github_list_repos": "_validate_github_request"}
+
+    def test_route_cache_is_bounded(self, validator):
+        """Arbitrary client-supplied tool names must not grow the cache forever."""
+        for i in range(1000):
+            validator.validate_request(
+                {"method": "tools/call", "params": {"name": f"x_{i}", "arguments": {}}}
+            )
+        assert len(validator._routes) <= 256
@@ -15,6 +15,7 @@ import asyncio
 import json
 import logging
 import sys
+import threading
 import time
 import types
 from concurrent.futures import ThreadPoolExecutor
@@ -462,6 +463,25 @@ class TestValidateSafePath:
         sub.mkdir(parents=True, exist_ok=True)
         assert validate_safe_path("a/b/../../c", workspace_root=str(tmp_path)) is True
 
+    def test_workspace_root_resolved_once(self, tmp_path):
+        """Repeated checks against one root reuse its resolved form."""
+        resolved_root = validate_safe_path.__globals__["_resolved_workspace_root"]
+
+        resolved_root.cache_clear()
+        validate_safe_path("a.tf", workspace_root=str(tmp_path))
+        validate_safe_path("b.tf", workspace_root=str(tmp_path))
+        info = resolved_root.cache_info()
+        assert (info.misses, info.hits) == (1, 1)
+
+    def test_symlink_swapped_after_check_is_rejected(self, tmp_path):
+        """Per-path results aren't cached: a later escaping symlink is caught."""
+        root = tmp_path / "ws"
+        root.mkdir()
+        assert validate_safe_path("link", workspace_root=str(root)) is True
+
+        (root / "link").symlink_to("/etc")
+        assert validate_safe_path("link", workspace_root=str(root)) is False
+
 
 # ---------------------------------------------------------------------------
 # 6. _pre_validate
@@ -681,13 +701,91 @@ class TestValidateRequestDecorator:
             def my_tool(path: str = "."):
                 return {"result": "success"}
 
-            result = my_tool(path="github://test/repo")
+            result = asyncio.run(my_tool(path="github://test/repo"))
             assert result["result"] == "success"
             assert "_rate_limit" in result
             assert "_auth" in result
         finally:
             self._teardown(mod, saved)
 
+    def test_sync_function_runs_off_event_loop_thread(self, monkeypatch):
+        """Sync tool bodies are awaited through a worker thread."""
+        mod, saved = self._setup_open_auth(monkeypatch)
+
+        try:
+            @validate_request("terry_validate")
+            def my_tool():
+                return {"thread": threading.current_thread().name}
+
+            assert asyncio.iscoroutinefunction(my_tool)
+            result = asyncio.run(my_tool())
+            assert result["thread"].startswith("terry-tool")
+        finally:
+            self._teardown(mod, saved)
+
+    def test_sync_tools_bounded_by_shared_pool(self, monkeypatch):
+        """Sync tool bodies never run more than the pool's worker count at once."""
+        mod, saved = self._setup_open_auth(monkeypatch)
+        running = 0
+        peak = 0
+        counter_lock = threading.Lock()
+
+        pool = ThreadPoolExecutor(max_workers=2)
+
+        try:
+            monkeypatch.setitem(validate_request.__globals__, "_TOOL_EXECUTOR", pool)
+
+            @validate_request("terry_validate")
+            def slow_tool():
+                nonlocal running, peak
+                with counter_lock:
+                    running += 1
+                    peak = max(peak, running)
+                time.sleep(0.05)
+                with counter_lock:
+                    running -= 1
+                return {}
+
+            async def burst():
+                await asyncio.gather(*(slow_tool() for _ in range(6)))
+
+            asyncio.run(burst())
+            assert peak == 2
+        finally:
+            pool.shutdown(wait=True)
+            self._teardown(mod, saved)
+
+    def test_path_checks_follow_tool_signature(self, monkeypatch):
+        """Only path arguments the tool accepts are checked; they still reject escapes."""
+        mod, saved = self._setup_open_auth(monkeypatch)
+        checked = []
+        real_check = validate_request.__globals__["validate_safe_path"]
+
+        def spy(path, *args, **kwargs):
+            checked.append(path)
+            return real_check(path, *args, **kwargs)
+
+        monkeypatch.setitem(validate_request.__globals__, "validate_safe_path", spy)
+        monkeypatch.setitem(validate_request.__globals__, "request_validator", None)
+
+        try:
+            @validate_request("terry_validate")
+            def file_tool(file_path: str = "."):
+                return {"ok": True}
+
+            result = asyncio.run(file_tool(file_path="../../etc/passwd"))
+            assert "Invalid file_path" in result["error"]
+
+            @validate_request("terry_version")
+            def no_path_tool():
+                return {"ok": True}
+
+            checked.clear()
+            assert asyncio.run(no_path_tool())["ok"] is True
+            assert checked == []
+        finally:
+            self._teardown(mod, saved)
+
     def test_wraps_async_function(self, monkeypatch):
         """The decorator wraps an async function and injects metadata."""
         mod, saved = self._setup_open_auth(monkeypatch)
@@ -719,7 +817,7 @@ class TestValidateRequestDecorator:
             def guarded_tool(api_key: str = ""):
                 return {"should": "not reach"}
 
-            result = guarded_tool(api_key="wrong-key")
+            result = asyncio.run(guarded_tool(api_key="wrong-key"))
             assert "error" in result
             assert "Authentication" in result["error"]
         finally:
@@ -737,7 +835,7 @@ class TestValidateRequestDecorator:
             def failing_tool():
                 raise RuntimeError("boom")
 
-            result = failing_tool()
+            result = asyncio.run(failing_tool())
             assert "error" in result
             assert "execution failed" in result["error"]
         finally:
@@ -795,7 +893,7 @@ class TestValidateRequestDecorator:
             def string_tool():
                 return "v3.1.0"
 
-            result = string_tool()
+            result = asyncio.run(string_tool())
             assert result == "v3.1.0"
         finally:
             self._teardown(mod, saved)
@@ -813,7 +911,7 @@ class TestValidateRequestDecorator:
             for _ in range(20):
                 mod.rate_limiter.is_allowed("terry_validate")
 
-            result = limited_tool()
+            result = asyncio.run(limited_tool())
             assert "error" in result
             assert "Rate limit" in result["error"]
         finally:
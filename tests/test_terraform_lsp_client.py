@@ -936,6 +936,61 @@ class TestFormatDocument:
         assert params["options"]["tabSize"] == 2
         assert params["options"]["insertSpaces"] is True
 
+    @pytest.mark.asyncio
+    async def test_did_open_pipelined_with_formatting(self, initialized_client, tmp_path):
+        """didOpen is buffered and flushed by the formatting request, with no settle sleep."""
+        client = initialized_client
+        client.workspace_root = tmp_path
+
+        target = tmp_path / "main.tf"
+        target.write_text("# test")
+
+        client._read_response = AsyncMock(
+            return_value={"jsonrpc": "2.0", "id": 1, "result": []}
+        )
+
+        with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
+            result = await client.format_document(str(target))
+
+        assert result == {"success": True, "edits": []}
+        mock_sleep.assert_not_called()
+        stdin = client.terraform_ls_process.stdin
+        methods = [
+            json.loads(c[0][0].decode("utf-8").split("\r\n\r\n", 1)[1])["method"]
+            for c in stdin.write.call_args_list
+        ]
+        assert methods == [
+            "textDocument/didOpen",
+            "textDocument/formatting",
+            "textDocument/didClose",
+        ]
+        # One drain for the request (covering didOpen) and one for didClose
+        assert stdin.drain.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_unchanged_file_reuses_previous_edits(self, initialized_client, tmp_path):
+        """A second format of identical content skips terraform-ls entirely."""
+        client = initialized_client
+        client.workspace_root = tmp_path
+
+        target = tmp_path / "main.tf"
+        target.write_text("# test")
+
+        edits = [{"range": {}, "newText": "# test\n"}]
+        client._send_notification = AsyncMock()
+        client._send_request = AsyncMock(
+            return_value={"jsonrpc": "2.0", "id": 1, "result": edits}
+        )
+
+        first = await client.format_document(str(target))
+        second = await client.format_document(str(target))
+        assert first == second == {"success": True, "edits": edits}
+        assert client._send_request.await_count == 1
+
+        target.write_text("# changed")
+        await client.format_document(str(target))
+        assert client._send_request.await_count == 2
+
     @pytest.mark.asyncio
     async def test_no_result_returns_empty_edits(self, initialized_client, tmp_path):
         """When LSP response has no 'result' key, should return empty edits."""
@@ -1054,17 +1109,16 @@ class TestStartTerraformLs:
     @pytest.mark.asyncio
     async def test_returns_false_when_binary_not_found(self, client, tmp_path):
         """Should return False when terraform-ls binary is not in PATH."""
-        with patch("subprocess.run") as mock_run:
-            mock_run.return_value = MagicMock(returncode=1, stdout="", stderr="")
+        with patch("shutil.which", return_value=None), patch("subprocess.run") as mock_run:
             result = await client.start_terraform_ls(str(tmp_path))
 
         assert result is False
         assert "not found" in client.initialization_error
+        mock_run.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_returns_false_when_process_exits_immediately(self, client, tmp_path):
         """Should return False if terraform-ls process exits right away."""
-        mock_which = MagicMock(returncode=0, stdout="/usr/bin/terraform-ls\n")
         mock_version = MagicMock(returncode=0, stdout="0.38.5\n")
 
         mock_process = MagicMock()
@@ -1072,7 +1126,8 @@ class TestStartTerraformLs:
         mock_process.stderr = MagicMock()
         mock_process.stderr.read = AsyncMock(return_value=b"some error")
 
-        with patch("subprocess.run", side_effect=[mock_which, mock_version]):
+        with patch("shutil.which", return_value="/usr/bin/terraform-ls"), \
+                patch("subprocess.run", side_effect=[mock_version]):
             with patch("asyncio.create_subprocess_exec", return_value=mock_process):
                 with patch("asyncio.sleep", new_callable=AsyncMock):
                     result = await client.start_terraform_ls(str(tmp_path))
@@ -1083,13 +1138,13 @@ class TestStartTerraformLs:
     @pytest.mark.asyncio
     async def test_calls_initialize_on_successful_start(self, client, tmp_path):
         """Should call _initialize when process starts successfully."""
-        mock_which = MagicMock(returncode=0, stdout="/usr/bin/terraform-ls\n")
         mock_version = MagicMock(returncode=0, stdout="0.38.5\n")
 
         mock_process = MagicMock()
         mock_process.returncode = None  # Still running
 
-        with patch("subprocess.run", side_effect=[mock_which, mock_version]):
+        with patch("shutil.which", return_value="/usr/bin/terraform-ls"), \
+                patch("subprocess.run", side_effect=[mock_version]):
             with patch("asyncio.create_subprocess_exec", return_value=mock_process):
                 with patch("asyncio.sleep", new_callable=AsyncMock):
                     with patch.object(
@@ -1104,13 +1159,13 @@ class TestStartTerraformLs:
     @pytest.mark.asyncio
     async def test_returns_false_when_initialize_fails(self, client, tmp_path):
         """Should return False when _initialize returns False."""
-        mock_which = MagicMock(returncode=0, stdout="/usr/bin/terraform-ls\n")
         mock_version = MagicMock(returncode=0, stdout="0.38.5\n")
 
         mock_process = MagicMock()
         mock_process.returncode = None
 
-        with patch("subprocess.run", side_effect=[mock_which, mock_version]):
+        with patch("shutil.which", return_value="/usr/bin/terraform-ls"), \
+                patch("subprocess.run", side_effect=[mock_version]):
             with patch("asyncio.create_subprocess_exec", return_value=mock_process):
                 with patch("asyncio.sleep", new_callable=AsyncMock):
                     with patch.object(
@@ -1315,6 +1370,40 @@ class TestGetLspClient:
             with pytest.raises(RuntimeError, match="terraform-ls binary not found"):
                 await self.get_lsp_client(str(tmp_path))
 
+    @pytest.mark.asyncio
+    async def test_warm_client_returned_without_lock(self):
+        """An initialized client is returned even while the lock is held."""
+        client = self.TerraformLSPClient()
+        client.initialized = True
+        self.mod._lsp_client = client
+
+        async with self.mod._lsp_client_lock:
+            result = await asyncio.wait_for(self.get_lsp_client("/ws"), timeout=1)
+
+        assert result is client
+
+    @pytest.mark.asyncio
+    async def test_callers_racing_startup_share_one_start(self, tmp_path):
+        """Concurrent first calls wait for the in-flight start instead of spawning again."""
+        starts = []
+
+        async def mock_start(workspace_path):
+            starts.append(workspace_path)
+            await asyncio.sleep(0.01)
+            self.mod._lsp_client.initialized = True
+            return True
+
+        with patch.object(
+            self.TerraformLSPClient, "start_terraform_ls", side_effect=mock_start
+        ):
+            results = await asyncio.gather(
+                *(self.get_lsp_client(str(tmp_path)) for _ in range(3))
+            )
+
+        assert len(starts) == 1
+        assert results[0] is results[1] is results[2]
+        assert results[0].initialized
+
     @pytest.mark.asyncio
     async def test_concurrent_access_returns_same_instance(self):
         """Multiple concurrent calls should safely return the same instance."""
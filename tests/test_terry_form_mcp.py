@@ -131,6 +131,14 @@ class TestBuildTerraformCommand:
         cmd = build_terraform_command("version")
         assert cmd == ["terraform", "version", "-json"]
 
+    def test_returned_command_is_independent_copy(self):
+        """Mutating a returned command must not leak into later calls."""
+        cmd = build_terraform_command("plan", var_file="/tmp/a.tfvars.json")
+        cmd.append("-destroy")
+        assert build_terraform_command("plan") == [
+            "terraform", "plan", "-input=false", "-no-color", "-out=tfplan"
+        ]
+
     # -- All commands start with 'terraform' --------------------------------
 
     @pytest.mark.parametrize(
@@ -501,8 +509,8 @@ class TestRunTerraform:
         """Successful init returns success=True with exit_code=0."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="Terraform has been successfully initialized!",
-            stderr="",
+            stdout=b"Terraform has been successfully initialized!",
+            stderr=b"",
         )
         result = run_terraform(workspace, "init")
 
@@ -517,8 +525,8 @@ class TestRunTerraform:
         """Successful validate returns expected structure."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="Success! The configuration is valid.",
-            stderr="",
+            stdout=b"Success! The configuration is valid.",
+            stderr=b"",
         )
         result = run_terraform(workspace, "validate")
 
@@ -530,8 +538,8 @@ class TestRunTerraform:
         """Successful fmt returns expected structure."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="",
-            stderr="",
+            stdout=b"",
+            stderr=b"",
         )
         result = run_terraform(workspace, "fmt")
 
@@ -545,8 +553,8 @@ class TestRunTerraform:
         """Failed validate returns success=False with nonzero exit_code."""
         mock_run.return_value = MagicMock(
             returncode=1,
-            stdout="",
-            stderr="Error: Missing required argument",
+            stdout=b"",
+            stderr=b"Error: Missing required argument",
         )
         result = run_terraform(workspace, "validate")
 
@@ -554,6 +562,19 @@ class TestRunTerraform:
         assert result["exit_code"] == 1
         assert "Missing required argument" in result["stderr"]
 
+    @patch("terry_form_mcp.subprocess.run")
+    def test_output_captured_as_bytes_and_decoded(self, mock_run, workspace):
+        """Pipes are read as bytes; invalid UTF-8 is replaced, not raised."""
+        mock_run.return_value = MagicMock(
+            returncode=0,
+            stdout=b"ok \xff",
+            stderr=b"",
+        )
+        result = run_terraform(workspace, "init")
+
+        assert "text" not in mock_run.call_args[1]
+        assert result["stdout"] == "ok \ufffd"
+
     # -- Invalid / destructive actions are blocked ----------------------------
 
     def test_apply_action_returns_failure(self, workspace):
@@ -578,7 +599,7 @@ class TestRunTerraform:
     def test_env_vars_set_correctly(self, mock_run, workspace):
         """Subprocess is called with controlled environment containing forced vars."""
         mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
+            returncode=0, stdout=b"", stderr=b""
         )
         run_terraform(workspace, "init")
 
@@ -593,7 +614,7 @@ class TestRunTerraform:
     def test_subprocess_called_with_shell_false(self, mock_run, workspace):
         """Subprocess is called with a list command (shell=False by default)."""
         mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
+            returncode=0, stdout=b"", stderr=b""
         )
         run_terraform(workspace, "init")
 
@@ -608,7 +629,7 @@ class TestRunTerraform:
     def test_cwd_set_to_workspace(self, mock_run, workspace):
         """Subprocess runs in the specified workspace directory."""
         mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
+            returncode=0, stdout=b"", stderr=b""
         )
         run_terraform(workspace, "validate")
 
@@ -650,7 +671,7 @@ class TestRunTerraform:
         import terry_form_mcp as _tfm
         monkeypatch.setattr(_tfm, "DEFAULT_TIMEOUT", 60)
         mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
+            returncode=0, stdout=b"", stderr=b""
         )
         run_terraform(workspace, "init")
 
@@ -662,7 +683,7 @@ class TestRunTerraform:
         """Default timeout is 300 seconds when MAX_OPERATION_TIMEOUT is not set."""
         monkeypatch.delenv("MAX_OPERATION_TIMEOUT", raising=False)
         mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
+            returncode=0, stdout=b"", stderr=b""
         )
         run_terraform(workspace, "init")
 
@@ -707,7 +728,7 @@ class TestRunTerraform:
     def test_response_contains_required_keys(self, mock_run, workspace):
         """Response dict always contains action, success, exit_code, stdout, stderr, duration."""
         mock_run.return_value = MagicMock(
-            returncode=0, stdout="ok", stderr=""
+            returncode=0, stdout=b"ok", stderr=b""
         )
         result = run_terraform(workspace, "init")
 
@@ -718,7 +739,7 @@ class TestRunTerraform:
     def test_duration_is_non_negative(self, mock_run, workspace):
         """Duration should be a non-negative float."""
         mock_run.return_value = MagicMock(
-            returncode=0, stdout="", stderr=""
+            returncode=0, stdout=b"", stderr=b""
         )
         result = run_terraform(workspace, "init")
         assert result["duration"] >= 0.0
@@ -731,8 +752,8 @@ class TestRunTerraform:
         """Plan action includes plan_summary when parse_plan_output succeeds."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="Plan: 2 to add, 0 to change, 0 to destroy.",
-            stderr="",
+            stdout=b"Plan: 2 to add, 0 to change, 0 to destroy.",
+            stderr=b"",
         )
         mock_parse.return_value = {
             "plan_summary": {"add": 2, "change": 0, "destroy": 0},
@@ -762,8 +783,8 @@ class TestRunTerraform:
         """Plan action falls back to text parsing when parse_plan_output returns None."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="Plan: 1 to add, 0 to change, 0 to destroy.",
-            stderr="",
+            stdout=b"Plan: 1 to add, 0 to change, 0 to destroy.",
+            stderr=b"",
         )
         mock_parse.return_value = None
 
@@ -777,8 +798,8 @@ class TestRunTerraform:
         """Plan action with vars creates a temporary var file and cleans it up."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="No changes.",
-            stderr="",
+            stdout=b"No changes.",
+            stderr=b"",
         )
         # Patch parse_plan_output to avoid secondary subprocess call
         with patch.object(terry_form_mcp, "parse_plan_output", return_value=None):
@@ -800,8 +821,8 @@ class TestRunTerraform:
         }
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout=json.dumps(version_json),
-            stderr="",
+            stdout=json.dumps(version_json).encode(),
+            stderr=b"",
         )
         result = run_terraform(workspace, "version")
 
@@ -814,8 +835,8 @@ class TestRunTerraform:
         """Version action handles invalid JSON gracefully (no crash)."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="Terraform v1.12.0\non linux_amd64",
-            stderr="",
+            stdout=b"Terraform v1.12.0\non linux_amd64",
+            stderr=b"",
         )
         result = run_terraform(workspace, "version")
 
@@ -835,8 +856,8 @@ class TestRunTerraform:
         }
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout=json.dumps(state_json),
-            stderr="",
+            stdout=json.dumps(state_json).encode(),
+            stderr=b"",
         )
         result = run_terraform(workspace, "show")
 
@@ -848,8 +869,8 @@ class TestRunTerraform:
         """Show action handles invalid JSON gracefully."""
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="No state file found.",
-            stderr="",
+            stdout=b"No state file found.",
+            stderr=b"",
         )
         result = run_terraform(workspace, "show")
 
@@ -867,8 +888,8 @@ class TestRunTerraform:
 
         mock_run.return_value = MagicMock(
             returncode=0,
-            stdout="No changes.",
-            stderr="",
+            stdout=b"No changes.",
+            stderr=b"",
         )
         with patch.object(terry_form_mcp, "parse_plan_output", return_value=None):
             run_terraform(workspace, "plan")
@@ -876,6 +897,24 @@ class TestRunTerraform:
         # Plan file should have been cleaned up
         assert not plan_file.exists()
 
+    @patch("terry_form_mcp.subprocess.run")
+    def test_stale_plan_symlink_removed_before_plan(self, mock_run, workspace, tmp_path_factory):
+        """An existing tfplan entry is unlinked before terraform writes a new one."""
+        outside = tmp_path_factory.mktemp("outside") / "target"
+        outside.write_text("untouched")
+        plan_file = Path(workspace) / "tfplan"
+        plan_file.symlink_to(outside)
+
+        def fake_run(*args, **kwargs):
+            assert not os.path.lexists(plan_file)
+            return MagicMock(returncode=0, stdout=b"No changes.", stderr=b"")
+
+        mock_run.side_effect = fake_run
+        with patch.object(terry_form_mcp, "parse_plan_output", return_value=None):
+            run_terraform(workspace, "plan")
+
+        assert outside.read_text() == "untouched"
+
 
 # ---------------------------------------------------------------------------
 # 7. Module-level constants
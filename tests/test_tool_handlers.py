@@ -20,6 +20,7 @@ NOTE: tf_cloud_* tools are excluded — they have been removed from the server.
 
 import asyncio
 import sys
+import threading
 import types
 from unittest.mock import AsyncMock, MagicMock, patch
 
@@ -158,6 +159,19 @@ def _inner(fn):
     return getattr(fn, "__wrapped__", fn)
 
 
+def _run_by_command(responses):
+    """subprocess.run side_effect keyed on the first two argv items.
+
+    Probes that run concurrently get their own result regardless of the
+    order the calls happen to land in.
+    """
+
+    def fake_run(cmd, *args, **kwargs):
+        return responses[tuple(cmd[:2])]
+
+    return fake_run
+
+
 WORKSPACE = _srv.WORKSPACE_ROOT  # "/mnt/workspace" or override
 
 
@@ -173,7 +187,7 @@ class TestTerry:
         """When actions is not supplied the handler defaults to ['plan']."""
         mock_run = MagicMock(return_value={"status": "ok"})
         with patch.object(_srv.terry_form, "run_terraform", mock_run):
-            result = _inner(_srv.terry)(path="myproject")
+            result = run(_inner(_srv.terry)(path="myproject"))
 
         mock_run.assert_called_once()
         call_args = mock_run.call_args
@@ -183,7 +197,7 @@ class TestTerry:
         """A single named action is forwarded to run_terraform."""
         mock_run = MagicMock(return_value={"status": "ok"})
         with patch.object(_srv.terry_form, "run_terraform", mock_run):
-            result = _inner(_srv.terry)(path="myproject", actions=["validate"])
+            result = run(_inner(_srv.terry)(path="myproject", actions=["validate"]))
 
         mock_run.assert_called_once()
         assert mock_run.call_args[0][1] == "validate"
@@ -192,7 +206,7 @@ class TestTerry:
         """Multiple actions each produce a separate run_terraform call."""
         mock_run = MagicMock(return_value={"status": "ok"})
         with patch.object(_srv.terry_form, "run_terraform", mock_run):
-            result = _inner(_srv.terry)(path="myproject", actions=["init", "validate", "plan"])
+            result = run(_inner(_srv.terry)(path="myproject", actions=["init", "validate", "plan"]))
 
         assert mock_run.call_count == 3
         actions_called = [call[0][1] for call in mock_run.call_args_list]
@@ -203,7 +217,7 @@ class TestTerry:
         mock_run = MagicMock(return_value={})
         tf_vars = {"env": "prod"}
         with patch.object(_srv.terry_form, "run_terraform", mock_run):
-            _inner(_srv.terry)(path="myproject", actions=["init", "plan"], tf_vars=tf_vars)
+            run(_inner(_srv.terry)(path="myproject", actions=["init", "plan"], tf_vars=tf_vars))
 
         calls = mock_run.call_args_list
         # init call — tf_vars argument should be None
@@ -215,7 +229,7 @@ class TestTerry:
         """Each action's result is collected and returned under 'terry-results'."""
         mock_run = MagicMock(return_value={"output": "ok"})
         with patch.object(_srv.terry_form, "run_terraform", mock_run):
-            result = _inner(_srv.terry)(path="myproject", actions=["plan", "validate"])
+            result = run(_inner(_srv.terry)(path="myproject", actions=["plan", "validate"]))
 
         assert "terry-results" in result
         assert len(result["terry-results"]) == 2
@@ -224,7 +238,7 @@ class TestTerry:
         """An explicitly empty actions list produces no run_terraform calls."""
         mock_run = MagicMock(return_value={})
         with patch.object(_srv.terry_form, "run_terraform", mock_run):
-            result = _inner(_srv.terry)(path="myproject", actions=[])
+            result = run(_inner(_srv.terry)(path="myproject", actions=[]))
 
         mock_run.assert_not_called()
         assert result["terry-results"] == []
@@ -233,11 +247,61 @@ class TestTerry:
         """The full path passed to run_terraform is WORKSPACE_ROOT / path."""
         mock_run = MagicMock(return_value={})
         with patch.object(_srv.terry_form, "run_terraform", mock_run):
-            _inner(_srv.terry)(path="subdir/project", actions=["plan"])
+            run(_inner(_srv.terry)(path="subdir/project", actions=["plan"]))
 
         expected_path = f"{WORKSPACE}/subdir/project"
         assert mock_run.call_args[0][0] == expected_path
 
+    def test_read_only_actions_overlap_between_write_barriers(self):
+        """validate/fmt run together; init finishes first, plan starts after."""
+        both_started = threading.Barrier(2, timeout=5)
+        events = []
+        events_lock = threading.Lock()
+
+        def fake_run(path, action, tf_vars):
+            with events_lock:
+                events.append(("start", action))
+            if action in ("validate", "fmt"):
+                both_started.wait()
+            with events_lock:
+                events.append(("end", action))
+            return {"action": action}
+
+        with patch.object(_srv.terry_form, "run_terraform", side_effect=fake_run):
+            result = run(_inner(_srv.terry)(
+                path="p", actions=["init", "validate", "fmt", "plan"]
+            ))
+
+        assert [r["action"] for r in result["terry-results"]] == [
+            "init", "validate", "fmt", "plan",
+        ]
+        assert events[:2] == [("start", "init"), ("end", "init")]
+        assert events[-2:] == [("start", "plan"), ("end", "plan")]
+
+    def test_consecutive_write_actions_run_in_order(self):
+        """init and plan never overlap, even back to back."""
+        mock_run = MagicMock(side_effect=lambda p, a, v: {"action": a})
+        with patch.object(_srv.terry_form, "run_terraform", mock_run):
+            result = run(_inner(_srv.terry)(path="p", actions=["plan", "init", "plan"]))
+
+        assert [c[0][1] for c in mock_run.call_args_list] == ["plan", "init", "plan"]
+        assert [r["action"] for r in result["terry-results"]] == ["plan", "init", "plan"]
+
+    def test_runs_off_the_event_loop_on_tool_pool(self):
+        """terry is a coroutine and each action runs on the shared tool pool."""
+        threads = []
+
+        def fake_run(path, action, tf_vars):
+            threads.append(threading.current_thread().name)
+            return {"action": action}
+
+        assert asyncio.iscoroutinefunction(_inner(_srv.terry))
+        with patch.object(_srv.terry_form, "run_terraform", side_effect=fake_run):
+            run(_inner(_srv.terry)(path="p", actions=["init", "validate", "plan"]))
+
+        assert len(threads) == 3
+        assert all(name.startswith("terry-tool") for name in threads)
+
 
 # ---------------------------------------------------------------------------
 # 2. terry_workspace_list()
@@ -372,6 +436,92 @@ class TestTerryWorkspaceList:
 
         assert result["workspaces"][0]["initialized"] is False
 
+    def test_nested_workspaces_listed_top_down_and_skip_dirs_pruned(self, tmp_path):
+        """Nested projects are found in walk order; skipped dirs are not entered."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "a" / "main.tf").write_text("")
+        (tmp_path / "a" / "b" / "main.tf").write_text("")
+        for skipped in ("node_modules", "__pycache__", ".hidden"):
+            (tmp_path / skipped).mkdir()
+            (tmp_path / skipped / "main.tf").write_text("")
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_workspace_list)()
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert [w["path"] for w in result["workspaces"]] == ["a", "a/b"]
+
+    def test_directory_symlinks_not_followed(self, tmp_path):
+        """A symlink to a directory is not descended into."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        (outside / "main.tf").write_text("")
+        root = tmp_path / "root"
+        root.mkdir()
+        (root / "link").symlink_to(outside, target_is_directory=True)
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(root)
+        try:
+            result = _inner(_srv.terry_workspace_list)()
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert result["workspaces"] == []
+
+    def test_state_and_oversized_file_from_single_scan(self, tmp_path):
+        """has_state comes from the listing; oversized files are not parsed."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_text('provider "aws" {}')
+        (proj / "terraform.tfstate").write_text("{}")
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            with patch.object(_srv, "_MAX_TF_FILE_SIZE", 5):
+                result = _inner(_srv.terry_workspace_list)()
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        ws = result["workspaces"][0]
+        assert ws["has_state"] is True
+        assert ws["providers"] == []
+        assert ws["last_modified"] is not None
+
+    def test_modules_counted_and_non_utf8_bytes_tolerated(self, tmp_path):
+        """Scanning works on raw bytes, so stray non-UTF-8 bytes don't hide a file."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_bytes(
+            b'# \xff\xfe\nprovider "aws" {}\nmodule "a" {}\nmodule "b" {}\n'
+        )
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_workspace_list)()
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        ws = result["workspaces"][0]
+        assert ws["providers"] == ["aws"]
+        assert ws["modules"] == 2
+
+    def test_missing_workspace_root_returns_empty_list(self, tmp_path):
+        """A workspace root that does not exist yields no workspaces."""
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path / "missing")
+        try:
+            result = _inner(_srv.terry_workspace_list)()
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert result == {"workspaces": []}
+
 
 # ---------------------------------------------------------------------------
 # 3. terry_workspace_info()
@@ -456,6 +606,51 @@ class TestTerryWorkspaceInfo:
         assert "main.tf" in tf_files
         assert "variables.tf" in tf_files
 
+    def test_common_files_and_state_from_directory_listing(self, tmp_path):
+        """common_files, tfvars and state presence all come from the listing."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_text("")
+        (proj / "versions.tf").write_text("")
+        (proj / "prod.tfvars").write_text("")
+        (proj / "terraform.tfstate").write_text("{}")
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_workspace_info)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        ws = result["terry-workspace"]
+        assert sorted(ws["terraform_files"]) == ["main.tf", "prod.tfvars", "versions.tf"]
+        assert ws["terraform_state"]["state_file_exists"] is True
+        assert ws["common_files"] == {
+            "main.tf": True,
+            "variables.tf": False,
+            "outputs.tf": False,
+            "providers.tf": False,
+            "terraform.tf": False,
+            "versions.tf": True,
+        }
+        assert ws["lsp_readiness"]["has_main_tf"] is True
+
+    def test_file_path_reports_no_terraform_files(self, tmp_path):
+        """Pointing at a file (not a directory) reports nothing present."""
+        (tmp_path / "main.tf").write_text("")
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_workspace_info)(path="main.tf")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        ws = result["terry-workspace"]
+        assert ws["path_info"]["is_directory"] is False
+        assert ws["terraform_files"] == []
+        assert not any(ws["common_files"].values())
+
 
 # ---------------------------------------------------------------------------
 # 4. terry_workspace_setup()
@@ -510,6 +705,24 @@ class TestTerryWorkspaceSetup:
         assert "main.tf" not in setup["created_files"]
         assert (proj / "main.tf").read_text() == existing_content
 
+    def test_dangling_symlink_not_written_through(self, tmp_path):
+        """A dangling main.tf symlink counts as existing; its target isn't created."""
+        proj = tmp_path / "linked"
+        proj.mkdir()
+        target = tmp_path / "elsewhere.tf"
+        (proj / "main.tf").symlink_to(target)
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_workspace_setup)(path="linked")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        setup = result["terry-workspace-setup"]
+        assert setup["created_files"] == ["variables.tf", "outputs.tf"]
+        assert not target.exists()
+
     def test_invalid_project_name_rejected(self, tmp_path):
         """A project name with special characters returns an error."""
         original_root = _srv.WORKSPACE_ROOT
@@ -627,6 +840,119 @@ class TestTerraformValidateLsp:
         assert "error" in result["terraform-ls-validation"]
 
 
+    def test_memoized_path_resolution_tracks_workspace_root(self, tmp_path):
+        """Repeated resolutions hit the cache but still follow WORKSPACE_ROOT."""
+        original_root = _srv.WORKSPACE_ROOT
+        try:
+            _srv.WORKSPACE_ROOT = str(tmp_path / "a")
+            first = _srv._resolve_lsp_paths("main.tf", "ws")
+            hits = _srv._join_lsp_paths.cache_info().hits
+            assert _srv._resolve_lsp_paths("main.tf", "ws") == first
+            assert _srv._join_lsp_paths.cache_info().hits == hits + 1
+
+            _srv.WORKSPACE_ROOT = str(tmp_path / "b")
+            moved = _srv._resolve_lsp_paths("main.tf", "ws")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert first == (str(tmp_path / "a" / "ws" / "main.tf"), str(tmp_path / "a" / "ws"))
+        assert moved == (str(tmp_path / "b" / "ws" / "main.tf"), str(tmp_path / "b" / "ws"))
+
+    def test_concurrent_calls_share_one_validation(self, tmp_path):
+        """Identical validate calls in flight together hit terraform-ls once."""
+        tf_file = tmp_path / "main.tf"
+        tf_file.write_text("terraform {}")
+        calls = []
+
+        async def validate_document(path):
+            calls.append(path)
+            await asyncio.sleep(0.01)
+            return {"diagnostics": []}
+
+        mock_client = MagicMock()
+        mock_client.validate_document = validate_document
+
+        async def burst():
+            tool = _inner(_srv.terraform_validate_lsp)
+            return await asyncio.gather(*(tool(file_path="main.tf") for _ in range(5)))
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            with patch.object(_srv, "terraform_lsp_client") as mock_lsp_mod:
+                mock_lsp_mod.get_lsp_client = AsyncMock(return_value=mock_client)
+                results = run(burst())
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert calls == [str(tf_file)]
+        assert all(r["terraform-ls-validation"]["diagnostics"] == [] for r in results)
+        assert _srv._LSP_INFLIGHT == {}
+
+    def test_path_spellings_of_one_file_share_a_call(self, tmp_path):
+        """Coalescing is keyed on the resolved file URI, not the raw argument."""
+        (tmp_path / "sub").mkdir()
+        (tmp_path / "main.tf").write_text("terraform {}")
+        calls = []
+
+        async def validate_document(path):
+            calls.append(path)
+            await asyncio.sleep(0.01)
+            return {"diagnostics": []}
+
+        mock_client = MagicMock()
+        mock_client.validate_document = validate_document
+
+        async def burst():
+            tool = _inner(_srv.terraform_validate_lsp)
+            return await asyncio.gather(
+                tool(file_path="main.tf"), tool(file_path="sub/../main.tf")
+            )
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            with patch.object(_srv, "terraform_lsp_client") as mock_lsp_mod:
+                mock_lsp_mod.get_lsp_client = AsyncMock(return_value=mock_client)
+                run(burst())
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert len(calls) == 1
+
+    def test_debounce_window_folds_staggered_calls(self, tmp_path, monkeypatch):
+        """With a debounce set, a call arriving inside the window joins the first."""
+        (tmp_path / "main.tf").write_text("terraform {}")
+        monkeypatch.setitem(_srv._coalesce_lsp.__globals__, "_LSP_DEBOUNCE_SECONDS", 0.05)
+        calls = []
+
+        async def validate_document(path):
+            calls.append(path)
+            return {"diagnostics": []}
+
+        mock_client = MagicMock()
+        mock_client.validate_document = validate_document
+
+        async def staggered():
+            tool = _inner(_srv.terraform_validate_lsp)
+            first = asyncio.ensure_future(tool(file_path="main.tf"))
+            await asyncio.sleep(0.01)
+            second = await tool(file_path="main.tf")
+            return await first, second
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            with patch.object(_srv, "terraform_lsp_client") as mock_lsp_mod:
+                mock_lsp_mod.get_lsp_client = AsyncMock(return_value=mock_client)
+                first, second = run(staggered())
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert len(calls) == 1
+        assert first["terraform-ls-validation"] == second["terraform-ls-validation"]
+
+
 class TestTerraformHover:
     """Tests for terraform_hover()."""
 
@@ -865,6 +1191,247 @@ class TestTerryAnalyze:
         assert analysis["score"] == 100
         assert analysis["issues"] == []
 
+    def test_untagged_multiline_resource_flagged(self, tmp_path):
+        """Only the untagged taggable resource is reported, across line breaks."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_text(
+            'resource "aws_instance" "web" {\n  ami = var.ami\n}\n'
+            'resource "aws_vpc" "main" {\n  cidr_block = "10.0.0.0/16"\n  tags = {}\n}\n'
+        )
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_analyze)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        tag_issues = [
+            i["message"] for i in result["analysis"]["issues"] if "lacks tags" in i["message"]
+        ]
+        assert tag_issues == ["Resource type 'aws_instance' lacks tags"]
+
+    def test_multiple_files_are_all_analyzed(self, tmp_path, monkeypatch):
+        """Every .tf file is read and counted; oversized ones are skipped."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        for i in range(4):
+            (proj / f"f{i}.tf").write_text(f'variable "v{i}" {{\n  description = "x"\n}}\n')
+        (proj / "big.tf").write_text('variable "big" {\n  description = "x"\n}\n' * 50)
+        monkeypatch.setitem(_srv.terry_analyze.__globals__, "_MAX_TF_FILE_SIZE", 1000)
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_analyze)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert result["analysis"]["statistics"]["variables"] == 4
+
+    def test_tf_named_directory_and_file_path_ignored(self, tmp_path):
+        """A directory named *.tf is not read, and a file path analyzes as empty."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "modules.tf").mkdir()
+        (proj / "main.tf").write_text('variable "a" {\n  description = "x"\n}\n')
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_analyze)(path="proj")
+            file_result = _inner(_srv.terry_analyze)(path="proj/main.tf")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert result["analysis"]["statistics"]["variables"] == 1
+        assert file_result["analysis"]["statistics"]["variables"] == 0
+
+    def test_file_reads_shared_across_analysis_tools(self, tmp_path, monkeypatch):
+        """Back-to-back analysis tools reuse one read until a file changes."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        tf = proj / "main.tf"
+        tf.write_text('variable "a" {\n  description = "x"\n}\n')
+        reads = []
+        real_read_bytes = _srv.Path.read_bytes
+
+        def counting_read_bytes(self):
+            reads.append(self.name)
+            return real_read_bytes(self)
+
+        monkeypatch.setattr(_srv.Path, "read_bytes", counting_read_bytes)
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            _inner(_srv.terry_analyze)(path="proj")
+            _inner(_srv.terry_security_scan)(path="proj")
+            _inner(_srv.terry_recommendations)(path="proj")
+            assert reads == ["main.tf"]
+
+            tf.write_text('variable "a" {}\nvariable "b" {}\n')
+            result = _inner(_srv.terry_analyze)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert reads == ["main.tf", "main.tf"]
+        assert result["analysis"]["statistics"]["variables"] == 2
+
+    def test_read_cache_bounded_by_bytes(self, tmp_path, monkeypatch):
+        """The read cache evicts by total size and skips over-budget directories."""
+        g = _srv.terry_analyze.__globals__
+        monkeypatch.setitem(g, "_tf_read_cache", _srv.OrderedDict())
+        monkeypatch.setitem(g, "_tf_read_cache_bytes", 0)
+        monkeypatch.setitem(g, "_TF_READ_CACHE_MAX_BYTES", 100)
+        dirs = {}
+        for name, size in (("a", 60), ("b", 60), ("huge", 150)):
+            d = tmp_path / name
+            d.mkdir()
+            (d / "main.tf").write_bytes(b"#" * size)
+            dirs[name] = str(d)
+
+        _srv._read_tf_files(dirs["a"])
+        _srv._read_tf_files(dirs["b"])
+        assert list(g["_tf_read_cache"]) == [dirs["b"]]
+        assert g["_tf_read_cache_bytes"] == 60
+
+        contents = _srv._read_tf_files(dirs["huge"])
+        assert len(contents[0][1]) == 150
+        assert dirs["huge"] not in g["_tf_read_cache"]
+        assert g["_tf_read_cache_bytes"] == 60
+
+    def test_directory_reads_use_shared_pool(self, tmp_path):
+        """Multi-file reads run on the module's reader pool, not a new pool."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        for i in range(3):
+            (proj / f"f{i}.tf").write_text(f"# {i}\n")
+
+        with patch.object(_srv, "ThreadPoolExecutor") as new_pool, \
+                patch.object(_srv._TF_READ_EXECUTOR, "map", wraps=_srv._TF_READ_EXECUTOR.map) as shared_map:
+            contents = _srv._read_tf_files(str(proj))
+
+        new_pool.assert_not_called()
+        shared_map.assert_called_once()
+        assert len(contents) == 3
+
+    def test_headers_after_nested_variable_block_are_counted(self, tmp_path):
+        """A variable body with nested braces does not hide the headers after it."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_text(
+            'variable "cfg" {\n  validation {\n    condition = true\n  }\n'
+            '  default = {}\n}\n'
+            'resource "aws_s3_bucket" "b" {\n  tags = {}\n}\n'
+            'output "id" {\n  value = aws_s3_bucket.b.id\n}\n'
+            '# variable "old" {\n'
+            'module "net" {\n  source = "./net"\n}\n'
+        )
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_analyze)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        stats = result["analysis"]["statistics"]
+        assert stats["variables"] == 2
+        assert stats["resources"] == 1
+        assert stats["outputs"] == 1
+        assert stats["modules"] == 1
+        docs = [i["message"] for i in result["analysis"]["issues"] if i["type"] == "documentation"]
+        assert docs == ["Variable 'cfg' lacks description", "Variable 'old' lacks description"]
+
+    def test_statistics_count_each_block_kind(self, tmp_path):
+        """Every block kind is counted; providers are de-duplicated per file."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_text(
+            'provider "aws" {}\nprovider "aws" {\n  alias = "east"\n}\n'
+            'resource "aws_vpc" "main" {\n  tags = {}\n}\n'
+            'data "aws_ami" "ubuntu" {}\n'
+            'module "net" {\n  source = "./net"\n}\n'
+            'variable "empty" {}\n'
+            'variable "region" {\n  description = "Region"\n}\n'
+            'output "vpc_id" {\n  value = aws_vpc.main.id\n}\n'
+        )
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_analyze)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert result["analysis"]["statistics"] == {
+            "resources": 1,
+            "data_sources": 1,
+            "modules": 1,
+            "providers": 1,
+            "variables": 2,
+            "outputs": 1,
+        }
+        assert result["analysis"]["issues"] == []
+
+    def test_non_utf8_file_is_still_analyzed(self, tmp_path):
+        """Files are scanned as bytes, so a stray non-UTF-8 byte is not fatal."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_bytes(b'# caf\xe9\nvariable "region" {\n  type = string\n}\n')
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_analyze)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert result["analysis"]["statistics"]["variables"] == 1
+        messages = [i["message"] for i in result["analysis"]["issues"]]
+        assert messages == ["Variable 'region' lacks description"]
+
+    def test_issue_list_capped_but_all_files_counted(self, tmp_path, monkeypatch):
+        """The issue list stops at the cap; statistics and score cover every file."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        for i in range(3):
+            (proj / f"f{i}.tf").write_text(f'variable "v{i}a" {{ type = string }}\nvariable "v{i}b" {{ type = string }}\n')
+        monkeypatch.setitem(_srv.terry_analyze.__globals__, "_MAX_ANALYSIS_ISSUES", 2)
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_analyze)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        analysis = result["analysis"]
+        assert analysis["truncated"] is True
+        assert len(analysis["issues"]) == 2
+        assert all("lacks description" in i["message"] for i in analysis["issues"])
+        assert analysis["statistics"]["variables"] == 6
+        assert analysis["score"] == 100 - 6 * 2
+
+    def test_not_truncated_at_exactly_max_issues(self, tmp_path, monkeypatch):
+        """Reaching the cap exactly keeps every issue and sets no flag."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_text('variable "a" { type = string }\nvariable "b" { type = string }\n')
+        monkeypatch.setitem(_srv.terry_analyze.__globals__, "_MAX_ANALYSIS_ISSUES", 2)
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_analyze)(path="proj")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert "truncated" not in result["analysis"]
+        assert len(result["analysis"]["issues"]) == 2
+
     def test_variable_without_description_reduces_score(self, tmp_path):
         """A variable without a description field adds a warning and reduces score."""
         proj = tmp_path / "proj"
@@ -987,6 +1554,35 @@ class TestTerrySecurityScan:
         assert "error" in result
         assert "Invalid severity" in result["error"]
 
+    def test_rules_below_min_severity_are_not_evaluated(self, tmp_path):
+        """Rules filtered out by severity never run; critical skips reading files."""
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        (proj / "main.tf").write_text(
+            'resource "aws_s3_bucket" "b" {\n  acl = "public-read"\n}\n'
+        )
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            high = _inner(_srv.terry_security_scan)(path="proj", severity="high")
+            with patch.object(_srv, "_read_tf_files") as read_tf_files:
+                critical = _inner(_srv.terry_security_scan)(path="proj", severity="critical")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        assert [v["id"] for v in high["security_scan"]["vulnerabilities"]] == ["CKV_AWS_20"]
+        assert critical["security_scan"]["vulnerabilities"] == []
+        read_tf_files.assert_not_called()
+
+    def test_block_regex_skipped_without_marker(self):
+        """_scan_blocks never runs the regex when its resource type is absent."""
+        pattern = MagicMock()
+        assert list(_srv._scan_blocks(pattern, b'"aws_s3_bucket"', b'resource "aws_vpc" "x" {}')) == []
+        pattern.finditer.assert_not_called()
+
+        _srv._scan_blocks(pattern, b'"aws_s3_bucket"', b'resource "aws_s3_bucket" "b" {}')
+        pattern.finditer.assert_called_once()
+
     def test_public_s3_acl_detected(self, tmp_path):
         """Public S3 ACL triggers CKV_AWS_20 vulnerability (severity=high)."""
         tf = '''
@@ -1242,6 +1838,12 @@ class TestTerryRecommendations:
 class TestTerryVersion:
     """Tests for terry_version()."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_probe_cache(self):
+        _srv._terraform_version_info.cache_clear()
+        yield
+        _srv._terraform_version_info.cache_clear()
+
     def test_json_output_parsed_correctly(self):
         """When 'terraform version -json' succeeds, version info is returned."""
         mock_result = MagicMock()
@@ -1264,17 +1866,14 @@ class TestTerryVersion:
         plain_version.returncode = 0
         plain_version.stdout = "Terraform v1.11.0\n"
 
-        uname = MagicMock()
-        uname.returncode = 0
-        uname.stdout = "x86_64\n"
-
         with patch(
             "server_enhanced_with_lsp.subprocess.run",
-            side_effect=[json_fail, plain_version, uname],
-        ):
+            side_effect=[json_fail, plain_version],
+        ), patch("server_enhanced_with_lsp.platform.machine", return_value="x86_64"):
             result = _inner(_srv.terry_version)()
 
         assert "1.11.0" in result["terraform_version"]
+        assert result["platform"] == "linux_x86_64"
 
     def test_terraform_not_found_returns_error(self):
         """FileNotFoundError (terraform binary missing) returns an error dict."""
@@ -1298,6 +1897,63 @@ class TestTerryVersion:
 
         assert "error" in result
 
+    def test_json_probe_parsed_from_raw_bytes(self):
+        """The -json probe isn't text-decoded; its bytes go straight to json.loads."""
+        mock_result = MagicMock(
+            returncode=0,
+            stdout=b'{"terraform_version": "1.12.0", "provider_selections": {"aws": "5.0"}}',
+        )
+
+        with patch(
+            "server_enhanced_with_lsp.subprocess.run", return_value=mock_result
+        ) as mock_run:
+            result = _inner(_srv.terry_version)()
+
+        assert "text" not in mock_run.call_args.kwargs
+        assert result["terraform_version"] == "1.12.0"
+        assert result["provider_selections"] == {"aws": "5.0"}
+
+    def test_successful_probe_cached_and_copied(self):
+        """A successful probe is reused; callers get their own copy."""
+        mock_result = MagicMock(returncode=0, stdout='{"terraform_version": "1.12.0"}')
+
+        with patch(
+            "server_enhanced_with_lsp.subprocess.run", return_value=mock_result
+        ) as mock_run:
+            first = _inner(_srv.terry_version)()
+            first["_auth"] = {"user": "x"}
+            second = _inner(_srv.terry_version)()
+
+        assert mock_run.call_count == 1
+        assert second["terraform_version"] == "1.12.0"
+        assert "_auth" not in second
+
+    def test_failed_probe_not_cached(self):
+        """After terraform is missing, the next call probes again."""
+        ok = MagicMock(returncode=0, stdout='{"terraform_version": "1.12.0"}')
+
+        with patch(
+            "server_enhanced_with_lsp.subprocess.run",
+            side_effect=[FileNotFoundError("not found"), ok],
+        ):
+            assert "error" in _inner(_srv.terry_version)()
+            assert _inner(_srv.terry_version)()["terraform_version"] == "1.12.0"
+
+    def test_cache_expires_after_ttl(self):
+        """Entries older than _PROBE_CACHE_TTL are re-probed."""
+        mock_result = MagicMock(returncode=0, stdout='{"terraform_version": "1.12.0"}')
+
+        with patch(
+            "server_enhanced_with_lsp.subprocess.run", return_value=mock_result
+        ) as mock_run, patch(
+            "server_enhanced_with_lsp.time.monotonic",
+            side_effect=[0.0, _srv._PROBE_CACHE_TTL + 1],
+        ):
+            _inner(_srv.terry_version)()
+            _inner(_srv.terry_version)()
+
+        assert mock_run.call_count == 2
+
 
 # ---------------------------------------------------------------------------
 # 14. terry_environment_check()
@@ -1307,48 +1963,83 @@ class TestTerryVersion:
 class TestTerryEnvironmentCheck:
     """Tests for terry_environment_check()."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_probe_cache(self):
+        _srv._environment_tool_probes.cache_clear()
+        yield
+        _srv._environment_tool_probes.cache_clear()
+
     def test_terraform_found_reported_as_available(self):
-        """When 'which terraform' succeeds, terraform is reported available."""
-        which_tf = MagicMock(returncode=0, stdout="/usr/local/bin/terraform\n")
+        """When terraform is on PATH, terraform is reported available."""
+        found = {
+            "terraform": "/usr/local/bin/terraform",
+            "terraform-ls": "/usr/local/bin/terraform-ls",
+        }
         version_tf = MagicMock(returncode=0, stdout="Terraform v1.12.0\n")
-        which_ls = MagicMock(returncode=0, stdout="/usr/local/bin/terraform-ls\n")
         version_ls = MagicMock(returncode=0, stdout="0.38.5\n")
-        hostname = MagicMock(returncode=0, stdout="myhost\n")
 
         with patch(
+            "server_enhanced_with_lsp.shutil.which", side_effect=found.get
+        ), patch(
             "server_enhanced_with_lsp.subprocess.run",
-            side_effect=[which_tf, version_tf, which_ls, version_ls, hostname],
+            side_effect=_run_by_command({
+                ("terraform", "version"): version_tf,
+                ("terraform-ls", "version"): version_ls,
+            }),
         ):
             result = _inner(_srv.terry_environment_check)()
 
         env = result["terry-environment"]
         assert env["terraform"]["available"] is True
+        assert env["terraform"]["path"] == "/usr/local/bin/terraform"
+        assert env["terraform"]["version"] == "Terraform v1.12.0"
+        assert env["terraform_ls"]["path"] == "/usr/local/bin/terraform-ls"
+        assert env["terraform_ls"]["version"] == "0.38.5"
 
-    def test_terraform_not_found_reported_as_unavailable(self):
-        """When 'which terraform' fails, terraform is reported unavailable."""
-        which_tf = MagicMock(returncode=1, stdout="")
-        which_ls = MagicMock(returncode=1, stdout="")
-        hostname = MagicMock(returncode=0, stdout="myhost\n")
+    def test_refresh_reruns_cached_probes(self):
+        """refresh=True bypasses the cached binary probes."""
+        with patch(
+            "server_enhanced_with_lsp.shutil.which", return_value=None
+        ) as mock_which:
+            _inner(_srv.terry_environment_check)()
+            _inner(_srv.terry_environment_check)()
+            assert mock_which.call_count == 2  # terraform + terraform-ls, once
+            _inner(_srv.terry_environment_check)(refresh=True)
+            assert mock_which.call_count == 4
+
+    def test_binary_probes_run_concurrently(self):
+        """Both version probes are in flight at the same time."""
+        both_started = threading.Barrier(2, timeout=5)
+        failed = MagicMock(returncode=1, stdout="")
+
+        def fake_run(cmd, *args, **kwargs):
+            both_started.wait()
+            return failed
 
         with patch(
-            "server_enhanced_with_lsp.subprocess.run",
-            side_effect=[which_tf, which_ls, hostname],
-        ):
+            "server_enhanced_with_lsp.shutil.which", side_effect=lambda b: f"/bin/{b}"
+        ), patch("server_enhanced_with_lsp.subprocess.run", side_effect=fake_run):
             result = _inner(_srv.terry_environment_check)()
 
         env = result["terry-environment"]
-        assert env["terraform"]["available"] is False
+        assert env["terraform"]["version"] == "version check failed"
+        assert env["terraform_ls"]["version"] == "version check failed"
+
+    def test_terraform_not_found_reported_as_unavailable(self):
+        """When terraform is not on PATH, terraform is reported unavailable."""
+        with patch(
+            "server_enhanced_with_lsp.shutil.which", return_value=None
+        ), patch("server_enhanced_with_lsp.subprocess.run") as mock_run:
+            result = _inner(_srv.terry_environment_check)()
+
+        env = result["terry-environment"]
+        assert env["terraform"] == {"available": False, "error": "terraform not found"}
+        assert env["terraform_ls"]["error"] == "terraform-ls not found"
+        mock_run.assert_not_called()
 
     def test_environment_keys_present(self):
         """Result always contains environment, terraform, terraform_ls, container."""
-        which_tf = MagicMock(returncode=1, stdout="")
-        which_ls = MagicMock(returncode=1, stdout="")
-        hostname = MagicMock(returncode=0, stdout="h\n")
-
-        with patch(
-            "server_enhanced_with_lsp.subprocess.run",
-            side_effect=[which_tf, which_ls, hostname],
-        ):
+        with patch("server_enhanced_with_lsp.shutil.which", return_value=None):
             result = _inner(_srv.terry_environment_check)()
 
         env = result["terry-environment"]
@@ -1356,6 +2047,20 @@ class TestTerryEnvironmentCheck:
         assert "terraform" in env
         assert "terraform_ls" in env
 
+    def test_probes_reused_within_ttl(self):
+        """Repeated checks reuse the probes; common_paths isn't cached in."""
+        with patch(
+            "server_enhanced_with_lsp.shutil.which", return_value=None
+        ) as mock_which, patch(
+            "server_enhanced_with_lsp.socket.gethostname", return_value="h"
+        ):
+            _inner(_srv.terry_environment_check)()
+            result = _inner(_srv.terry_environment_check)()
+
+        assert mock_which.call_count == 2
+        assert result["terry-environment"]["container"]["hostname"] == "h"
+        assert "common_paths" not in _srv._environment_tool_probes()["terraform_ls"]
+
 
 # ---------------------------------------------------------------------------
 # 15. terry_lsp_init()
@@ -1451,6 +2156,50 @@ class TestTerryLspInit:
 class TestTerryLspDebug:
     """Tests for terry_lsp_debug()."""
 
+    @pytest.fixture(autouse=True)
+    def _clear_probe_cache(self):
+        _srv._lsp_binary_probe.cache_clear()
+        _srv._lsp_help_probe.cache_clear()
+        yield
+        _srv._lsp_binary_probe.cache_clear()
+        _srv._lsp_help_probe.cache_clear()
+
+    def test_probes_cached_until_refresh(self):
+        """Repeat calls reuse the version probe; refresh=True re-runs it."""
+        version_result = MagicMock(returncode=0, stdout="0.38.5\n")
+
+        with patch.object(_srv, "terraform_lsp_client") as mock_lsp_mod:
+            mock_lsp_mod._lsp_client = None
+            with patch(
+                "server_enhanced_with_lsp.subprocess.run", return_value=version_result
+            ) as mock_run:
+                _inner(_srv.terry_lsp_debug)()
+                _inner(_srv.terry_lsp_debug)()
+                assert mock_run.call_count == 1
+                _inner(_srv.terry_lsp_debug)(refresh=True)
+                assert mock_run.call_count == 2
+
+    def test_probes_run_on_shared_probe_pool(self):
+        """Probes go to the module's probe pool; no pool is created per call."""
+        threads = []
+
+        def fake_run(cmd, *args, **kwargs):
+            threads.append(threading.current_thread().name)
+            return MagicMock(returncode=0, stdout="0.38.5\n")
+
+        with patch.object(_srv, "terraform_lsp_client") as mock_lsp_mod, \
+                patch.object(_srv, "ThreadPoolExecutor") as new_pool, \
+                patch("server_enhanced_with_lsp.subprocess.run", side_effect=fake_run):
+            mock_lsp_mod._lsp_client = None
+            _inner(_srv.terry_lsp_debug)(include_help=True)
+            _srv._environment_tool_probes.cache_clear()
+            _inner(_srv.terry_environment_check)()
+        _srv._environment_tool_probes.cache_clear()
+
+        new_pool.assert_not_called()
+        assert threads
+        assert all(name.startswith("terry-probe") for name in threads)
+
     def test_no_active_client_lsp_client_exists_false(self):
         """When _lsp_client is None, lsp_client.exists is False."""
         version_result = MagicMock(returncode=0, stdout="0.38.5\n")
@@ -1460,12 +2209,17 @@ class TestTerryLspDebug:
             mock_lsp_mod._lsp_client = None
             with patch(
                 "server_enhanced_with_lsp.subprocess.run",
-                side_effect=[version_result, help_result],
+                side_effect=_run_by_command({
+                    ("terraform-ls", "version"): version_result,
+                    ("terraform-ls", "serve"): help_result,
+                }),
             ):
-                result = _inner(_srv.terry_lsp_debug)()
+                result = _inner(_srv.terry_lsp_debug)(include_help=True)
 
         debug = result["terry-lsp-debug"]
         assert debug["lsp_client"]["exists"] is False
+        assert debug["terraform_ls_binary"]["version"] == "0.38.5"
+        assert debug["terraform_ls_help"]["output"] == "Usage: terraform-ls serve"
 
     def test_active_client_lsp_client_exists_true(self):
         """When _lsp_client exists, lsp_client.exists is True."""
@@ -1481,7 +2235,10 @@ class TestTerryLspDebug:
             mock_lsp_mod._lsp_client = mock_client
             with patch(
                 "server_enhanced_with_lsp.subprocess.run",
-                side_effect=[version_result, help_result],
+                side_effect=_run_by_command({
+                    ("terraform-ls", "version"): version_result,
+                    ("terraform-ls", "serve"): help_result,
+                }),
             ):
                 result = _inner(_srv.terry_lsp_debug)()
 
@@ -1503,6 +2260,21 @@ class TestTerryLspDebug:
         assert debug["terraform_ls_binary"]["available"] is False
         assert "binary not found" in debug["terraform_ls_binary"]["error"]
 
+    def test_help_probe_skipped_by_default(self):
+        """Without include_help only 'terraform-ls version' is run."""
+        version_result = MagicMock(returncode=0, stdout="0.38.5\n")
+
+        with patch.object(_srv, "terraform_lsp_client") as mock_lsp_mod:
+            mock_lsp_mod._lsp_client = None
+            with patch(
+                "server_enhanced_with_lsp.subprocess.run", return_value=version_result
+            ) as mock_run:
+                result = _inner(_srv.terry_lsp_debug)()
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == ["terraform-ls", "version"]
+        assert result["terry-lsp-debug"]["terraform_ls_help"] == {"skipped": True}
+
 
 # ---------------------------------------------------------------------------
 # 17. terry_file_check()
@@ -1580,6 +2352,71 @@ class TestTerryFileCheck:
 
         assert result["terry-file-check"]["syntax_check"]["has_resource_block"] is True
 
+    def test_line_count_and_whitespace_only_file(self, tmp_path):
+        """Lines are counted like str.split('\\n'); whitespace-only has no content."""
+        (tmp_path / "blank.tf").write_text("  \n\t\n")
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_file_check)(file_path="blank.tf")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        check = result["terry-file-check"]["syntax_check"]
+        assert check["line_count"] == 3
+        assert check["has_content"] is False
+
+    def test_non_utf8_file_still_checked(self, tmp_path):
+        """Stray non-UTF-8 bytes no longer make the file unreadable."""
+        (tmp_path / "main.tf").write_bytes(b'# \xff\ndata "aws_ami" "x" {}\n')
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_file_check)(file_path="main.tf")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        fc = result["terry-file-check"]
+        assert fc["readable"] is True
+        assert fc["syntax_check"]["has_data_block"] is True
+
+    def test_oversized_file_is_not_read(self, tmp_path, monkeypatch):
+        """Files over the size cap report their size but are not read."""
+        (tmp_path / "big.tf").write_text('resource "a" "b" {}\n' * 10)
+        monkeypatch.setitem(_srv.terry_file_check.__globals__, "_MAX_TF_FILE_SIZE", 16)
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            with patch("builtins.open", side_effect=AssertionError("read")):
+                result = _inner(_srv.terry_file_check)(file_path="big.tf")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        fc = result["terry-file-check"]
+        assert fc["is_file"] is True
+        assert fc["readable"] is False
+        assert fc["size"] == 200
+        assert "limit" in fc["syntax_check"]["error"]
+
+    def test_directory_is_not_a_file(self, tmp_path):
+        """A directory exists but is not checked as a file."""
+        (tmp_path / "mod.tf").mkdir()
+
+        original_root = _srv.WORKSPACE_ROOT
+        _srv.WORKSPACE_ROOT = str(tmp_path)
+        try:
+            result = _inner(_srv.terry_file_check)(file_path="mod.tf")
+        finally:
+            _srv.WORKSPACE_ROOT = original_root
+
+        fc = result["terry-file-check"]
+        assert fc["exists"] is True
+        assert fc["is_file"] is False
+        assert fc["size"] == 0
+
     def test_size_reflects_file_content(self, tmp_path):
         """Size in result matches the byte length of the file content."""
         content = "terraform {}"
@@ -1630,6 +2467,18 @@ class TestHealthReady:
         assert result["status"] == "ok"
         assert result["terraform"] == "available"
 
+    def test_probe_output_discarded(self):
+        """Only the exit code is used, so no output pipes are opened."""
+        mock_result = MagicMock(returncode=0)
+        with patch(
+            "server_enhanced_with_lsp.subprocess.run", return_value=mock_result
+        ) as mock_run:
+            _srv.health_ready()
+
+        kwargs = mock_run.call_args.kwargs
+        assert kwargs["stdout"] is _srv.subprocess.DEVNULL
+        assert kwargs["stderr"] is _srv.subprocess.DEVNULL
+
     def test_terraform_not_found_returns_not_ready(self):
         """FileNotFoundError means terraform is missing -> not_ready."""
         with patch(
@@ -1876,3 +2725,78 @@ class TestGithubTools:
             )
 
         assert "error" in result
+
+
+def _reimport_server(gh_auth_module):
+    """Import a fresh copy of the server module against this file's stubs.
+
+    ``gh_auth_module`` is installed as github_app_auth; ``None`` makes any
+    attempt to import it fail. sys.modules is restored afterwards.
+    """
+    import importlib
+
+    names = (*_STUBBED_NAMES, "server_enhanced_with_lsp")
+    saved = {name: sys.modules.get(name) for name in names}
+    sys.modules.update({
+        "fastmcp": _fake_fastmcp_mod,
+        "terraform_lsp_client": _lsp_stub,
+        "terry-form-mcp": _terry_stub,
+        "mcp_request_validator": _validator_stub,
+        "github_app_auth": gh_auth_module,
+        "github_repo_handler": _gh_handler_stub,
+    })
+    sys.modules.pop("server_enhanced_with_lsp", None)
+    try:
+        return importlib.import_module("server_enhanced_with_lsp")
+    finally:
+        for name, orig in saved.items():
+            if orig is None:
+                sys.modules.pop(name, None)
+            else:
+                sys.modules[name] = orig
+
+
+class TestGithubIntegrationGating:
+    """GitHub modules load only when GITHUB_APP_ID is set."""
+
+    def test_unset_app_id_skips_github_imports(self, monkeypatch, caplog):
+        """Without GITHUB_APP_ID the modules are never imported."""
+        monkeypatch.delenv("GITHUB_APP_ID", raising=False)
+        with caplog.at_level("INFO"):
+            srv = _reimport_server(gh_auth_module=None)
+
+        # A blocked import would have been attempted and logged as a failure
+        assert not any("Failed to load GitHub" in r.getMessage() for r in caplog.records)
+        assert any("GITHUB_APP_ID not set" in r.getMessage() for r in caplog.records)
+        assert srv.github_handler is None
+        assert srv.github_auth is None
+        assert "GitHubAppConfig" not in vars(srv)
+        result = run(_inner(srv.github_clone_repo)(owner="acme", repo="infra"))
+        assert result == {
+            "error": "GitHub integration not configured. Set GITHUB_APP_ID and GITHUB_APP_PRIVATE_KEY"
+        }
+
+    def test_from_env_failure_logs_reason(self, monkeypatch, caplog):
+        """A bad GitHub config logs a warning with the reason and disables the tools."""
+        monkeypatch.setenv("GITHUB_APP_ID", "12345")
+        auth_mod = types.ModuleType("github_app_auth")
+
+        class _BrokenConfig:
+            @classmethod
+            def from_env(cls):
+                raise ValueError("GITHUB_APP_PRIVATE_KEY not set")
+
+        auth_mod.GitHubAppConfig = _BrokenConfig
+        auth_mod.GitHubAppAuth = _StubGitHubAppAuth
+
+        with caplog.at_level("WARNING"):
+            srv = _reimport_server(gh_auth_module=auth_mod)
+
+        assert srv.github_handler is None
+        warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+        assert any(
+            "GitHub integration disabled" in m and "GITHUB_APP_PRIVATE_KEY not set" in m
+            for m in warnings
+        )
+        result = run(_inner(srv.github_list_terraform_files)(owner="acme", repo="infra"))
+        assert "not configured" in result["error"]